@@ -0,0 +1,23 @@
+"""AI Job Recommender core: everything the Streamlit app needs that isn't UI
+
+None of these modules import Streamlit, so the engine can be used from the
+HTTP API, the CLI, worker processes and benchmarks:
+
+    catalog          catalog sources, Catalog and the shared process copy
+    records          compact Job records and the AIImpact enum
+    matching         inverted skill index and ranking
+    normalizer       alias/fuzzy skill resolution
+    autocomplete     popularity-ranked skill completions
+    careers          career-path role graph: next roles, shortest paths
+    salaries         salary aggregates and midpoint range filters
+    gaps             skill-gap analysis over job x skill bitmaps
+    certificates     certificate bitsets and the fewest-certificates planner
+    bitsets          int bitset helpers shared by gaps and certificates
+    search           BM25 free-text job search
+    extraction       skills mentioned in CVs and pasted text
+    mining           offline skill-map builder over a postings corpus
+    service          Recommender, the calls main.py and server.py make
+    rendering        HTML job cards from the card template
+    export           export rows and download formats
+    instrumentation  per-stage timing spans and counters
+"""
@@ -0,0 +1,107 @@
+"""Skill autocomplete over the live catalog vocabulary
+
+Every skill name and alias is kept in one sorted array, so the names
+starting with a prefix are a contiguous bisect range. Completions are the
+canonical skills in that range ranked by popularity (how many jobs list
+the skill). Prefixes whose range holds more than RANK_SCAN_MAX names (the
+nodes of a prefix trie with many descendants) get their top-N list
+precomputed; smaller ranges are ranked on the fly, so a lookup never
+scans more than RANK_SCAN_MAX names.
+"""
+import heapq
+from array import array
+from bisect import bisect_left
+from functools import cached_property
+
+from .matching import normalize_skill, parse_skills
+
+DEFAULT_LIMIT = 8
+RANK_SCAN_MAX = 64
+PRECOMPUTED_LIMIT = 32
+
+
+class SkillCompleter:
+    """Prefix completions of skill names/aliases, most popular first"""
+
+    def __init__(self, skills, popularity, aliases=None):
+        self.skills = list(skills)
+        self.popularity = array("l", popularity)
+        skill_ids = {skill: i for i, skill in enumerate(self.skills)}
+
+        names = {skill: i for i, skill in enumerate(self.skills)}
+        for alias, skill in (aliases or {}).items():
+            skill_id = skill_ids.get(normalize_skill(skill))
+            if skill_id is not None:
+                names.setdefault(normalize_skill(alias), skill_id)
+        ordered = sorted(names.items())
+        self.names = [name for name, _ in ordered]
+        self.name_skills = array("l", (skill_id for _, skill_id in ordered))
+
+        # Walk the implicit trie, storing top lists for prefixes with wide ranges
+        self._top = {}
+        stack = [""]
+        while stack:
+            prefix = stack.pop()
+            lo, hi = self.range(prefix)
+            if hi - lo <= RANK_SCAN_MAX:
+                continue
+            if prefix:
+                self._top[prefix] = self._rank(lo, hi, PRECOMPUTED_LIMIT)
+            depth = len(prefix)
+            stack.extend(prefix + c for c in {name[depth] for name in self.names[lo:hi] if len(name) > depth})
+
+    @classmethod
+    def from_index(cls, index, aliases=None):
+        return cls(index.skills, (len(ids) for ids, _ in index.postings), aliases)
+
+    @classmethod
+    def from_catalog(cls, catalog):
+        return cls.from_index(catalog.skill_index, catalog.skill_aliases)
+
+    def __len__(self):
+        return len(self.skills)
+
+    def range(self, prefix):
+        """(lo, hi) slice of self.names starting with prefix"""
+        lo = bisect_left(self.names, prefix)
+        hi = bisect_left(self.names, prefix + "\uffff", lo)
+        return lo, hi
+
+    def _rank(self, lo, hi, limit):
+        popularity = self.popularity
+        skill_ids = set(self.name_skills[lo:hi])
+        return heapq.nsmallest(limit, skill_ids, key=lambda s: (-popularity[s], self.skills[s]))
+
+    def complete(self, prefix, limit=DEFAULT_LIMIT, exclude=()):
+        """Up to limit canonical skills completing prefix, most popular first"""
+        prefix = normalize_skill(prefix)
+        if not prefix or limit <= 0:
+            return []
+        excluded = {normalize_skill(s) for s in exclude}
+        wanted = limit + len(excluded)
+        ranked = self._top.get(prefix)
+        if ranked is None or (wanted > PRECOMPUTED_LIMIT and len(ranked) == PRECOMPUTED_LIMIT):
+            ranked = self._rank(*self.range(prefix), wanted)
+        completions = []
+        for skill_id in ranked:
+            skill = self.skills[skill_id]
+            if skill not in excluded:
+                completions.append(skill)
+                if len(completions) == limit:
+                    break
+        return completions
+
+    def complete_text(self, text, limit=DEFAULT_LIMIT):
+        """Completions for the last comma-separated token, skipping skills already entered"""
+        if not text or text.rstrip().endswith(","):
+            return []
+        head, _, last = text.rpartition(",")
+        return self.complete(last, limit, exclude=[skill for _, skill in parse_skills(head)])
+
+    @cached_property
+    def popularity_order(self):
+        return sorted(range(len(self.skills)), key=lambda s: (-self.popularity[s], self.skills[s]))
+
+    def popular(self, limit=None):
+        """[(skill, job count)] for the whole vocabulary, most popular first"""
+        return [(self.skills[s], self.popularity[s]) for s in self.popularity_order[:limit]]
@@ -0,0 +1,173 @@
+"""Vectorized batch recommendations for whole cohorts of skill profiles
+
+Profiles and the skill index are encoded as sparse matrices, so all
+profile x job scores come out of one sparse matrix multiply:
+
+    scores  = profiles (n x skills, binary) @ weights (skills x jobs, IDF)
+    matched = profiles @ postings (skills x jobs, binary)
+
+Ranking matches SkillIndex.rank: score, then matched skills, salary
+midpoint and AI-impact safety, then catalog order.
+"""
+import numpy as np
+from scipy import sparse
+
+from .matching import normalize_skill
+
+DEFAULT_K = 10
+CHUNK_CELLS = 1 << 22          # dense cells scored at a time (~32 MB of float64)
+FULL_SORT_MAX_JOBS = 1024      # above this, rows are ranked from a top-k shortlist
+
+
+def skill_job_matrices(index):
+    """(IDF weights, binary postings) as CSR skills x jobs matrices, cached on the index"""
+    cached = getattr(index, "_batch_matrices", None)
+    if cached is not None:
+        return cached
+    lengths = np.fromiter((len(ids) for ids, _ in index.postings), dtype=np.int64,
+                          count=len(index.postings))
+    indptr = np.zeros(len(lengths) + 1, dtype=np.int64)
+    np.cumsum(lengths, out=indptr[1:])
+    indices = np.empty(indptr[-1], dtype=np.int32)
+    data = np.empty(indptr[-1], dtype=np.float64)
+    for skill_id, (ids, weights) in enumerate(index.postings):
+        start, end = indptr[skill_id], indptr[skill_id + 1]
+        indices[start:end] = np.frombuffer(ids, dtype=np.int32)
+        data[start:end] = np.frombuffer(weights, dtype=np.float64)
+    shape = (len(index.skills), len(index.jobs))
+    weights = sparse.csr_matrix((data, indices, indptr), shape=shape)
+    binary = sparse.csr_matrix((np.ones_like(data, dtype=np.int32), indices, indptr), shape=shape)
+    index._batch_matrices = (weights, binary)
+    return weights, binary
+
+
+def encode_profiles(profiles, index, normalizer=None):
+    """Encode profiles as a binary CSR profiles x skills matrix
+
+    Each profile is a comma-separated string or an iterable of skills.
+    Returns (matrix, unknown) where unknown[i] lists profile i's
+    unrecognized raw skills.
+    """
+    indptr = [0]
+    indices = []
+    unknown = []
+    skill_ids = index.skill_ids
+    for profile in profiles:
+        if isinstance(profile, str):
+            ids, missing, _ = index.resolve(profile, normalizer)
+        else:
+            ids, missing = [], []
+            for raw in profile:
+                skill = normalize_skill(raw)
+                if not skill:
+                    continue
+                skill_id = skill_ids.get(skill)
+                if skill_id is None and normalizer is not None:
+                    skill_id = skill_ids.get(normalizer.resolve(skill).skill)
+                if skill_id is None:
+                    missing.append(raw)
+                elif skill_id not in ids:
+                    ids.append(skill_id)
+        indices.extend(ids)
+        indptr.append(len(indices))
+        unknown.append(missing)
+    indices = np.asarray(indices, dtype=np.int32)
+    data = np.ones(len(indices), dtype=np.float64)
+    matrix = sparse.csr_matrix((data, indices, np.asarray(indptr, dtype=np.int64)),
+                               shape=(len(unknown), len(index.skills)))
+    return matrix, unknown
+
+
+class BatchResult:
+    """Top-k job ids/scores per profile as dense arrays (job id -1 = empty slot)"""
+
+    def __init__(self, index, profile_matrix, job_ids, scores, matched, unknown):
+        self.index = index
+        self.profile_matrix = profile_matrix
+        self.job_ids = job_ids
+        self.scores = scores
+        self.matched = matched
+        self.unknown = unknown
+
+    def __len__(self):
+        return len(self.job_ids)
+
+    def matches(self, row):
+        """Ranked Match tuples for one profile, as SkillIndex.rank would return"""
+        start, end = self.profile_matrix.indptr[row], self.profile_matrix.indptr[row + 1]
+        skill_ids = self.profile_matrix.indices[start:end].tolist()
+        return [
+            self.index._match(int(job_id), float(score), int(matched), skill_ids)
+            for job_id, score, matched in zip(self.job_ids[row], self.scores[row], self.matched[row])
+            if job_id >= 0
+        ]
+
+    def __iter__(self):
+        for row in range(len(self)):
+            yield self.matches(row)
+
+
+def recommend_batch(profiles, index, k=DEFAULT_K, normalizer=None):
+    """Top-k recommendations for every profile via sparse matrix products"""
+    weights, binary = skill_job_matrices(index)
+    profile_matrix, unknown = encode_profiles(profiles, index, normalizer)
+    n_profiles, n_jobs = profile_matrix.shape[0], weights.shape[1]
+    k = max(0, min(k, n_jobs))
+
+    job_ids = np.full((n_profiles, k), -1, dtype=np.int32)
+    top_scores = np.zeros((n_profiles, k), dtype=np.float64)
+    top_matched = np.zeros((n_profiles, k), dtype=np.int32)
+    if k == 0 or n_profiles == 0:
+        return BatchResult(index, profile_matrix, job_ids, top_scores, top_matched, unknown)
+
+    salary = np.asarray(index.salary_mid, dtype=np.int64)
+    ai_rank = np.asarray(index.ai_rank, dtype=np.int8)
+    order = np.arange(n_jobs, dtype=np.int64)
+
+    chunk = max(1, CHUNK_CELLS // max(1, n_jobs))
+    for start in range(0, n_profiles, chunk):
+        rows = profile_matrix[start:start + chunk]
+        scores = np.round((rows @ weights).toarray(), 9)
+        matched = (rows @ binary).toarray()
+        _top_k_chunk(scores, matched, salary, ai_rank, order, k,
+                     job_ids[start:start + chunk],
+                     top_scores[start:start + chunk],
+                     top_matched[start:start + chunk])
+    return BatchResult(index, profile_matrix, job_ids, top_scores, top_matched, unknown)
+
+
+def _top_k_chunk(scores, matched, salary, ai_rank, order, k, out_ids, out_scores, out_matched):
+    """Rank a dense chunk of rows and write the top k of each into the out arrays"""
+    n_rows, n_jobs = scores.shape
+    if n_jobs <= FULL_SORT_MAX_JOBS:
+        # np.lexsort: last key is primary; negate for descending order
+        keys = (
+            np.broadcast_to(order, scores.shape),
+            -np.broadcast_to(ai_rank, scores.shape),
+            -np.broadcast_to(salary, scores.shape),
+            -matched,
+            -scores,
+        )
+        ranked = np.lexsort(keys, axis=1)[:, :k]
+        _write_rows(np.arange(n_rows)[:, None], ranked, scores, matched, out_ids, out_scores, out_matched)
+        return
+
+    # Shortlist: everything scoring at least the row's k-th best score (keeps ties)
+    kth = np.partition(scores, n_jobs - k, axis=1)[:, n_jobs - k]
+    for row in range(n_rows):
+        cols = np.flatnonzero((scores[row] >= kth[row]) & (matched[row] > 0))
+        if not len(cols):
+            continue
+        ranked = cols[np.lexsort((cols, -ai_rank[cols], -salary[cols],
+                                  -matched[row, cols], -scores[row, cols]))][:k]
+        _write_rows(row, ranked[None, :], scores, matched,
+                    out_ids[row:row + 1, :len(ranked)],
+                    out_scores[row:row + 1, :len(ranked)],
+                    out_matched[row:row + 1, :len(ranked)])
+
+
+def _write_rows(rows, ranked, scores, matched, out_ids, out_scores, out_matched):
+    hit = matched[rows, ranked] > 0
+    out_ids[...] = np.where(hit, ranked, -1)
+    out_scores[...] = np.where(hit, scores[rows, ranked], 0.0)
+    out_matched[...] = np.where(hit, matched[rows, ranked], 0)
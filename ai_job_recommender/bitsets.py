@@ -0,0 +1,31 @@
+"""Python ints as bitsets: building them and walking their set bits
+
+The certificate planner and the skill-gap analysis keep sets of jobs and
+skills as ints, so union, intersection and difference are |, & and &~,
+and a set's size is int.bit_count().
+"""
+
+
+SHORT_BITSET = 16    # up to this many bits, plain ORs beat allocating a buffer
+
+
+def bitset(indices):
+    """Int with the given bits set, built in one pass (OR-ing bits into a big int is quadratic)"""
+    indices = list(indices)
+    if len(indices) <= SHORT_BITSET:
+        bits = 0
+        for i in indices:
+            bits |= 1 << i
+        return bits
+    buffer = bytearray(max(indices) // 8 + 1)
+    for i in indices:
+        buffer[i >> 3] |= 1 << (i & 7)
+    return int.from_bytes(buffer, "little")
+
+
+def iter_bits(bits):
+    """Indices of the set bits, lowest first"""
+    while bits:
+        low = bits & -bits
+        yield low.bit_length() - 1
+        bits ^= low
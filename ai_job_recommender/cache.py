@@ -0,0 +1,128 @@
+"""Bounded LRU/TTL cache for finished recommendation results
+
+Results are keyed on the canonical, order-independent skill set (plus the
+catalog version), so "python, sql" and "SQL,Python" share one entry. An
+entry holds everything a click needs: ranked matches, job cards and the
+lazy export. Cards and rows are built a page at a time and downloads
+serialized on request; both stay cached once produced, and are added to
+the entry's size as they are.
+"""
+import sys
+import threading
+import time
+from collections import OrderedDict, namedtuple
+
+DEFAULT_MAX_ENTRIES = 1024
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+DEFAULT_TTL = 60 * 60
+
+# gaps: GapAnalysis of the matched jobs (None without one)
+QueryResult = namedtuple("QueryResult", ["matches", "cards", "job_list", "export", "gaps"], defaults=(None,))
+
+
+def query_key(skill_ids, catalog_version=None):
+    """Order-independent cache key for a set of resolved skill ids"""
+    return (catalog_version, tuple(sorted(set(skill_ids))))
+
+
+def result_size(result):
+    """Approximate memory held by a QueryResult, in bytes (lazy parts: only what is built)"""
+    size = result.export.nbytes if result.export is not None else 0
+    cards, rows = result.cards, result.job_list
+    size += cards.nbytes if hasattr(cards, "nbytes") else sum(sys.getsizeof(html) for _, html in cards if html)
+    size += rows.nbytes if hasattr(rows, "nbytes") else 512 * len(rows)
+    size += 512 * len(result.matches)
+    return size
+
+
+class ResultCache:
+    """Thread-safe LRU cache with a TTL, an entry limit and a byte budget"""
+
+    def __init__(self, max_entries=DEFAULT_MAX_ENTRIES, max_bytes=DEFAULT_MAX_BYTES,
+                 ttl=DEFAULT_TTL, clock=time.monotonic):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.clock = clock
+        self._entries = OrderedDict()   # key -> (expires_at, size, value)
+        self._lock = threading.Lock()
+        self.bytes = 0
+        self.stats = {"hits": 0, "misses": 0, "evictions": 0, "expirations": 0}
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return self.get(key, count=False) is not None
+
+    def get(self, key, count=True):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] <= self.clock():
+                self._remove(key)
+                self.stats["expirations"] += 1
+                entry = None
+            if entry is None:
+                if count:
+                    self.stats["misses"] += 1
+                return None
+            self._entries.move_to_end(key)
+            if count:
+                self.stats["hits"] += 1
+            return entry[2]
+
+    def put(self, key, value, size=None):
+        if size is None:
+            size = result_size(value) if isinstance(value, QueryResult) else sys.getsizeof(value)
+        if size > self.max_bytes:
+            return value
+        if isinstance(value, QueryResult):
+            # Lazy parts (export, card and row pages) report bytes they produce later
+            for part in (value.export, value.cards, value.job_list):
+                if hasattr(part, "on_serialize"):
+                    part.on_serialize = lambda nbytes: self._grow(key, value, nbytes)
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (self.clock() + self.ttl, size, value)
+            self.bytes += size
+            self._evict()
+        return value
+
+    def _grow(self, key, value, nbytes):
+        """Charge bytes an entry gained after it was stored (a download or page built later)"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[2] is not value:
+                return
+            self._entries[key] = (entry[0], entry[1] + nbytes, value)
+            self.bytes += nbytes
+            self._evict()
+
+    def get_or_compute(self, key, compute):
+        """Cached value for key, computing and storing it on a miss"""
+        value = self.get(key)
+        if value is None:
+            value = self.put(key, compute())
+        return value
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.bytes = 0
+
+    def info(self):
+        """Counters plus current size, for display or logging"""
+        with self._lock:
+            return dict(self.stats, entries=len(self._entries), bytes=self.bytes,
+                        max_entries=self.max_entries, max_bytes=self.max_bytes)
+
+    def _evict(self):
+        """Drop least recently used entries until under both limits (lock held)"""
+        while len(self._entries) > self.max_entries or self.bytes > self.max_bytes:
+            self._remove(next(iter(self._entries)))
+            self.stats["evictions"] += 1
+
+    def _remove(self, key):
+        _, size, _ = self._entries.pop(key)
+        self.bytes -= size
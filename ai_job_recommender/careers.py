@@ -0,0 +1,164 @@
+"""Career paths as a directed graph over roles
+
+Every role named in the catalog's career paths becomes a node; each role
+links to every role one level up in the same path (Entry -> Mid -> Senior
+-> Executive), and a role listed in several paths joins them. Successors
+live in CSR adjacency arrays, pre-sorted by salary uplift, and each node
+carries a bitset of the roles reachable from it, so "next roles from X"
+is a slice and "can X lead to Y" is one bit test. Shortest paths to a
+target role come from one reverse BFS per target, cached.
+"""
+from array import array
+from collections import deque, namedtuple
+from functools import lru_cache
+
+LEVELS = ("Entry Level", "Mid Level", "Senior Level", "Executive Level")
+NO_SALARY = -1
+
+NextRole = namedtuple("NextRole", ["role", "salary_uplift"])
+CareerTrack = namedtuple("CareerTrack", ["name", "icon", "title", "levels", "certifications"])
+
+
+class CareerGraph:
+    """Role graph with precomputed next-step and reachability indexes"""
+
+    def __init__(self, career_paths, job_details=None):
+        job_details = job_details or {}
+        self.roles = []
+        self.role_ids = {}
+        self.tracks = []
+        edges = set()
+        for path in career_paths:
+            levels = [(level, [self._intern(role) for role in path["levels"][level]])
+                      for level in LEVELS if level in path["levels"]]
+            for (_, lower), (_, upper) in zip(levels, levels[1:]):
+                edges.update((a, b) for a in lower for b in upper if a != b)
+            self.tracks.append(CareerTrack(path["name"], path["icon"], path["title"],
+                                           tuple((level, tuple(ids)) for level, ids in levels),
+                                           tuple(path.get("certifications", ()))))
+
+        n = len(self.roles)
+        self.salary_mid = array("q", [NO_SALARY]) * n
+        for role_id, role in enumerate(self.roles):
+            job = job_details.get(role)
+            if job is not None:
+                self.salary_mid[role_id] = job.salary_mid
+
+        # CSR successors, best salary uplift first (unknown uplift last)
+        successors = [[] for _ in range(n)]
+        for a, b in edges:
+            successors[a].append(b)
+        self.offsets = array("I", [0])
+        self.targets = array("I")
+        for role_id, nexts in enumerate(successors):
+            nexts.sort(key=lambda b: (self.uplift(role_id, b) is None, -(self.uplift(role_id, b) or 0),
+                                      self.roles[b]))
+            self.targets.extend(nexts)
+            self.offsets.append(len(self.targets))
+
+        # Reachability bitsets, filled in reverse topological order (edges only go up a level)
+        self.reachable = [0] * n
+        for role_id in self._reverse_topological():
+            bits = 0
+            for b in self.successors(role_id):
+                bits |= (1 << b) | self.reachable[b]
+            self.reachable[role_id] = bits
+
+        self._distances = lru_cache(maxsize=64)(self._distances_to)
+
+    @classmethod
+    def from_catalog(cls, catalog):
+        return cls(catalog.career_paths, catalog.job_details)
+
+    def _intern(self, role):
+        role_id = self.role_ids.get(role)
+        if role_id is None:
+            role_id = self.role_ids[role] = len(self.roles)
+            self.roles.append(role)
+        return role_id
+
+    def _reverse_topological(self):
+        indegree = [0] * len(self.roles)
+        for b in self.targets:
+            indegree[b] += 1
+        queue = deque(i for i, d in enumerate(indegree) if d == 0)
+        order = []
+        while queue:
+            a = queue.popleft()
+            order.append(a)
+            for b in self.successors(a):
+                indegree[b] -= 1
+                if indegree[b] == 0:
+                    queue.append(b)
+        return reversed(order)
+
+    def __len__(self):
+        return len(self.roles)
+
+    def __contains__(self, role):
+        return role in self.role_ids
+
+    # ===== QUERIES =====
+    def successors(self, role_id):
+        return self.targets[self.offsets[role_id]:self.offsets[role_id + 1]]
+
+    def salary(self, role):
+        """Salary midpoint of a role, or None when the catalog has no details for it"""
+        mid = self.salary_mid[self.role_ids[role] if isinstance(role, str) else role]
+        return None if mid == NO_SALARY else mid
+
+    def uplift(self, a, b):
+        low, high = self.salary_mid[a], self.salary_mid[b]
+        return None if NO_SALARY in (low, high) else high - low
+
+    def next_roles(self, role, limit=None):
+        """Roles one step up from role, best salary uplift first"""
+        role_id = self.role_ids.get(role)
+        if role_id is None:
+            return []
+        nexts = self.successors(role_id)[:limit]
+        return [NextRole(self.roles[b], self.uplift(role_id, b)) for b in nexts]
+
+    def can_reach(self, source, target):
+        a, b = self.role_ids.get(source), self.role_ids.get(target)
+        return a is not None and b is not None and bool(self.reachable[a] >> b & 1)
+
+    def _distances_to(self, target_id):
+        """Steps from every role to target_id (-1 = unreachable), by reverse BFS"""
+        predecessors = [[] for _ in self.roles]
+        for a in range(len(self.roles)):
+            for b in self.successors(a):
+                predecessors[b].append(a)
+        distance = array("i", [-1]) * len(self.roles)
+        distance[target_id] = 0
+        queue = deque([target_id])
+        while queue:
+            b = queue.popleft()
+            for a in predecessors[b]:
+                if distance[a] < 0:
+                    distance[a] = distance[b] + 1
+                    queue.append(a)
+        return distance
+
+    def shortest_path(self, sources, target):
+        """Fewest-steps path [source, ..., target] from any of sources, or None
+
+        Among equally short routes, each step takes the best-paid next role.
+        """
+        target_id = self.role_ids.get(target)
+        if target_id is None:
+            return None
+        distance = self._distances(target_id)
+        starts = [self.role_ids[s] for s in sources if s in self.role_ids and distance[self.role_ids[s]] >= 0]
+        if not starts:
+            return None
+        current = min(starts, key=lambda s: (distance[s], -self.salary_mid[s]))
+        path = [current]
+        while current != target_id:
+            current = next(b for b in self.successors(current) if distance[b] == distance[current] - 1)
+            path.append(current)
+        return [self.roles[i] for i in path]
+
+    def executive_roles(self):
+        """Top-level roles (no successors), in catalog order"""
+        return [role for i, role in enumerate(self.roles) if self.offsets[i] == self.offsets[i + 1]]
@@ -0,0 +1,245 @@
+"""Job catalog data layer: skill map, job details and career paths
+
+The catalog is loaded once per process and shared read-only between every
+Streamlit session and headless caller. Sources can be the bundled JSON
+file, a jobs CSV, a SQLite database, or a compiled binary snapshot (see
+snapshot.py) that is memory-mapped instead of parsed. Set
+AI_JOB_RECOMMENDER_CATALOG to load something other than the bundled JSON.
+"""
+import csv
+import json
+import os
+import sqlite3
+import threading
+from functools import cached_property
+from types import MappingProxyType
+
+from .records import Job
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
+CATALOG_ENV = "AI_JOB_RECOMMENDER_CATALOG"
+DEFAULT_CATALOG_PATH = os.environ.get(CATALOG_ENV) or os.path.join(DATA_DIR, "catalog.json")
+
+# Separator for multi-valued cells in the CSV source (certificates, skills)
+LIST_SEPARATOR = ";"
+
+
+class Catalog:
+    """Read-only view over the job catalog (job_details maps title -> Job record)"""
+
+    def __init__(self, skill_map, job_details, career_paths=(), skill_aliases=None,
+                 version=1, path=None, mtime=None):
+        # Values are job tuples, or read-only {job: weight} maps for mined catalogs
+        self.skill_map = MappingProxyType({
+            skill: MappingProxyType(dict(jobs)) if hasattr(jobs, "items") else tuple(jobs)
+            for skill, jobs in skill_map.items()
+        })
+        self.skill_aliases = MappingProxyType(dict(skill_aliases or {}))
+        self.job_details = MappingProxyType({
+            job: details if isinstance(details, Job) else Job.from_dict(job, details)
+            for job, details in job_details.items()
+        })
+        self.career_paths = tuple(MappingProxyType(dict(p)) for p in career_paths)
+        self.version = version
+        self.path = path
+        self.mtime = mtime
+
+    @cached_property
+    def skill_index(self):
+        """Inverted skill -> job index, built on first use and shared with the catalog"""
+        from .matching import SkillIndex
+        return SkillIndex.from_catalog(self)
+
+    @cached_property
+    def skill_normalizer(self):
+        """Alias/fuzzy skill resolver over this catalog's vocabulary"""
+        from .normalizer import SkillNormalizer
+        return SkillNormalizer.from_catalog(self)
+
+    @cached_property
+    def skill_completer(self):
+        """Popularity-ranked prefix autocomplete over this catalog's skills"""
+        from .autocomplete import SkillCompleter
+        return SkillCompleter.from_catalog(self)
+
+    @cached_property
+    def career_graph(self):
+        """Career paths as a role graph with next-step and reachability indexes"""
+        from .careers import CareerGraph
+        return CareerGraph.from_catalog(self)
+
+    @cached_property
+    def salary_stats(self):
+        """Salary aggregates and sorted midpoint indexes for range filters"""
+        from .salaries import SalaryStats
+        return SalaryStats.from_catalog(self)
+
+    @cached_property
+    def search_index(self):
+        """BM25 free-text index over job titles, descriptions, certificates and skills"""
+        from .search import TextIndex
+        return TextIndex.from_catalog(self)
+
+    @cached_property
+    def certificate_index(self):
+        """Certificate <-> job bitsets and the fewest-certificates planner"""
+        from .certificates import CertificateIndex
+        return CertificateIndex.from_catalog(self)
+
+    @cached_property
+    def skill_gaps(self):
+        """Job x skill bitmaps for gap analysis (None for catalogs too large for them)"""
+        from .gaps import SkillGapIndex
+        return SkillGapIndex.from_catalog(self)
+
+    @cached_property
+    def skill_extractor(self):
+        """Finds known skills (and aliases) mentioned in CVs and free text"""
+        from .extraction import SkillExtractor
+        return SkillExtractor.from_catalog(self)
+
+    def __repr__(self):
+        return (f"Catalog(version={self.version}, skills={len(self.skill_map)}, "
+                f"jobs={len(self.job_details)})")
+
+    @classmethod
+    def from_dict(cls, data, path=None, mtime=None):
+        return cls(
+            data["skill_map"],
+            data["job_details"],
+            data.get("career_paths", ()),
+            skill_aliases=data.get("skill_aliases"),
+            version=data.get("version", 1),
+            path=path,
+            mtime=mtime,
+        )
+
+    def to_dict(self):
+        """Plain-JSON representation (inverse of from_dict)"""
+        return {
+            "version": self.version,
+            "skill_map": {skill: dict(jobs) if hasattr(jobs, "items") else list(jobs)
+                          for skill, jobs in self.skill_map.items()},
+            "skill_aliases": dict(self.skill_aliases),
+            "job_details": {job: record.to_dict() for job, record in self.job_details.items()},
+            "career_paths": [dict(p) for p in self.career_paths],
+        }
+
+
+def catalog_mtime(path=DEFAULT_CATALOG_PATH):
+    """Modification time of the catalog data file (ns), or None if missing"""
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+# ===== SOURCES =====
+def read_json_source(path):
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def read_csv_source(path):
+    """One row per job: job, description, salary_min, salary_max, certificates,
+    ai_impact, skills (multi-valued cells separated by ';')"""
+    skill_map = {}
+    job_details = {}
+    with open(path, "r", encoding="utf-8", newline="") as f:
+        for row in csv.DictReader(f):
+            job = row["job"].strip()
+            job_details[job] = {
+                "description": row["description"],
+                "salary": (int(row["salary_min"]), int(row["salary_max"])),
+                "certificates": _split(row.get("certificates", "")),
+                "ai_impact": row["ai_impact"].strip(),
+            }
+            for skill in _split(row.get("skills", "")):
+                skill_map.setdefault(skill.lower(), []).append(job)
+    return {"version": 1, "skill_map": skill_map, "job_details": job_details}
+
+
+def _split(cell):
+    return [item.strip() for item in (cell or "").split(LIST_SEPARATOR) if item.strip()]
+
+
+def read_sqlite_source(path):
+    """Tables: jobs(title, description, salary_min, salary_max, ai_impact),
+    job_certificates(job, certificate), job_skills(skill, job),
+    optional skill_aliases(alias, skill); PRAGMA user_version is the version"""
+    connection = sqlite3.connect(f"file:{path}?mode=ro", uri=True)
+    try:
+        job_details = {
+            title: {"description": description, "salary": (low, high),
+                    "certificates": [], "ai_impact": ai_impact}
+            for title, description, low, high, ai_impact in connection.execute(
+                "SELECT title, description, salary_min, salary_max, ai_impact FROM jobs ORDER BY rowid")
+        }
+        for job, certificate in connection.execute(
+                "SELECT job, certificate FROM job_certificates ORDER BY rowid"):
+            if job in job_details:
+                job_details[job]["certificates"].append(certificate)
+        skill_map = {}
+        for skill, job in connection.execute("SELECT skill, job FROM job_skills ORDER BY rowid"):
+            skill_map.setdefault(skill, []).append(job)
+        tables = {name for (name,) in connection.execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+        aliases = dict(connection.execute("SELECT alias, skill FROM skill_aliases")) if "skill_aliases" in tables else {}
+        version = connection.execute("PRAGMA user_version").fetchone()[0] or 1
+    finally:
+        connection.close()
+    return {"version": version, "skill_map": skill_map, "job_details": job_details,
+            "skill_aliases": aliases}
+
+
+SOURCE_READERS = {
+    ".json": read_json_source,
+    ".csv": read_csv_source,
+    ".db": read_sqlite_source,
+    ".sqlite": read_sqlite_source,
+    ".sqlite3": read_sqlite_source,
+}
+
+
+def load_source(path):
+    """Read a catalog source file into a Catalog (no caching, no snapshots)"""
+    ext = os.path.splitext(path)[1].lower()
+    if ext not in SOURCE_READERS:
+        raise ValueError(f"Unsupported catalog source: {path} (expected one of {', '.join(SOURCE_READERS)})")
+    return Catalog.from_dict(SOURCE_READERS[ext](path), path=path, mtime=catalog_mtime(path))
+
+
+def load_catalog(path=DEFAULT_CATALOG_PATH):
+    """Load a catalog from any source or a binary snapshot (uncached)"""
+    from .snapshot import is_snapshot, load_snapshot
+
+    if is_snapshot(path):
+        return load_snapshot(path, mtime=catalog_mtime(path))
+    return load_source(path)
+
+
+def compile_catalog(source, target):
+    """Compile a catalog source into a memory-mappable snapshot file"""
+    from .snapshot import write_snapshot
+
+    return write_snapshot(load_source(source), target)
+
+
+# ===== PROCESS-WIDE CACHE =====
+_catalogs = {}
+_catalog_lock = threading.Lock()
+
+
+def get_catalog(path=DEFAULT_CATALOG_PATH):
+    """Return the process-wide catalog, reloading only if the data file changed"""
+    catalog = _catalogs.get(path)
+    if catalog is not None and catalog.mtime == catalog_mtime(path):
+        return catalog
+    return reload_catalog(path)
+
+
+def reload_catalog(path=DEFAULT_CATALOG_PATH):
+    """Force a reload of the catalog from disk and replace the shared copy"""
+    with _catalog_lock:
+        catalog = load_catalog(path)
+        _catalogs[path] = catalog
+    return catalog
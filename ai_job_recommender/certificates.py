@@ -0,0 +1,108 @@
+"""Certificate index and planner: the fewest certificates opening up a set of jobs
+
+A job counts as opened by any one of the certificates it lists. At load
+every certificate gets an int bitset of the jobs listing it and every job
+a bitset of its certificates, so "which jobs does this certificate add"
+is one AND and a popcount. The planner is greedy set cover (within a
+factor ln(n) of the true minimum): repeatedly take the certificate that
+opens the most still-uncovered target jobs. It works on the target jobs
+alone, renumbered from 0, so its bitsets stay as small as the target
+list even on a million-job catalog. Gains only shrink as jobs get
+covered, so candidates sit in a heap and only the top one is re-counted
+each round (lazy greedy).
+"""
+import heapq
+from collections import namedtuple
+
+from .bitsets import bitset, iter_bits
+
+PlanStep = namedtuple("PlanStep", ["certificate", "jobs", "covered"])
+CertificatePlan = namedtuple("CertificatePlan", ["steps", "covered", "uncovered"])
+
+
+class CertificateIndex:
+    """certificate -> job bitset and job -> certificate bitset over one catalog"""
+
+    def __init__(self, job_details):
+        # One pass over the jobs (each one is decoded on a snapshot catalog)
+        self.jobs = []                                # job id -> title
+        listed = []
+        for title, job in job_details.items():
+            self.jobs.append(title)
+            listed.append(job.certificates)
+        self.job_ids = {title: i for i, title in enumerate(self.jobs)}
+        self.certificates = sorted({c for certificates in listed for c in certificates})
+        self.certificate_ids = {c: i for i, c in enumerate(self.certificates)}
+        members = [[] for _ in self.certificates]
+        self.job_certificates = []
+        for job_id, certificates in enumerate(listed):
+            cert_ids = [self.certificate_ids[certificate] for certificate in certificates]
+            for cert_id in cert_ids:
+                members[cert_id].append(job_id)
+            self.job_certificates.append(bitset(cert_ids))
+        self.certificate_jobs = [bitset(job_ids) for job_ids in members]
+        self.reach = [len(job_ids) for job_ids in members]
+
+    @classmethod
+    def from_catalog(cls, catalog):
+        return cls(catalog.job_details)
+
+    def __len__(self):
+        return len(self.certificates)
+
+    # ===== QUERIES =====
+    def titles(self, bits):
+        return [self.jobs[i] for i in iter_bits(bits)]
+
+    def jobs_for(self, certificate):
+        """Titles of the jobs listing a certificate"""
+        cert_id = self.certificate_ids.get(certificate)
+        return [] if cert_id is None else self.titles(self.certificate_jobs[cert_id])
+
+    def certificates_for(self, title):
+        job_id = self.job_ids.get(title)
+        return [] if job_id is None else [self.certificates[i] for i in iter_bits(self.job_certificates[job_id])]
+
+    def plan(self, titles, limit=None):
+        """CertificatePlan covering the jobs in titles with as few certificates as greedy finds
+
+        Steps come best first, each with the jobs it newly opens; limit
+        caps the number of certificates. Jobs left unopened (unknown, listing
+        no certificates, or cut off by limit) end up in uncovered.
+        """
+        titles = list(dict.fromkeys(titles))
+        targets = [self.job_ids[title] for title in titles if title in self.job_ids]
+        # Re-index the target jobs 0..n-1 so every bitset below is n bits, whatever the catalog size
+        local = {}
+        for i, job_id in enumerate(targets):
+            for cert_id in iter_bits(self.job_certificates[job_id]):
+                local[cert_id] = local.get(cert_id, 0) | 1 << i
+        uncovered = 0
+        for bits in local.values():
+            uncovered |= bits
+
+        # (-gain, -catalog-wide reach, id): most new jobs first, then the more broadly useful certificate
+        heap = [(-bits.bit_count(), -self.reach[cert_id], cert_id) for cert_id, bits in local.items()]
+        heapq.heapify(heap)
+        steps = []
+        covered = 0
+        while uncovered and heap and (limit is None or len(steps) < limit):
+            _, reach, cert_id = heapq.heappop(heap)
+            opened = local[cert_id] & uncovered
+            gain = opened.bit_count()
+            if heap and gain < -heap[0][0]:
+                # Stale gain: re-queue with the current count and try the next best
+                heapq.heappush(heap, (-gain, reach, cert_id))
+                continue
+            uncovered &= ~opened
+            covered |= opened
+            steps.append(PlanStep(self.certificates[cert_id], [self.jobs[targets[i]] for i in iter_bits(opened)],
+                                  covered.bit_count()))
+
+        opened = {targets[i] for i in iter_bits(covered)}
+        left = [title for title in titles if self.job_ids.get(title) not in opened]
+        return CertificatePlan(steps, len(opened), left)
+
+    def plan_many(self, title_lists, limit=None):
+        """plan() for each list of titles (a cohort's recommendations)"""
+        return [self.plan(titles, limit) for titles in title_lists]
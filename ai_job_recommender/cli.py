@@ -0,0 +1,366 @@
+"""Command-line entry point: python -m ai_job_recommender score in.csv -o out.jsonl
+
+Input profiles are streamed in chunks, scored (optionally on a process
+pool) and written out as soon as each chunk is done, so memory stays flat
+no matter how large the export is.
+"""
+import argparse
+import csv
+import io
+import json
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+
+from .catalog import DEFAULT_CATALOG_PATH, get_catalog
+from .export import CSV_COLUMNS, job_row
+from .mining import DEFAULT_MAX_PAIRS, DEFAULT_MIN_POSTINGS, DEFAULT_MIN_SHARE, build_skill_map
+
+DEFAULT_CHUNK_SIZE = 2000
+DEFAULT_TOP_K = 10
+SKILL_COLUMNS = ("skills", "Skills", "skill", "profile")
+ID_COLUMNS = ("id", "ID", "student_id", "profile_id")
+
+
+# ===== INPUT =====
+def detect_format(path, explicit=None):
+    if explicit:
+        return explicit
+    ext = os.path.splitext(path)[1].lower()
+    return "jsonl" if ext in (".jsonl", ".ndjson", ".json") else "csv"
+
+
+def _pick(row, names, default=None):
+    for name in names:
+        if name in row:
+            return row[name]
+    return default
+
+
+def _skills(value):
+    """A profile's skills as a string or list of strings; anything else (null, numbers) is no skills"""
+    if isinstance(value, str):
+        return value
+    if isinstance(value, list):
+        return [skill for skill in value if isinstance(skill, str)]
+    return ""
+
+
+def read_profiles(stream, fmt):
+    """Yield (id, skills) pairs lazily from a CSV or JSONL stream
+
+    Malformed JSONL lines and skills that aren't text come through as a
+    profile with no skills, so one bad row can't stop a run.
+    """
+    if fmt == "jsonl":
+        for line_no, line in enumerate(stream, 1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                record = json.loads(line)
+            except ValueError:
+                record = None
+            if isinstance(record, dict):
+                yield _pick(record, ID_COLUMNS, line_no), _skills(_pick(record, SKILL_COLUMNS, ""))
+            else:
+                yield line_no, _skills(record)
+    else:
+        for row_no, row in enumerate(csv.DictReader(stream), 1):
+            yield _pick(row, ID_COLUMNS, row_no), _pick(row, SKILL_COLUMNS, "") or ""
+
+
+def chunked(iterable, size):
+    iterator = iter(iterable)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+# ===== SCORING =====
+def score_chunk(chunk, k=DEFAULT_TOP_K, catalog_path=DEFAULT_CATALOG_PATH, plan_certificates=False):
+    """Score one chunk of (id, skills) pairs into result records
+
+    With plan_certificates each record also gets the fewest certificates
+    opening up its recommendations.
+    """
+    from .batch import recommend_batch
+
+    catalog = get_catalog(catalog_path)
+    index = catalog.skill_index
+    result = recommend_batch([skills for _, skills in chunk], index, k=k,
+                             normalizer=catalog.skill_normalizer)
+    base_rows = {}
+    scored = []
+    recommended = []
+    for row, (profile_id, skills) in enumerate(chunk):
+        recommendations = []
+        matches = result.matches(row)
+        recommended.append([match.job for match in matches])
+        for match in matches:
+            base = base_rows.get(match.job)
+            if base is None:
+                job = catalog.job_details.get(match.job)
+                if job is None:
+                    continue
+                base = base_rows[match.job] = job_row(job)
+            record = dict(base)
+            record["Score"] = round(match.score, 4)
+            record["Matched Skills"] = ", ".join(match.skills)
+            recommendations.append(record)
+        scored.append({
+            "id": profile_id,
+            "skills": skills,
+            "recommendations": recommendations,
+            "unknown_skills": result.unknown[row],
+        })
+    if plan_certificates:
+        plans = catalog.certificate_index.plan_many(recommended)
+        for record, plan in zip(scored, plans):
+            record["certificate_plan"] = [{"certificate": step.certificate, "jobs": step.jobs} for step in plan.steps]
+    return scored
+
+
+def render_chunk(chunk, out_format="jsonl", k=DEFAULT_TOP_K, catalog_path=DEFAULT_CATALOG_PATH,
+                 plan_certificates=False):
+    """Score and serialize one chunk; runs in worker processes so only text crosses back"""
+    return FORMATTERS[out_format](score_chunk(chunk, k, catalog_path, plan_certificates))
+
+
+def render_chunks(chunks, out_format="jsonl", workers=1, k=DEFAULT_TOP_K,
+                  catalog_path=DEFAULT_CATALOG_PATH, plan_certificates=False):
+    """Yield (rows, text) per chunk in input order, keeping at most 2 x workers in flight"""
+    if workers <= 1:
+        for chunk in chunks:
+            yield len(chunk), render_chunk(chunk, out_format, k, catalog_path, plan_certificates)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = deque()
+        for chunk in chunks:
+            pending.append((len(chunk), pool.submit(render_chunk, chunk, out_format, k, catalog_path,
+                                                    plan_certificates)))
+            if len(pending) >= workers * 2:
+                rows, future = pending.popleft()
+                yield rows, future.result()
+        while pending:
+            rows, future = pending.popleft()
+            yield rows, future.result()
+
+
+# ===== OUTPUT =====
+CSV_FIELDS = ["id", "Rank"] + CSV_COLUMNS + ["Score", "Matched Skills", "Unknown Skills"]
+CSV_PLAN_FIELDS = CSV_FIELDS + ["Plan Certificate"]
+
+
+def format_jsonl(scored):
+    return "".join(json.dumps(record, ensure_ascii=False) + "\n" for record in scored)
+
+
+def format_csv(scored):
+    """One row per (profile, recommended job); header is written separately
+
+    With a certificate plan, each job row names the plan's certificate
+    that opens it (empty when none does).
+    """
+    buffer = io.StringIO()
+    planned = any("certificate_plan" in record for record in scored)
+    writer = csv.DictWriter(buffer, fieldnames=CSV_PLAN_FIELDS if planned else CSV_FIELDS)
+    for record in scored:
+        unknown = ", ".join(record["unknown_skills"])
+        opened_by = {job: step["certificate"] for step in record.get("certificate_plan", ())
+                     for job in step["jobs"]}
+        if not record["recommendations"]:
+            writer.writerow({"id": record["id"], "Rank": 0, "Unknown Skills": unknown})
+        for rank, job in enumerate(record["recommendations"], 1):
+            row = {"id": record["id"], "Rank": rank, **job, "Unknown Skills": unknown}
+            if planned:
+                row["Plan Certificate"] = opened_by.get(job["Job"], "")
+            writer.writerow(row)
+    return buffer.getvalue()
+
+
+FORMATTERS = {"jsonl": format_jsonl, "csv": format_csv}
+
+
+# ===== COMMANDS =====
+def score(args):
+    in_format = detect_format(args.input, args.input_format)
+    out_format = detect_format(args.output, args.output_format) if args.output != "-" else (args.output_format or "jsonl")
+
+    source = sys.stdin if args.input == "-" else open(args.input, "r", encoding="utf-8", newline="")
+    sink = sys.stdout if args.output == "-" else open(args.output, "w", encoding="utf-8", newline="")
+    rows = 0
+    start = time.perf_counter()
+    try:
+        if out_format == "csv":
+            csv.writer(sink).writerow(CSV_PLAN_FIELDS if args.plan_certificates else CSV_FIELDS)
+        chunks = chunked(read_profiles(source, in_format), args.chunk_size)
+        for chunk_rows, text in render_chunks(chunks, out_format, args.workers, args.top_k, args.catalog,
+                                              args.plan_certificates):
+            sink.write(text)
+            rows += chunk_rows
+    finally:
+        if source is not sys.stdin:
+            source.close()
+        if sink is not sys.stdout:
+            sink.close()
+
+    elapsed = time.perf_counter() - start
+    rate = rows / elapsed if elapsed > 0 else 0.0
+    print(f"Scored {rows:,} profiles in {elapsed:.2f}s ({rate:,.0f} rows/sec, "
+          f"{args.workers} worker{'s' if args.workers != 1 else ''})", file=sys.stderr)
+    return 0
+
+
+def compile_catalog_command(args):
+    from .catalog import compile_catalog, load_catalog
+
+    start = time.perf_counter()
+    compile_catalog(args.source, args.output)
+    compiled = time.perf_counter()
+    catalog = load_catalog(args.output)
+    loaded = time.perf_counter()
+    print(f"Compiled {args.source} -> {args.output} ({os.path.getsize(args.output):,} bytes, "
+          f"{len(catalog.job_details):,} jobs, {len(catalog.skill_map):,} skills) "
+          f"in {compiled - start:.2f}s; snapshot opens in {(loaded - compiled) * 1000:.1f} ms",
+          file=sys.stderr)
+    return 0
+
+
+def serve_command(args):
+    from .server import serve
+
+    return serve(args.host, args.port, args.catalog, args.batch_window_ms / 1000, args.max_batch,
+                 with_metrics=not args.no_metrics, log_interval=args.log_metrics)
+
+
+def extract(args):
+    from .extraction import read_chunks
+    from .service import Recommender
+
+    recommender = Recommender(get_catalog(args.catalog))
+    start = time.perf_counter()
+    if args.input == "-":
+        found = recommender.extract_skills(iter(lambda: sys.stdin.read(1 << 20), ""))
+        size = None
+    else:
+        with open(args.input, "rb") as f:
+            found = recommender.extract_skills(read_chunks(f, args.input))
+        size = os.path.getsize(args.input)
+    elapsed = time.perf_counter() - start
+    if args.counts:
+        for skill, mentions in found.items():
+            print(f"{skill}\t{mentions}")
+    else:
+        print(", ".join(found))
+    print(f"Found {len(found)} skills" + (f" in {size:,} bytes" if size is not None else "")
+          + f" in {elapsed * 1000:.1f} ms", file=sys.stderr)
+    return 0
+
+
+def build_skill_map_command(args):
+    extra_skills = ()
+    if args.skills:
+        with open(args.skills, "r", encoding="utf-8") as f:
+            extra_skills = [line.strip() for line in f if line.strip()]
+    start = time.perf_counter()
+    catalog = build_skill_map(
+        args.corpus, args.output, args.base, extra_skills, workers=args.workers,
+        chunk_size=args.chunk_size, max_pairs=args.max_pairs, min_share=args.min_share,
+        min_postings=args.min_postings, temp_dir=args.temp_dir)
+    print(f"Wrote {args.output} ({len(catalog['job_details']):,} jobs, {len(catalog['skill_map']):,} skills) "
+          f"in {time.perf_counter() - start:.2f}s", file=sys.stderr)
+    return 0
+
+
+def startup(args):
+    from .startup import check_startup
+
+    budget = {}
+    if args.budget_imports_ms is not None:
+        budget["package_imports"] = args.budget_imports_ms
+    if args.budget_render_ms is not None:
+        budget["first_render"] = args.budget_render_ms
+    ok, report = check_startup(args.script, budget, args.top)
+    print(report)
+    return 0 if ok else 1
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="ai_job_recommender",
+                                     description="AI Job Recommender command-line tools")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    score_parser = commands.add_parser("score", help="Score a file of skill profiles")
+    score_parser.add_argument("input", help="CSV (with a 'skills' column) or JSONL file, '-' for stdin")
+    score_parser.add_argument("-o", "--output", default="-", help="Output .jsonl or .csv file (default: stdout)")
+    score_parser.add_argument("--input-format", choices=sorted(FORMATTERS), help="Override input format detection")
+    score_parser.add_argument("--output-format", choices=sorted(FORMATTERS), help="Override output format detection")
+    score_parser.add_argument("-k", "--top-k", type=int, default=DEFAULT_TOP_K, help="Recommendations per profile")
+    score_parser.add_argument("--workers", type=int, default=1, help="Worker processes (default: 1)")
+    score_parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE, help="Profiles per chunk")
+    score_parser.add_argument("--catalog", default=DEFAULT_CATALOG_PATH, help="Catalog data file")
+    score_parser.add_argument("--plan-certificates", action="store_true",
+                              help="Add each profile's fewest-certificates plan (JSONL 'certificate_plan', "
+                                   "CSV 'Plan Certificate' column)")
+    score_parser.set_defaults(func=score)
+
+    compile_parser = commands.add_parser("compile-catalog",
+                                         help="Compile a JSON/CSV/SQLite catalog into a binary snapshot")
+    compile_parser.add_argument("source", help="Catalog source (.json, .csv, .db/.sqlite)")
+    compile_parser.add_argument("-o", "--output", required=True, help="Snapshot file to write (e.g. catalog.snapshot)")
+    compile_parser.set_defaults(func=compile_catalog_command)
+
+    serve_parser = commands.add_parser("serve", help="Run the JSON recommendation API")
+    serve_parser.add_argument("--host", default="127.0.0.1", help="Interface to bind (default: 127.0.0.1)")
+    serve_parser.add_argument("--port", type=int, default=8000, help="Port (default: 8000, 0 = any free port)")
+    serve_parser.add_argument("--catalog", default=DEFAULT_CATALOG_PATH, help="Catalog data file")
+    serve_parser.add_argument("--batch-window-ms", type=float, default=2.0,
+                              help="How long /recommend calls wait to be batched together")
+    serve_parser.add_argument("--max-batch", type=int, default=64, help="Largest /recommend batch")
+    serve_parser.add_argument("--no-metrics", action="store_true", help="Disable stage timings and /metrics")
+    serve_parser.add_argument("--log-metrics", type=float, metavar="SECONDS",
+                              help="Also print a metrics summary line to stderr every SECONDS")
+    serve_parser.set_defaults(func=serve_command)
+
+    extract_parser = commands.add_parser("extract", help="List the known skills mentioned in a CV")
+    extract_parser.add_argument("input", help="CV as .txt/.md/.docx, '-' for stdin")
+    extract_parser.add_argument("--counts", action="store_true", help="One skill per line with its mention count")
+    extract_parser.add_argument("--catalog", default=DEFAULT_CATALOG_PATH, help="Catalog data file")
+    extract_parser.set_defaults(func=extract)
+
+    mine_parser = commands.add_parser("build-skill-map", help="Mine a job postings corpus into a weighted catalog")
+    mine_parser.add_argument("corpus", help="Postings as .jsonl or .csv (title, description, optional salary_min/max)")
+    mine_parser.add_argument("-o", "--output", required=True, help="Catalog .json file to write")
+    mine_parser.add_argument("--workers", type=int, default=1, help="Worker processes (default: 1)")
+    mine_parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE, help="Postings per chunk")
+    mine_parser.add_argument("--max-pairs", type=int, default=DEFAULT_MAX_PAIRS,
+                             help="Distinct (skill, job) pairs held in memory before spilling a sorted run")
+    mine_parser.add_argument("--min-share", type=float, default=DEFAULT_MIN_SHARE,
+                             help="Smallest share of a job's postings that must mention a skill")
+    mine_parser.add_argument("--min-postings", type=int, default=DEFAULT_MIN_POSTINGS,
+                             help="Jobs with fewer postings are dropped")
+    mine_parser.add_argument("--skills", help="Extra skills to look for, one per line")
+    mine_parser.add_argument("--base", default=DEFAULT_CATALOG_PATH,
+                             help="Catalog supplying skill names, aliases, known job details and career paths")
+    mine_parser.add_argument("--temp-dir", help="Directory for sorted run files (default: system temp)")
+    mine_parser.set_defaults(func=build_skill_map_command)
+
+    startup_parser = commands.add_parser("startup", help="Measure cold start against the startup budget")
+    startup_parser.add_argument("--script", default="main.py", help="Streamlit script to run (default: main.py)")
+    startup_parser.add_argument("--budget-imports-ms", type=int, help="Override the package import budget")
+    startup_parser.add_argument("--budget-render-ms", type=int, help="Override the time-to-first-render budget")
+    startup_parser.add_argument("--top", type=int, default=10, help="Slowest imports to list")
+    startup_parser.set_defaults(func=startup)
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    return args.func(args)
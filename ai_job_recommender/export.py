@@ -0,0 +1,164 @@
+"""Recommendation export: per-job rows and lazily serialized download formats
+
+Nothing is serialized until a download is actually requested; CSV/TSV go
+through the stdlib csv writer into a reusable per-thread buffer, and
+heavy formats (XLSX) import pandas/openpyxl only when selected.
+"""
+import io
+import threading
+from collections import namedtuple
+from importlib.util import find_spec
+
+from .instrumentation import metrics
+
+CSV_COLUMNS = ["Job", "Description", "Min Salary AED", "Max Salary AED", "Certificates", "AI Impact"]
+
+EXPORT_FILE_STEM = "AI_Job_Recommender_Recommendations"
+
+
+def job_row(job):
+    """Flatten one Job record into an export row"""
+    return {
+        "Job": job.title,
+        "Description": job.description,
+        "Min Salary AED": job.salary_min,
+        "Max Salary AED": job.salary_max,
+        "Certificates": ", ".join(job.certificates),
+        "AI Impact": job.ai_impact.label
+    }
+
+
+def job_rows(jobs, job_details):
+    """Export rows for the jobs that have details, in order"""
+    return [job_row(job_details[job]) for job in jobs if job in job_details]
+
+
+def row_columns(rows):
+    """Column order for a list of row dicts: CSV_COLUMNS first, extras after"""
+    columns = list(CSV_COLUMNS)
+    for row in rows:
+        for column in row:
+            if column not in columns:
+                columns.append(column)
+    return columns
+
+
+# ===== SERIALIZERS =====
+_buffers = threading.local()
+
+
+def _text_buffer():
+    """Per-thread StringIO, rewound and reused for every delimited export"""
+    buffer = getattr(_buffers, "text", None)
+    if buffer is None:
+        buffer = _buffers.text = io.StringIO()
+    buffer.seek(0)
+    buffer.truncate(0)
+    return buffer
+
+
+def _delimited(rows, delimiter, lineterminator):
+    import csv
+
+    buffer = _text_buffer()
+    writer = csv.DictWriter(buffer, fieldnames=row_columns(rows), delimiter=delimiter,
+                            lineterminator=lineterminator, extrasaction="ignore")
+    writer.writeheader()
+    writer.writerows(rows)
+    return buffer.getvalue().encode("utf-8")
+
+
+def to_csv(rows):
+    return _delimited(rows, ",", "\n")
+
+
+def to_tsv(rows):
+    """Compact tab-separated export (tabs/newlines inside values become spaces)"""
+    clean = [
+        {k: v.replace("\t", " ").replace("\n", " ") if isinstance(v, str) else v for k, v in row.items()}
+        for row in rows
+    ]
+    return _delimited(clean, "\t", "\n")
+
+
+def to_json(rows):
+    import json
+
+    return json.dumps(rows, ensure_ascii=False, indent=2).encode("utf-8")
+
+
+def to_xlsx(rows):
+    """Excel workbook via pandas + openpyxl (optional dependencies, imported here)"""
+    import pandas as pd
+
+    buffer = io.BytesIO()
+    pd.DataFrame(rows, columns=row_columns(rows)).to_excel(buffer, index=False, sheet_name="Recommendations")
+    return buffer.getvalue()
+
+
+ExportFormat = namedtuple("ExportFormat", ["label", "extension", "mime", "serialize", "requires"])
+
+EXPORT_FORMATS = {
+    "csv": ExportFormat("CSV", "csv", "text/csv", to_csv, ()),
+    "json": ExportFormat("JSON", "json", "application/json", to_json, ()),
+    "tsv": ExportFormat("TSV", "tsv", "text/tab-separated-values", to_tsv, ()),
+    "xlsx": ExportFormat("Excel (XLSX)", "xlsx",
+                         "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+                         to_xlsx, ("pandas", "openpyxl")),
+}
+
+
+def available_formats():
+    """Formats whose optional dependencies are installed (checked without importing)"""
+    return [
+        name for name, fmt in EXPORT_FORMATS.items()
+        if all(find_spec(module) is not None for module in fmt.requires)
+    ]
+
+
+def export_file_name(fmt, stem=EXPORT_FILE_STEM):
+    return f"{stem}.{EXPORT_FORMATS[fmt].extension}"
+
+
+def serialize(rows, fmt="csv"):
+    return EXPORT_FORMATS[fmt].serialize(rows)
+
+
+class LazyExport:
+    """Export rows that are serialized on first request, once per format
+
+    rows can be any sequence, including one that builds its rows on first
+    iteration (service.LazyPages): nothing is built until a download.
+    """
+
+    def __init__(self, rows):
+        self.rows = rows
+        self._data = {}
+        self._lock = threading.Lock()
+        self.on_serialize = None        # called with the byte count of each newly serialized format
+
+    def __len__(self):
+        return len(self.rows)
+
+    def get(self, fmt="csv"):
+        data = self._data.get(fmt)
+        if data is None:
+            with self._lock:
+                data = self._data.get(fmt)
+                created = data is None
+                if created:
+                    with metrics.span("export"):
+                        data = self._data[fmt] = serialize(list(self.rows), fmt)
+                    metrics.count(f"exports_{fmt}")
+            callback = self.on_serialize
+            if created and callback is not None:
+                callback(len(data))
+        return data
+
+    def loader(self, fmt="csv"):
+        """Zero-argument callable producing the bytes (for st.download_button)"""
+        return lambda: self.get(fmt)
+
+    @property
+    def nbytes(self):
+        return sum(len(data) for data in self._data.values())
@@ -0,0 +1,145 @@
+"""Skill-gap analysis over precomputed job x skill bitmaps
+
+Built once per catalog from the skill index: every job has an int bitset
+of its skills and every skill an int bitset of its jobs, with job bits
+numbered by salary, best-paid first. For a user's skill set:
+
+    matched jobs         OR of the user's skill columns
+    a job's missing      its skill row AND NOT the user's skills
+    what a skill adds    its column AND NOT the matched jobs; popcount is
+                         how many jobs, the lowest set bit the best-paid
+                         one, and AND with the bits above the user's best
+                         match counts the better-paid ones
+
+Candidate skills are those the user's recommended jobs ask for, so each
+analysis is a few big-int ANDs and popcounts per candidate. The bitmaps
+take about jobs x skills / 4 bytes (both orientations); catalogs past
+MAX_BITMAP_BYTES get no gap analysis rather than gigabytes of bitmaps.
+"""
+from array import array
+from bisect import bisect_left
+from collections import namedtuple
+from collections.abc import Mapping
+
+from .bitsets import bitset, iter_bits
+
+SkillGain = namedtuple("SkillGain", ["skill", "new_jobs", "completes", "top_salary", "better_paid"])
+GapAnalysis = namedtuple("GapAnalysis", ["missing", "gains"])
+
+MAX_BITMAP_BYTES = 256 << 20
+
+
+def _negate(value):
+    return -value
+
+
+class SkillGapIndex:
+    """job -> skill and skill -> job bitmaps over one skill index"""
+
+    def __init__(self, index):
+        self.skills = index.skills
+        self.job_ids = index.job_ids
+        n_jobs = len(index.jobs)
+        order = sorted(range(n_jobs), key=lambda job_id: (-index.salary_mid[job_id], job_id))
+        self.rank = array("I", [0]) * n_jobs           # job id -> bit position (0 = best-paid)
+        for position, job_id in enumerate(order):
+            self.rank[job_id] = position
+        self.salary_mid = array("q", (index.salary_mid[job_id] for job_id in order))
+
+        job_skills = [[] for _ in range(n_jobs)]
+        self.skill_jobs = []
+        for skill_id, (job_ids, _) in enumerate(index.postings):
+            positions = [self.rank[job_id] for job_id in job_ids]
+            self.skill_jobs.append(bitset(positions))
+            for position in positions:
+                job_skills[position].append(skill_id)
+        self.job_skills = [bitset(skill_ids) for skill_ids in job_skills]
+
+    @classmethod
+    def from_catalog(cls, catalog):
+        """Gap index for a catalog, or None when its bitmaps would pass MAX_BITMAP_BYTES"""
+        index = catalog.skill_index
+        if len(index.jobs) * len(index.skills) // 4 > MAX_BITMAP_BYTES:
+            return None
+        return cls(index)
+
+    def names(self, bits):
+        return tuple(self.skills[i] for i in iter_bits(bits))
+
+    def analyze(self, skill_ids, titles=(), limit=None):
+        """GapAnalysis for a user's resolved skill ids and their recommended job titles
+
+        missing: {title: skills the job asks for that the user lacks}
+        gains:   SkillGain per skill the recommended jobs ask for, most new
+                 and completed jobs first. new_jobs would start matching,
+                 completes is how many recommended jobs it is the last
+                 missing skill of, top_salary the best new job's salary
+                 midpoint and better_paid the new jobs paying more than
+                 the user's best current match.
+        """
+        user = bitset(skill_ids)
+        matched = 0
+        for skill_id in skill_ids:
+            matched |= self.skill_jobs[skill_id]
+
+        missing = {}
+        candidates = 0
+        completes = {}
+        for title in titles:
+            job_id = self.job_ids.get(title)
+            if job_id is None:
+                continue
+            lacking = self.job_skills[self.rank[job_id]] & ~user
+            missing[title] = self.names(lacking)
+            candidates |= lacking
+            if lacking.bit_count() == 1:
+                skill_id = lacking.bit_length() - 1
+                completes[skill_id] = completes.get(skill_id, 0) + 1
+
+        # Bits of the jobs paying more than the user's best-paid match (salaries run high to low)
+        if matched:
+            best = self.salary_mid[(matched & -matched).bit_length() - 1]
+            better = (1 << bisect_left(self.salary_mid, -best, key=_negate)) - 1
+        else:
+            better = -1
+        gains = []
+        for skill_id in iter_bits(candidates):
+            new = self.skill_jobs[skill_id] & ~matched
+            top = self.salary_mid[(new & -new).bit_length() - 1] if new else None
+            gains.append(SkillGain(self.skills[skill_id], new.bit_count(), completes.get(skill_id, 0),
+                                   top, (new & better).bit_count()))
+        gains.sort(key=lambda g: (-(g.new_jobs + g.completes), -(g.top_salary or 0), g.skill))
+        return GapAnalysis(missing, gains[:limit])
+
+    def missing(self, skill_ids, titles):
+        """MissingSkills of the jobs in titles, decoded per job on first access"""
+        return MissingSkills(self, bitset(skill_ids), titles)
+
+
+class MissingSkills(Mapping):
+    """{title: skills the job asks for that the user lacks}, like GapAnalysis.missing
+
+    Names are decoded from the bitmaps only for the jobs actually looked
+    up, so a long match list costs nothing until its cards or export rows
+    are built. Any indexed job can be looked up; iteration covers titles.
+    """
+
+    def __init__(self, gaps, user, titles):
+        self.gaps = gaps
+        self.user = user
+        self.titles = titles
+        self._names = {}
+
+    def __getitem__(self, title):
+        names = self._names.get(title)
+        if names is None:
+            gaps = self.gaps
+            lacking = gaps.job_skills[gaps.rank[gaps.job_ids[title]]] & ~self.user
+            names = self._names[title] = gaps.names(lacking)
+        return names
+
+    def __iter__(self):
+        return (title for title in self.titles if title in self.gaps.job_ids)
+
+    def __len__(self):
+        return sum(1 for _ in self)
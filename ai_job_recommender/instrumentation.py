@@ -0,0 +1,198 @@
+"""Hot-path instrumentation: per-stage timing spans and counters
+
+Each click runs through the stages in STAGES; wrap a stage in
+`metrics.span("match")` and count events with `metrics.count(...)`.
+Enable with AI_JOB_RECOMMENDER_METRICS=1 (the HTTP server turns it on
+itself). While disabled, span() hands back one shared no-op context
+manager and count() returns at once, so the calls can stay in the code.
+
+Aggregates are exposed as Prometheus text (server.py's /metrics) or a
+one-line log summary; `with metrics.request() as trace:` (or
+begin_request/end_request) additionally collects the spans of a single
+request for the app's debug panel.
+"""
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+METRICS_ENV = "AI_JOB_RECOMMENDER_METRICS"
+METRIC_PREFIX = "ai_job_recommender"
+
+# Stages of one recommendation, in the order they run
+STAGES = ("extract", "parse", "match", "gaps", "plan", "enrich", "render", "export", "display")
+
+# Histogram bucket bounds, seconds
+BUCKETS = (0.0001, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5)
+
+
+class _NullSpan:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+NULL_SPAN = _NullSpan()
+
+
+class _Span:
+    __slots__ = ("metrics", "name", "start")
+
+    def __init__(self, metrics, name):
+        self.metrics = metrics
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.metrics.observe(self.name, time.perf_counter() - self.start)
+        return False
+
+
+class StageStats:
+    """Count, total, max and bucket counts of one stage's durations"""
+
+    __slots__ = ("count", "total", "max", "buckets")
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.buckets = [0] * len(BUCKETS)
+
+    def add(self, seconds):
+        self.count += 1
+        self.total += seconds
+        if seconds > self.max:
+            self.max = seconds
+        for i, bound in enumerate(BUCKETS):
+            if seconds <= bound:
+                self.buckets[i] += 1
+                break
+
+
+class RequestTrace:
+    """Spans and counters recorded during one request"""
+
+    def __init__(self):
+        self.spans = []          # (stage, seconds) in completion order
+        self.counters = {}
+
+    def stage_ms(self):
+        """{stage: total milliseconds} in STAGES order, then any others"""
+        totals = {}
+        for name, seconds in self.spans:
+            totals[name] = totals.get(name, 0.0) + seconds * 1000
+        order = [s for s in STAGES if s in totals] + [s for s in totals if s not in STAGES]
+        return {name: totals[name] for name in order}
+
+
+class Metrics:
+    """Process-wide stage timings and counters"""
+
+    def __init__(self, enabled=None):
+        if enabled is None:
+            enabled = os.environ.get(METRICS_ENV, "") not in ("", "0")
+        self.enabled = enabled
+        self.stages = {}
+        self.counters = {}
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def enable(self, enabled=True):
+        self.enabled = enabled
+
+    def span(self, name):
+        """Context manager timing one stage (shared no-op when disabled)"""
+        if not self.enabled:
+            return NULL_SPAN
+        return _Span(self, name)
+
+    def observe(self, name, seconds):
+        with self._lock:
+            stats = self.stages.get(name)
+            if stats is None:
+                stats = self.stages[name] = StageStats()
+            stats.add(seconds)
+        trace = getattr(self._local, "trace", None)
+        if trace is not None:
+            trace.spans.append((name, seconds))
+
+    def count(self, name, n=1):
+        if not self.enabled or not n:
+            return
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + n
+        trace = getattr(self._local, "trace", None)
+        if trace is not None:
+            trace.counters[name] = trace.counters.get(name, 0) + n
+
+    def begin_request(self):
+        """Start collecting this thread's spans into a RequestTrace (None when disabled)"""
+        if not self.enabled:
+            return None
+        trace = self._local.trace = RequestTrace()
+        return trace
+
+    def end_request(self):
+        self._local.trace = None
+
+    @contextmanager
+    def request(self):
+        trace = self.begin_request()
+        try:
+            yield trace
+        finally:
+            self.end_request()
+
+    def reset(self):
+        with self._lock:
+            self.stages.clear()
+            self.counters.clear()
+
+    # ===== REPORTING =====
+    def snapshot(self):
+        """{"stages": {name: {count, total_ms, mean_ms, max_ms}}, "counters": {...}}"""
+        with self._lock:
+            stages = {
+                name: {"count": s.count, "total_ms": s.total * 1000,
+                       "mean_ms": s.total * 1000 / s.count if s.count else 0.0, "max_ms": s.max * 1000}
+                for name, s in self.stages.items()
+            }
+            return {"stages": stages, "counters": dict(self.counters)}
+
+    def prometheus_text(self):
+        """Prometheus text exposition format (version 0.0.4)"""
+        name = f"{METRIC_PREFIX}_stage_seconds"
+        lines = [f"# HELP {name} Time spent per recommendation stage", f"# TYPE {name} histogram"]
+        with self._lock:
+            for stage, s in sorted(self.stages.items()):
+                cumulative = 0
+                for bound, n in zip(BUCKETS, s.buckets):
+                    cumulative += n
+                    lines.append(f'{name}_bucket{{stage="{stage}",le="{bound}"}} {cumulative}')
+                lines.append(f'{name}_bucket{{stage="{stage}",le="+Inf"}} {s.count}')
+                lines.append(f'{name}_sum{{stage="{stage}"}} {s.total:.9f}')
+                lines.append(f'{name}_count{{stage="{stage}"}} {s.count}')
+            for counter, value in sorted(self.counters.items()):
+                metric = f"{METRIC_PREFIX}_{counter}_total"
+                lines.append(f"# TYPE {metric} counter")
+                lines.append(f"{metric} {value}")
+        return "\n".join(lines) + "\n"
+
+    def log_line(self):
+        """One-line summary: stage=count/mean_ms/max_ms ... counter=value ..."""
+        snapshot = self.snapshot()
+        parts = [f"{name}={s['count']}/{s['mean_ms']:.2f}ms/{s['max_ms']:.2f}ms"
+                 for name, s in snapshot["stages"].items()]
+        parts.extend(f"{name}={value}" for name, value in sorted(snapshot["counters"].items()))
+        return "metrics " + " ".join(parts)
+
+
+metrics = Metrics()
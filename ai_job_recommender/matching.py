@@ -0,0 +1,385 @@
+"""Skill -> job matching engine backed by a precomputed inverted index
+
+Jobs and skills are interned to integer IDs. Each skill owns a postings
+list (parallel arrays of job IDs and weights) so a query only touches the
+jobs that share at least one skill with it, and top-k selection uses a
+heap instead of sorting every candidate.
+
+Top-k queries avoid walking long postings where they can. A one-skill
+query reads a cached, rank-ordered prefix of the skill's postings. A
+multi-skill query uses MaxScore like search.py: skills go rarest (highest
+weight) first, and once the k-th best score so far beats what the
+remaining skills could add, the broad skills' postings are only probed
+for the current contenders. Rankings are the same as scoring every
+posting.
+"""
+import heapq
+import math
+from array import array
+from bisect import bisect_left
+from collections import namedtuple
+from functools import cached_property
+
+from .records import AIImpact
+
+# Higher is better when used as a tie-breaker: jobs less exposed to AI first
+AI_IMPACT_RANK = {impact.label: int(impact) for impact in AIImpact}
+
+DEFAULT_TIE_BREAKERS = ("salary", "ai_impact")
+
+# Best postings kept per skill for one-skill top-k queries
+PREFIX_SIZE = 64
+
+# Binary-search contenders in a postings list once it is this many times longer
+PROBE_RATIO = 8
+
+# Score slack when pruning, so rounding can't drop a job tied with the k-th best
+PRUNE_EPSILON = 1e-9
+
+Match = namedtuple("Match", ["job", "score", "matched", "skills"])
+
+
+def normalize_skill(token):
+    """Canonical form of a raw skill token: trimmed, lower-case, single-spaced"""
+    return " ".join(token.lower().split())
+
+
+def parse_skills(text):
+    """Split comma-separated input into unique (raw, normalized) pairs"""
+    seen = set()
+    parsed = []
+    for raw in text.split(","):
+        raw = raw.strip()
+        skill = normalize_skill(raw)
+        if skill and skill not in seen:
+            seen.add(skill)
+            parsed.append((raw, skill))
+    return parsed
+
+
+class SkillIndex:
+    """Inverted index from normalized skills to weighted job postings"""
+
+    def __init__(self, jobs, skills, postings, salary_mid, ai_rank):
+        self.jobs = jobs                    # job id -> job title
+        self.skills = skills                # skill id -> normalized skill
+        self.skill_ids = {skill: i for i, skill in enumerate(skills)}
+        self.postings = postings            # skill id -> (array job ids, array weights)
+        self.salary_mid = salary_mid        # job id -> salary midpoint
+        self.ai_rank = ai_rank              # job id -> AI_IMPACT_RANK value
+
+    @cached_property
+    def max_weight(self):
+        """skill id -> its highest posting weight (what it can add to any job)"""
+        return array("d", (max(weights, default=0.0) for _, weights in self.postings))
+
+    @cached_property
+    def _prefixes(self):
+        return {}
+
+    @cached_property
+    def job_ids(self):
+        """job title -> job id (built on first use; large snapshots never need it)"""
+        return {job: i for i, job in enumerate(self.jobs)}
+
+    def __len__(self):
+        return len(self.jobs)
+
+    def __contains__(self, skill):
+        return normalize_skill(skill) in self.skill_ids
+
+    @classmethod
+    def from_skill_map(cls, skill_map, job_details=None):
+        """Build the index from {skill: [job, ...]} or {skill: {job: weight}}
+
+        Every posting is weighted by the skill's IDF, so rare skills count
+        for more than broad ones like "communication". Explicit per-job
+        weights are multiplied in. job_details ({job: Job}) supplies the
+        salary and AI-impact tie-breakers.
+        """
+        job_details = job_details or {}
+        jobs = []
+        job_ids = {}
+        skill_jobs = {}
+        for skill, entries in skill_map.items():
+            skill = normalize_skill(skill)
+            weighted = entries.items() if hasattr(entries, "items") else ((job, 1.0) for job in entries)
+            bucket = skill_jobs.setdefault(skill, {})
+            for job, weight in weighted:
+                job_id = job_ids.get(job)
+                if job_id is None:
+                    job_id = job_ids[job] = len(jobs)
+                    jobs.append(job)
+                bucket[job_id] = max(bucket.get(job_id, 0.0), float(weight))
+
+        n_jobs = len(jobs) or 1
+        skills = list(skill_jobs)
+        postings = []
+        for skill in skills:
+            bucket = skill_jobs[skill]
+            idf = math.log(1.0 + n_jobs / len(bucket)) if bucket else 0.0
+            ids = array("i", sorted(bucket))
+            weights = array("d", (bucket[j] * idf for j in ids))
+            postings.append((ids, weights))
+
+        salary_mid = array("l", [0]) * len(jobs)
+        ai_rank = array("b", [AIImpact.MEDIUM]) * len(jobs)
+        for job_id, job in enumerate(jobs):
+            record = job_details.get(job)
+            if record is not None:
+                salary_mid[job_id] = record.salary_mid
+                ai_rank[job_id] = record.ai_impact
+        return cls(jobs, skills, postings, salary_mid, ai_rank)
+
+    @classmethod
+    def from_catalog(cls, catalog):
+        return cls.from_skill_map(catalog.skill_map, catalog.job_details)
+
+    # ===== QUERYING =====
+    def lookup(self, skills):
+        """Split normalized skills into (known skill ids, unknown skills)"""
+        known, unknown = [], []
+        for skill in skills:
+            skill_id = self.skill_ids.get(skill)
+            if skill_id is None:
+                unknown.append(skill)
+            else:
+                known.append(skill_id)
+        return known, unknown
+
+    def score(self, skill_ids):
+        """Accumulate {job id: [score, matched count]} over the given skills"""
+        scores = {}
+        for skill_id in skill_ids:
+            ids, weights = self.postings[skill_id]
+            for job_id, weight in zip(ids, weights):
+                entry = scores.get(job_id)
+                if entry is None:
+                    scores[job_id] = [weight, 1]
+                else:
+                    entry[0] += weight
+                    entry[1] += 1
+        return scores
+
+    def _rank_key(self, tie_breakers):
+        salary_mid = self.salary_mid
+        ai_rank = self.ai_rank
+        use_salary = "salary" in tie_breakers
+        use_ai = "ai_impact" in tie_breakers
+
+        def key(item):
+            job_id, (score, matched) = item
+            return (
+                round(score, 9),
+                matched,
+                salary_mid[job_id] if use_salary else 0,
+                ai_rank[job_id] if use_ai else 0,
+                -job_id,
+            )
+        return key
+
+    def top_k(self, skills, k=None, tie_breakers=DEFAULT_TIE_BREAKERS):
+        """Best k matches for normalized skills; k=None returns all, ranked"""
+        skill_ids, _ = self.lookup(skills)
+        return self.rank(skill_ids, k, tie_breakers)
+
+    def rank(self, skill_ids, k=None, tie_breakers=DEFAULT_TIE_BREAKERS):
+        if k is None:
+            scores = self.score(skill_ids)
+        elif len(skill_ids) == 1 and k <= PREFIX_SIZE and tuple(tie_breakers) == DEFAULT_TIE_BREAKERS:
+            scores = self.prefix_scores(skill_ids[0])
+        else:
+            scores = self.top_k_scores(skill_ids, k)
+        return self.rank_scores(scores, skill_ids, k, tie_breakers)
+
+    @cached_property
+    def tie_order(self):
+        """job id -> position when ranked by the default tie-breakers alone (best first)"""
+        order = sorted(range(len(self.jobs)), key=lambda j: (-self.salary_mid[j], -self.ai_rank[j], j))
+        positions = array("i", [0]) * len(self.jobs)
+        for position, job_id in enumerate(order):
+            positions[job_id] = position
+        return positions
+
+    def prefix_scores(self, skill_id):
+        """{job id: [score, 1]} for a skill's PREFIX_SIZE best-ranked postings, cached per skill"""
+        prefix = self._prefixes.get(skill_id)
+        if prefix is None:
+            ids, weights = self.postings[skill_id]
+            if weights and min(weights) == max(weights):
+                # Equal weights (an unweighted skill map): only the tie-breakers order the postings
+                best = heapq.nsmallest(PREFIX_SIZE, ids, key=self.tie_order.__getitem__)
+                prefix = [(job_id, (weights[0], 1)) for job_id in best]
+            else:
+                entries = ((job_id, (weight, 1)) for job_id, weight in zip(ids, weights))
+                prefix = heapq.nlargest(PREFIX_SIZE, entries, key=self._rank_key(DEFAULT_TIE_BREAKERS))
+            self._prefixes[skill_id] = prefix
+        return {job_id: list(entry) for job_id, entry in prefix}
+
+    def top_k_scores(self, skill_ids, k):
+        """{job id: [score, matched]} holding at least the k best jobs (MaxScore)
+
+        Every returned entry is complete, so rank_scores over it gives the
+        same top k as over score(skill_ids).
+        """
+        # Highest-weighted (rarest) skills first; rest[i] caps what skills[i:] can still add
+        skills = sorted(skill_ids, key=lambda s: self.max_weight[s], reverse=True)
+        rest = [0.0] * (len(skills) + 1)
+        for i in range(len(skills) - 1, -1, -1):
+            rest[i] = rest[i + 1] + self.max_weight[skills[i]]
+        scores = {}
+        for i, skill_id in enumerate(skills):
+            if len(scores) >= k:
+                threshold = heapq.nlargest(k, (entry[0] for entry in scores.values()))[-1] - PRUNE_EPSILON
+                if rest[i] < threshold:
+                    # No job outside scores can reach the top k: finish scoring the contenders only
+                    scores = {j: entry for j, entry in scores.items() if entry[0] + rest[i] >= threshold}
+                    for remaining in skills[i:]:
+                        self._add_to(scores, remaining)
+                    return scores
+            ids, weights = self.postings[skill_id]
+            for job_id, weight in zip(ids, weights):
+                entry = scores.get(job_id)
+                if entry is None:
+                    scores[job_id] = [weight, 1]
+                else:
+                    entry[0] += weight
+                    entry[1] += 1
+        return scores
+
+    def _add_to(self, scores, skill_id):
+        """Add one skill's postings to the jobs already in scores"""
+        ids, weights = self.postings[skill_id]
+        if len(ids) > len(scores) * PROBE_RATIO:
+            # Long postings, few contenders: binary-search each contender
+            end = len(ids)
+            for job_id, entry in scores.items():
+                i = bisect_left(ids, job_id)
+                if i < end and ids[i] == job_id:
+                    entry[0] += weights[i]
+                    entry[1] += 1
+        else:
+            for job_id, weight in zip(ids, weights):
+                entry = scores.get(job_id)
+                if entry is not None:
+                    entry[0] += weight
+                    entry[1] += 1
+
+    def rank_scores(self, scores, skill_ids, k=None, tie_breakers=DEFAULT_TIE_BREAKERS):
+        """Rank an already accumulated {job id: [score, matched]} mapping"""
+        key = self._rank_key(tie_breakers)
+        if k is None or k >= len(scores):
+            ranked = sorted(scores.items(), key=key, reverse=True)
+        else:
+            ranked = heapq.nlargest(k, scores.items(), key=key)
+        return [self._match(job_id, score, matched, skill_ids)
+                for job_id, (score, matched) in ranked]
+
+    def _match(self, job_id, score, matched, skill_ids):
+        matched_skills = tuple(
+            self.skills[s] for s in skill_ids if _contains(self.postings[s][0], job_id)
+        )
+        return Match(self.jobs[job_id], score, matched, matched_skills)
+
+    def resolve(self, text, normalizer=None):
+        """Map comma-separated input to (skill ids, unknown raw skills, corrections)
+
+        Tokens that aren't exact skills go through the optional normalizer
+        (see normalizer.SkillNormalizer); corrections maps each such raw
+        token to its Resolution.
+        """
+        skill_ids = []
+        unknown = []
+        corrections = {}
+        for raw, skill in parse_skills(text):
+            skill_id = self.skill_ids.get(skill)
+            if skill_id is None and normalizer is not None:
+                resolution = normalizer.resolve(skill)
+                if resolution.skill is not None:
+                    skill_id = self.skill_ids.get(resolution.skill)
+                    if skill_id is not None:
+                        corrections[raw] = resolution
+            if skill_id is None:
+                unknown.append(raw)
+            elif skill_id not in skill_ids:
+                skill_ids.append(skill_id)
+        return skill_ids, unknown, corrections
+
+    def recommend(self, text, k=None, tie_breakers=DEFAULT_TIE_BREAKERS, normalizer=None):
+        """Parse comma-separated input and return (ranked matches, unknown raw skills)"""
+        skill_ids, unknown, _ = self.resolve(text, normalizer)
+        return self.rank(skill_ids, k, tie_breakers), unknown
+
+    def incremental(self, skill_ids=()):
+        return IncrementalRanking(self, skill_ids)
+
+
+class IncrementalRanking:
+    """Accumulated scores for a skill set that changes a few skills at a time
+
+    Adding or removing a skill walks only that skill's postings, so an
+    edit costs O(postings of the changed skill) instead of rescoring the
+    whole set. rank() returns what SkillIndex.rank would for skill_ids.
+    """
+
+    def __init__(self, index, skill_ids=()):
+        self.index = index
+        self.skill_ids = []
+        self.scores = {}        # job id -> [score, matched count]
+        self.update(skill_ids)
+
+    def __len__(self):
+        return len(self.skill_ids)
+
+    def add(self, skill_id):
+        """Add one skill's contributions; False if it was already in the set"""
+        if skill_id in self.skill_ids:
+            return False
+        scores = self.scores
+        ids, weights = self.index.postings[skill_id]
+        for job_id, weight in zip(ids, weights):
+            entry = scores.get(job_id)
+            if entry is None:
+                scores[job_id] = [weight, 1]
+            else:
+                entry[0] += weight
+                entry[1] += 1
+        self.skill_ids.append(skill_id)
+        return True
+
+    def remove(self, skill_id):
+        """Subtract one skill's contributions; False if it wasn't in the set"""
+        if skill_id not in self.skill_ids:
+            return False
+        scores = self.scores
+        ids, weights = self.index.postings[skill_id]
+        for job_id, weight in zip(ids, weights):
+            entry = scores[job_id]
+            if entry[1] == 1:
+                del scores[job_id]
+            else:
+                entry[0] -= weight
+                entry[1] -= 1
+        self.skill_ids.remove(skill_id)
+        return True
+
+    def update(self, skill_ids):
+        """Move to a new skill set by applying only the difference; returns (added, removed)"""
+        target = list(dict.fromkeys(skill_ids))
+        wanted = set(target)
+        removed = [s for s in self.skill_ids if s not in wanted]
+        for skill_id in removed:
+            self.remove(skill_id)
+        added = [s for s in target if self.add(s)]
+        # Keep the caller's order so matched skills list like a full rank()
+        self.skill_ids = target
+        return added, removed
+
+    def rank(self, k=None, tie_breakers=DEFAULT_TIE_BREAKERS):
+        return self.index.rank_scores(self.scores, self.skill_ids, k, tie_breakers)
+
+
+def _contains(sorted_ids, job_id):
+    """Binary search in a sorted postings array"""
+    i = bisect_left(sorted_ids, job_id)
+    return i < len(sorted_ids) and sorted_ids[i] == job_id
@@ -0,0 +1,364 @@
+"""Offline skill-map builder: mine a corpus of job postings into a catalog
+
+    python -m ai_job_recommender build-skill-map postings.jsonl -o mined.json --workers 4
+
+Stages, each timed and reported at the end:
+
+    read     stream postings from JSONL or CSV in chunks (the file is never loaded whole)
+    extract  worker processes find skill mentions in each posting (extraction.py)
+    spill    (skill, job) mention counts are summed in memory; past --max-pairs
+             distinct pairs they are written out as a sorted run file
+    merge    the sorted runs are merged line by line (heapq.merge), so memory
+             stays bounded by --max-pairs however large the corpus is (only
+             per-job totals, one entry per distinct title, stay in memory)
+    write    the weighted skill -> job map is written in the catalog JSON format
+
+A skill's weight for a job is the share of that job's postings that
+mention it. Pairs below --min-share, and jobs with fewer than
+--min-postings postings, are dropped. Jobs already in the base catalog
+keep its details; other jobs get their average posted salary and first
+seen description.
+"""
+import csv
+import heapq
+import json
+import os
+import sys
+import tempfile
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+from .catalog import DEFAULT_CATALOG_PATH, get_catalog
+from .extraction import SkillExtractor
+from .instrumentation import Metrics
+from .matching import normalize_skill
+
+DEFAULT_CHUNK_SIZE = 2000
+DEFAULT_MAX_PAIRS = 2_000_000
+DEFAULT_MIN_SHARE = 0.1
+DEFAULT_MIN_POSTINGS = 3
+DEFAULT_AI_IMPACT = "Medium"
+DESCRIPTION_CHARS = 300
+MERGE_FAN_IN = 64             # run files open at once during a merge pass
+
+STAGE_ORDER = ("read", "extract", "spill", "merge", "write", "total")
+
+TITLE_FIELDS = ("title", "job_title", "job", "position")
+TEXT_FIELDS = ("description", "text", "requirements", "skills", "qualifications")
+
+
+# ===== READING =====
+def read_postings(path, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Yield (chunk, bytes read) of raw postings: JSONL lines (parsed by workers) or CSV rows"""
+    is_csv = os.path.splitext(path)[1].lower() == ".csv"
+    with open(path, "r", encoding="utf-8", newline="" if is_csv else None) as f:
+        rows = csv.DictReader(f) if is_csv else (line for line in f if line.strip())
+        chunk = []
+        size = 0
+        for row in rows:
+            chunk.append(row)
+            size += len(row) if not is_csv else sum(len(v or "") for v in row.values())
+            if len(chunk) >= chunk_size:
+                yield chunk, size
+                chunk, size = [], 0
+        if chunk:
+            yield chunk, size
+
+
+def _first(record, fields):
+    for field in fields:
+        value = record.get(field)
+        if value:
+            return value
+    return None
+
+
+def _text(value):
+    """Text of a posting field: strings as is, lists joined, other scalars via str(), objects dropped"""
+    if isinstance(value, str):
+        return value
+    if isinstance(value, (list, tuple)):
+        return " ".join(_text(item) for item in value if item)
+    if isinstance(value, dict):
+        return ""
+    return str(value)
+
+
+def _salary(value):
+    try:
+        return int(float(value))
+    except (TypeError, ValueError):
+        return None
+
+
+# ===== EXTRACTION (worker processes) =====
+_extractor = None
+
+
+def _init_worker(names):
+    global _extractor
+    _extractor = SkillExtractor(names)
+
+
+def mine_chunk(chunk):
+    """(pair counts, job stats, skipped postings, seconds) for one chunk of raw postings
+
+    pair counts: {(skill, job key): postings mentioning the skill}
+    job stats:   {job key: [postings, salary_min sum, salary_max sum, salaried, title, description]}
+    """
+    start = time.process_time()
+    pairs = {}
+    jobs = {}
+    skipped = 0
+    for raw in chunk:
+        try:
+            record = json.loads(raw) if isinstance(raw, str) else raw
+        except ValueError:
+            record = None
+        title = _first(record, TITLE_FIELDS) if isinstance(record, dict) else None
+        if not isinstance(title, str) or not title.strip():
+            skipped += 1
+            continue
+        title = " ".join(title.split())
+        key = title.casefold()
+        text = " ".join(_text(v) for v in (record.get(field) for field in TEXT_FIELDS) if v)
+        stats = jobs.get(key)
+        if stats is None:
+            stats = jobs[key] = [0, 0, 0, 0, title, text[:DESCRIPTION_CHARS]]
+        stats[0] += 1
+        low, high = _salary(record.get("salary_min")), _salary(record.get("salary_max"))
+        if low is not None and high is not None:
+            stats[1] += low
+            stats[2] += high
+            stats[3] += 1
+        for skill in _extractor.extract(text):
+            pairs[(skill, key)] = pairs.get((skill, key), 0) + 1
+    return pairs, jobs, skipped, time.process_time() - start
+
+
+def mine_chunks(chunks, names, workers=1):
+    """Yield mine_chunk results in input order, keeping at most 2 x workers chunks in flight"""
+    if workers <= 1:
+        _init_worker(names)
+        for chunk in chunks:
+            yield mine_chunk(chunk)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(names,)) as pool:
+        pending = deque()
+        for chunk in chunks:
+            pending.append(pool.submit(mine_chunk, chunk))
+            if len(pending) >= workers * 2:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+# ===== SPILL AND MERGE =====
+def write_run(triples, directory):
+    """Write sorted (skill, job key, count) triples as a run file; returns its path"""
+    fd, path = tempfile.mkstemp(suffix=".run", dir=directory)
+    with os.fdopen(fd, "w", encoding="utf-8") as f:
+        f.writelines(f"{skill}\t{job}\t{count}\n" for skill, job, count in triples)
+    return path
+
+
+def spill_run(pairs, directory):
+    """Write summed pair counts as a sorted run file; returns its path"""
+    return write_run(((skill, job, count) for (skill, job), count in sorted(pairs.items())), directory)
+
+
+def read_run(path):
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            skill, job, count = line.rstrip("\n").split("\t")
+            yield skill, job, int(count)
+
+
+def merge_runs(paths, directory=None, fan_in=MERGE_FAN_IN):
+    """Yield (skill, job key, total count) in sorted order across all runs
+
+    With more than fan_in runs, groups of them are first merged into
+    bigger runs, so the number of open files stays bounded.
+    """
+    paths = list(paths)
+    while len(paths) > fan_in:
+        group, paths = paths[:fan_in], paths[fan_in:]
+        merged = write_run(merge_runs(group), directory)
+        for path in group:
+            os.remove(path)
+        paths.append(merged)
+    current, total = None, 0
+    for skill, job, count in heapq.merge(*(read_run(path) for path in paths)):
+        if (skill, job) != current:
+            if current is not None:
+                yield current[0], current[1], total
+            current, total = (skill, job), 0
+        total += count
+    if current is not None:
+        yield current[0], current[1], total
+
+
+# ===== BUILDER =====
+class SkillMapBuilder:
+    """Streams a postings corpus through the stages into a catalog dict"""
+
+    def __init__(self, base=None, extra_skills=(), workers=1, chunk_size=DEFAULT_CHUNK_SIZE,
+                 max_pairs=DEFAULT_MAX_PAIRS, min_share=DEFAULT_MIN_SHARE,
+                 min_postings=DEFAULT_MIN_POSTINGS, temp_dir=None):
+        self.base = base if base is not None else get_catalog()
+        self.names = dict(self.base.skill_extractor.names)
+        for skill in extra_skills:
+            skill = normalize_skill(skill)
+            if skill:
+                self.names.setdefault(skill, skill)
+        self.workers = workers
+        self.chunk_size = chunk_size
+        self.max_pairs = max_pairs
+        self.min_share = min_share
+        self.min_postings = min_postings
+        self.temp_dir = temp_dir
+        self.stats = Metrics(enabled=True)
+        self._base_titles = {title.casefold(): title for title in self.base.job_details}
+
+    def _timed_chunks(self, path):
+        """read_postings, with the time spent reading recorded as the read stage"""
+        chunks = read_postings(path, self.chunk_size)
+        while True:
+            start = time.perf_counter()
+            item = next(chunks, None)
+            if item is None:
+                return
+            chunk, size = item
+            self.stats.observe("read", time.perf_counter() - start)
+            self.stats.count("postings", len(chunk))
+            self.stats.count("bytes", size)
+            yield chunk
+
+    def build(self, path):
+        """Catalog dict (the bundled catalog.json format) mined from a postings file"""
+        started = time.perf_counter()
+        jobs = {}
+        pairs = {}
+        with tempfile.TemporaryDirectory(dir=self.temp_dir) as directory:
+            runs = []
+            mined = mine_chunks(self._timed_chunks(path), self.names, self.workers)
+            for chunk_pairs, chunk_jobs, skipped, seconds in mined:
+                self.stats.observe("extract", seconds)
+                self.stats.count("skipped", skipped)
+                start = time.perf_counter()
+                for key, (n, low, high, salaried, title, description) in chunk_jobs.items():
+                    stats = jobs.get(key)
+                    if stats is None:
+                        jobs[key] = [n, low, high, salaried, title, description]
+                    else:
+                        stats[0] += n
+                        stats[1] += low
+                        stats[2] += high
+                        stats[3] += salaried
+                for pair, count in chunk_pairs.items():
+                    pairs[pair] = pairs.get(pair, 0) + count
+                self.stats.count("mentions", sum(chunk_pairs.values()))
+                if len(pairs) >= self.max_pairs:
+                    runs.append(spill_run(pairs, directory))
+                    self.stats.count("spilled_pairs", len(pairs))
+                    pairs = {}
+                self.stats.observe("spill", time.perf_counter() - start)
+            start = time.perf_counter()
+            if pairs or not runs:
+                runs.append(spill_run(pairs, directory))
+                self.stats.count("spilled_pairs", len(pairs))
+            self.stats.count("runs", len(runs))
+            self.stats.observe("spill", time.perf_counter() - start)
+            pairs = None
+
+            start = time.perf_counter()
+            skill_map = self._weights(merge_runs(runs, directory), jobs)
+            self.stats.observe("merge", time.perf_counter() - start)
+        catalog = self._catalog(skill_map, jobs)
+        self.stats.observe("total", time.perf_counter() - started)
+        return catalog
+
+    def _title(self, key, jobs):
+        """Display title of a job key: the base catalog's spelling if it has the job"""
+        return self._base_titles.get(key) or jobs[key][4]
+
+    def _weights(self, merged, jobs):
+        skill_map = {}
+        for skill, key, count in merged:
+            postings = jobs[key][0]
+            share = count / postings
+            if postings < self.min_postings or share < self.min_share:
+                continue
+            title = self._title(key, jobs)
+            skill_map.setdefault(skill, {})[title] = round(share, 4)
+        return skill_map
+
+    def _catalog(self, skill_map, jobs):
+        base_details = self.base.job_details
+        titles = {title for weights in skill_map.values() for title in weights}
+        job_details = {}
+        for key, (n, low, high, salaried, _, description) in jobs.items():
+            title = self._title(key, jobs)
+            if title not in titles:
+                continue
+            if title in base_details:
+                job_details[title] = base_details[title].to_dict()
+            else:
+                salary = [low // salaried, high // salaried] if salaried else [0, 0]
+                job_details[title] = {"description": description, "salary": salary,
+                                      "certificates": [], "ai_impact": DEFAULT_AI_IMPACT}
+        return {
+            "version": self.base.version,
+            "skill_map": skill_map,
+            "skill_aliases": dict(self.base.skill_aliases),
+            "job_details": job_details,
+            "career_paths": [dict(p) for p in self.base.career_paths],
+        }
+
+    def write(self, catalog, output):
+        start = time.perf_counter()
+        with open(output, "w", encoding="utf-8") as f:
+            json.dump(catalog, f, indent=2, ensure_ascii=False)
+        self.stats.observe("write", time.perf_counter() - start)
+
+    def report(self):
+        """Per-stage seconds and throughput, one line per stage"""
+        snapshot = self.stats.snapshot()
+        stages, counters = snapshot["stages"], snapshot["counters"]
+        units = {
+            "read": (counters.get("postings", 0), "postings"),
+            "extract": (counters.get("postings", 0), "postings"),
+            "total": (counters.get("postings", 0), "postings"),
+            "spill": (counters.get("spilled_pairs", 0), "pairs"),
+            "merge": (counters.get("spilled_pairs", 0), "pairs"),
+        }
+        lines = ["===== SKILL MAP BUILD ====="]
+        for name in STAGE_ORDER:
+            if name not in stages:
+                continue
+            seconds = stages[name]["total_ms"] / 1000
+            line = f"{name:<8} {seconds:8.2f}s"
+            if name in units:
+                items, unit = units[name]
+                line += f"   {items / seconds if seconds else 0:12,.0f} {unit}/s"
+            if name == "read":
+                line += f"   {counters.get('bytes', 0) / seconds / 1e6 if seconds else 0:8.1f} MB/s"
+            if name == "extract":
+                line += "   (CPU time summed over workers)"
+            if name == "total":
+                line += "   (wall clock, before write)"
+            lines.append(line)
+        lines.append(f"postings {counters.get('postings', 0):,} ({counters.get('skipped', 0):,} without a title "
+                     f"or unreadable), mentions {counters.get('mentions', 0):,}, runs {counters.get('runs', 0)}")
+        return "\n".join(lines)
+
+
+def build_skill_map(corpus, output, base_path=DEFAULT_CATALOG_PATH, extra_skills=(), stream=None, **options):
+    """Mine corpus into a catalog file at output; returns the catalog dict"""
+    builder = SkillMapBuilder(get_catalog(base_path), extra_skills, **options)
+    catalog = builder.build(corpus)
+    builder.write(catalog, output)
+    print(builder.report(), file=stream or sys.stderr)
+    return catalog
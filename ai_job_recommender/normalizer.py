@@ -0,0 +1,111 @@
+"""Resolve free-typed skill tokens to canonical catalog skills
+
+Resolution order: exact key, alias table, punctuation/version-insensitive
+key, then fuzzy matching. Fuzzy candidates come from a precomputed
+character-trigram index, so only skills sharing trigrams with the token
+are compared instead of scanning the whole vocabulary.
+"""
+import heapq
+import re
+from collections import namedtuple
+from difflib import SequenceMatcher
+from functools import lru_cache
+
+from .matching import normalize_skill
+
+Resolution = namedtuple("Resolution", ["skill", "confidence", "method"])
+
+UNRESOLVED = Resolution(None, 0.0, "unknown")
+
+# Confidence reported for non-fuzzy resolutions
+EXACT_CONFIDENCE = 1.0
+ALIAS_CONFIDENCE = 0.95
+COMPACT_CONFIDENCE = 0.9
+
+FUZZY_THRESHOLD = 0.75
+FUZZY_CANDIDATES = 8
+CACHE_SIZE = 4096
+
+_SEPARATORS = re.compile(r"[\s._\-/]+")
+_TRAILING_VERSION = re.compile(r"(?<=[a-z])v?\d+$")
+
+
+def compact_key(skill):
+    """Key that ignores separators and trailing versions ("Node JS", "python3")"""
+    key = _SEPARATORS.sub("", skill.lower())
+    return _TRAILING_VERSION.sub("", key) or key
+
+
+def trigrams(text):
+    """Padded character trigrams of a string"""
+    padded = f"  {text} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class SkillNormalizer:
+    """Maps raw tokens to (canonical skill, confidence, method)"""
+
+    def __init__(self, skills, aliases=None, threshold=FUZZY_THRESHOLD, cache_size=CACHE_SIZE):
+        self.skills = frozenset(normalize_skill(s) for s in skills)
+        self.aliases = {}
+        for alias, skill in (aliases or {}).items():
+            skill = normalize_skill(skill)
+            if skill in self.skills:
+                self.aliases[normalize_skill(alias)] = skill
+        self.threshold = threshold
+
+        # Every spelling we know about (canonical names and aliases) -> canonical
+        names = {skill: skill for skill in self.skills}
+        names.update(self.aliases)
+        self.compact = {}
+        for name, skill in names.items():
+            self.compact.setdefault(compact_key(name), skill)
+
+        # Trigram -> ids of the names that contain it
+        self.names = list(names)
+        self.name_skills = [names[n] for n in self.names]
+        self.trigram_index = {}
+        for name_id, name in enumerate(self.names):
+            for gram in trigrams(name):
+                self.trigram_index.setdefault(gram, []).append(name_id)
+
+        self.resolve = lru_cache(maxsize=cache_size)(self._resolve)
+
+    @classmethod
+    def from_catalog(cls, catalog, **kwargs):
+        return cls(catalog.skill_map.keys(), catalog.skill_aliases, **kwargs)
+
+    def _resolve(self, token):
+        skill = normalize_skill(token)
+        if not skill:
+            return UNRESOLVED
+        if skill in self.skills:
+            return Resolution(skill, EXACT_CONFIDENCE, "exact")
+        if skill in self.aliases:
+            return Resolution(self.aliases[skill], ALIAS_CONFIDENCE, "alias")
+        compact = self.compact.get(compact_key(skill))
+        if compact is not None:
+            return Resolution(compact, COMPACT_CONFIDENCE, "compact")
+        return self.fuzzy(skill)
+
+    def fuzzy(self, skill):
+        """Best fuzzy match among names sharing the most trigrams with skill"""
+        shared = {}
+        for gram in trigrams(skill):
+            for name_id in self.trigram_index.get(gram, ()):
+                shared[name_id] = shared.get(name_id, 0) + 1
+        if not shared:
+            return UNRESOLVED
+
+        candidates = heapq.nlargest(FUZZY_CANDIDATES, shared, key=shared.get)
+        best_id, best_ratio = None, 0.0
+        for name_id in candidates:
+            ratio = SequenceMatcher(None, skill, self.names[name_id]).ratio()
+            if ratio > best_ratio:
+                best_id, best_ratio = name_id, ratio
+        if best_ratio < self.threshold:
+            return UNRESOLVED
+        return Resolution(self.name_skills[best_id], round(best_ratio, 3), "fuzzy")
+
+    def cache_info(self):
+        return self.resolve.cache_info()
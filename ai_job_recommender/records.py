@@ -0,0 +1,83 @@
+"""Compact per-job records
+
+A catalog can hold hundreds of thousands of jobs, so each one is a
+__slots__ record rather than a dict of description/salary/certificates/
+ai_impact: no per-job __dict__ or repeated keys, the salary range is two
+ints, AI impact is a shared enum member and certificate names are
+interned so every job naming "CISSP" points at one string.
+"""
+import sys
+from enum import IntEnum
+
+
+class AIImpact(IntEnum):
+    """Exposure of a job to AI; the value is the ranking tie-breaker (higher is better)"""
+    HIGH = 0
+    MEDIUM = 1
+    LOW = 2
+
+    @property
+    def label(self):
+        return self.name.title()
+
+    def __str__(self):
+        return self.label
+
+    @classmethod
+    def parse(cls, value):
+        """AIImpact from a member or a label such as "High" (case-insensitive)"""
+        if isinstance(value, cls):
+            return value
+        try:
+            return cls[str(value).strip().upper()]
+        except KeyError:
+            raise ValueError(f"Unknown AI impact {value!r} (expected High, Medium or Low)") from None
+
+
+class Job:
+    """One job posting's details"""
+
+    __slots__ = ("title", "description", "salary_min", "salary_max", "certificates", "ai_impact")
+
+    def __init__(self, title, description, salary_min, salary_max, certificates=(), ai_impact=AIImpact.MEDIUM):
+        self.title = sys.intern(title)
+        self.description = description
+        self.salary_min = int(salary_min)
+        self.salary_max = int(salary_max)
+        self.certificates = tuple(sys.intern(c) for c in certificates)
+        self.ai_impact = AIImpact.parse(ai_impact)
+
+    @property
+    def salary(self):
+        return (self.salary_min, self.salary_max)
+
+    @property
+    def salary_mid(self):
+        return (self.salary_min + self.salary_max) // 2
+
+    def __eq__(self, other):
+        if not isinstance(other, Job):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in self.__slots__)
+
+    __hash__ = None
+
+    def __repr__(self):
+        return (f"Job({self.title!r}, salary={self.salary_min}-{self.salary_max}, "
+                f"ai_impact={self.ai_impact.label})")
+
+    @classmethod
+    def from_dict(cls, title, details):
+        """Record from the catalog's JSON layout ({"description", "salary", ...})"""
+        low, high = details["salary"]
+        return cls(title, details["description"], low, high,
+                   details.get("certificates", ()), details["ai_impact"])
+
+    def to_dict(self):
+        """Inverse of from_dict (without the title, which is the catalog key)"""
+        return {
+            "description": self.description,
+            "salary": [self.salary_min, self.salary_max],
+            "certificates": list(self.certificates),
+            "ai_impact": self.ai_impact.label,
+        }
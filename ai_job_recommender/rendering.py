@@ -0,0 +1,238 @@
+"""Job card rendering with a compiled, mtime-cached HTML template"""
+import os
+import re
+import threading
+import time
+from html import escape
+
+from .salaries import salary_percentage
+
+# ===== TEMPLATE LOCATION =====
+APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# The repo ships "job.card.html"; "job_card.html" is accepted for older checkouts
+TEMPLATE_CANDIDATES = ("job_card.html", "job.card.html")
+
+PLACEHOLDER_PATTERN = re.compile(r"\b([A-Z][A-Z_]*_PLACEHOLDER)\b")
+BODY_PATTERN = re.compile(r"<body[^>]*>(.*)</body>", re.S | re.I)
+STRIP_PATTERN = re.compile(r"<script\b.*?</script>|<style\b.*?</style>|<!--.*?-->", re.S | re.I)
+
+# Cards sent per page; further pages are rendered on demand
+CARDS_PER_PAGE = 10
+
+# ===== AI IMPACT STYLING =====
+AI_IMPACT_STYLES = {
+    "High": ("#ff6b6b", "🔴"),
+    "Medium": ("#ffa726", "🟠"),
+    "Low": ("#4CAF50", "🟢"),
+}
+
+STYLESHEET = "styles.css"
+
+
+def resolve_template_path(file_name=None):
+    """Return the absolute path of the job card template, or None if missing"""
+    candidates = (file_name,) if file_name else TEMPLATE_CANDIDATES
+    for name in candidates:
+        path = name if os.path.isabs(name) else os.path.join(APP_DIR, name)
+        if os.path.exists(path):
+            return path
+    return None
+
+
+def card_fragment(source):
+    """Card markup to embed: <body> content minus scripts, styles and comments
+
+    Card CSS lives in styles.css (loaded once per page), so nothing but
+    the card itself is sent per job. Lines are flattened so Markdown sees
+    one HTML block.
+    """
+    body = BODY_PATTERN.search(source)
+    html = STRIP_PATTERN.sub("", body.group(1) if body else source)
+    return "\n".join(line.strip() for line in html.splitlines() if line.strip())
+
+
+# ===== COMPILED TEMPLATE =====
+class CompiledTemplate:
+    """Template pre-split into literal segments and placeholder slots"""
+
+    __slots__ = ("path", "mtime", "parts", "slots")
+
+    def __init__(self, source, path=None, mtime=None):
+        self.path = path
+        self.mtime = mtime
+        # re.split with a capture group alternates literal, name, literal, ...
+        self.parts = PLACEHOLDER_PATTERN.split(source)
+        self.slots = tuple((i, self.parts[i]) for i in range(1, len(self.parts), 2))
+
+    @property
+    def placeholders(self):
+        return {name for _, name in self.slots}
+
+    def render(self, values):
+        """Fill every slot in one pass; unknown placeholders are left as-is"""
+        parts = self.parts[:]
+        for i, name in self.slots:
+            if name in values:
+                parts[i] = str(values[name])
+        return "".join(parts)
+
+
+_template_cache = {}
+_template_lock = threading.Lock()
+
+
+def compile_template(path):
+    """Read and compile a template file"""
+    mtime = os.stat(path).st_mtime_ns
+    with open(path, "r", encoding="utf-8") as f:
+        source = f.read()
+    render_stats["compiles"] += 1
+    return CompiledTemplate(card_fragment(source), path=path, mtime=mtime)
+
+
+def get_template(file_name=None):
+    """Return the compiled template, recompiling only when the file's mtime changes"""
+    path = resolve_template_path(file_name)
+    if path is None:
+        return None
+    try:
+        mtime = os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+    template = _template_cache.get(path)
+    if template is not None and template.mtime == mtime:
+        return template
+    with _template_lock:
+        template = _template_cache.get(path)
+        if template is None or template.mtime != mtime:
+            template = compile_template(path)
+            _template_cache[path] = template
+    return template
+
+
+def clear_template_cache():
+    """Drop all compiled templates (next render recompiles from disk)"""
+    with _template_lock:
+        _template_cache.clear()
+
+
+# ===== RENDER STATS & TIMING HOOKS =====
+render_stats = {"renders": 0, "compiles": 0, "seconds": 0.0}
+_render_hooks = []
+
+
+def add_render_hook(hook):
+    """Register hook(job, seconds) to be called after every card render"""
+    _render_hooks.append(hook)
+    return hook
+
+
+def remove_render_hook(hook):
+    if hook in _render_hooks:
+        _render_hooks.remove(hook)
+
+
+def reset_render_stats():
+    render_stats.update(renders=0, compiles=0, seconds=0.0)
+
+
+def read_stylesheet(file_name=STYLESHEET):
+    """Text of a stylesheet next to main.py, or None if it is missing"""
+    path = file_name if os.path.isabs(file_name) else os.path.join(APP_DIR, file_name)
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return f.read()
+    except OSError:
+        return None
+
+
+# ===== CARD RENDERING =====
+def ai_impact_style(job):
+    """(label, color, icon) for a job's AI impact badge"""
+    label = job.ai_impact.label
+    color, icon = AI_IMPACT_STYLES.get(label, AI_IMPACT_STYLES["Low"])
+    return label, color, icon
+
+
+def shared_salary_scale():
+    """Highest salary midpoint of the shared catalog (the salary bar's 100%)"""
+    from .catalog import get_catalog
+    return get_catalog().salary_stats.max_mid
+
+
+def missing_skills_text(missing_skills):
+    """Card/export text for a job's missing skills (None when there is no gap analysis)"""
+    if missing_skills is None:
+        return "—"
+    return ", ".join(missing_skills) if missing_skills else "✅ You have them all"
+
+
+def card_values(job, salary_scale=None, missing_skills=None):
+    """Build the placeholder -> value mapping for one job card
+
+    Catalog text is HTML-escaped: catalogs can come from user-supplied
+    files and the cards are shown with unsafe_allow_html.
+    """
+    ai_impact, ai_color, ai_icon = ai_impact_style(job)
+    if salary_scale is None:
+        salary_scale = shared_salary_scale()
+
+    return {
+        "JOB_TITLE_PLACEHOLDER": escape(job.title),
+        "JOB_DESCRIPTION_PLACEHOLDER": escape(job.description),
+        "MIN_SALARY_PLACEHOLDER": f"{job.salary_min:,}",
+        "MAX_SALARY_PLACEHOLDER": f"{job.salary_max:,}",
+        "SALARY_PERCENTAGE_PLACEHOLDER": str(salary_percentage(job, salary_scale)),
+        "CERTIFICATES_PLACEHOLDER": escape(", ".join(job.certificates)),
+        "MISSING_SKILLS_PLACEHOLDER": escape(missing_skills_text(missing_skills)),
+        "AI_IMPACT_PLACEHOLDER": escape(ai_impact),
+        "AI_COLOR_PLACEHOLDER": ai_color,
+        "AI_ICON_PLACEHOLDER": ai_icon,
+        "CAREER_LEVEL_PLACEHOLDER": "Intermediate",
+        "LOCATION_PLACEHOLDER": "UAE (Remote/On-site)"
+    }
+
+
+def create_job_card_html(job, template=None, salary_scale=None, missing_skills=None):
+    """Create HTML job card for a Job record using the compiled template"""
+    if template is None:
+        template = get_template()
+    if template is None:
+        return None
+
+    start = time.perf_counter()
+    html = template.render(card_values(job, salary_scale, missing_skills))
+    elapsed = time.perf_counter() - start
+
+    render_stats["renders"] += 1
+    render_stats["seconds"] += elapsed
+    for hook in _render_hooks:
+        hook(job, elapsed)
+    return html
+
+
+# ===== PAGINATION =====
+def visible_cards(cards, shown=CARDS_PER_PAGE):
+    """First `shown` cards and how many remain"""
+    shown = max(0, shown)
+    return cards[:shown], max(0, len(cards) - shown)
+
+
+def card_blocks(cards):
+    """Group consecutive rendered cards into one HTML blob each
+
+    Yields (html, None) for a run of rendered cards and (None, job) for a
+    job without HTML that needs the Streamlit fallback.
+    """
+    run = []
+    for job, html in cards:
+        if html:
+            run.append(html)
+            continue
+        if run:
+            yield "\n".join(run), None
+            run = []
+        yield None, job
+    if run:
+        yield "\n".join(run), None
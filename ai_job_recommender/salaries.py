@@ -0,0 +1,150 @@
+"""Salary analytics precomputed once per catalog
+
+Salaries are compared by their midpoint. At load every group of jobs (the
+whole catalog, each AI impact level, each career-path category, and each
+category x impact pair) gets its midpoints sorted into an array, plus a
+summary with percentiles and a histogram. One pass over the jobs fills
+the category x impact buckets; the per-category and per-impact totals
+are merged from those. Range filters such as "above
+AED 20,000 with Low AI impact" are then two bisects into one group's
+array (a range's summary is computed from that slice), and the salary
+bar is scaled to the catalog's highest midpoint.
+"""
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import namedtuple
+from itertools import chain
+
+from .records import AIImpact
+
+PERCENTILES = (10, 25, 50, 75, 90)
+HISTOGRAM_BIN = 5000           # AED per histogram bucket
+HISTOGRAM_WIDTH = 30           # characters in the longest histogram bar
+
+SalarySummary = namedtuple("SalarySummary", ["count", "min", "max", "mean", "percentiles", "histogram"])
+
+
+def salary_percentage(job, scale):
+    """Salary midpoint as a 0-100 fill of the salary bar, scale being the top midpoint"""
+    if scale <= 0:
+        return 0
+    return min(100, int((job.salary_mid / scale) * 100))
+
+
+def summarize(mids):
+    """SalarySummary of an ascending array of midpoints"""
+    if not mids:
+        return SalarySummary(0, None, None, None, {}, [])
+    n = len(mids)
+    # Nearest-rank percentiles
+    percentiles = {p: mids[min(n - 1, max(0, -(-p * n // 100) - 1))] for p in PERCENTILES}
+    histogram = []
+    for low in range(mids[0] // HISTOGRAM_BIN * HISTOGRAM_BIN, mids[-1] + 1, HISTOGRAM_BIN):
+        count = bisect_left(mids, low + HISTOGRAM_BIN) - bisect_left(mids, low)
+        histogram.append((low, count))
+    return SalarySummary(n, mids[0], mids[-1], sum(mids) / n, percentiles, histogram)
+
+
+def histogram_bars(histogram, width=HISTOGRAM_WIDTH, char="█"):
+    """(low, count, bar) per histogram bucket, bars scaled so the largest is width characters"""
+    peak = max((count for _, count in histogram), default=0)
+    return [(low, count, char * (max(1, round(count * width / peak)) if count else 0))
+            for low, count in histogram]
+
+
+class _Group:
+    """Jobs of one group sorted by salary midpoint"""
+
+    __slots__ = ("mids", "titles", "summary")
+
+    def __init__(self, entries):
+        entries = sorted(entries)       # (salary midpoint, title) pairs
+        self.mids = array("q", (mid for mid, _ in entries))
+        self.titles = [title for _, title in entries]
+        self.summary = summarize(self.mids)
+
+    @classmethod
+    def merge(cls, groups):
+        """Union of disjoint groups (their sorted runs make the sort a merge)"""
+        return cls(chain.from_iterable(zip(group.mids, group.titles) for group in groups))
+
+
+class SalaryStats:
+    """Salary aggregates and sorted midpoint indexes over one catalog"""
+
+    def __init__(self, job_details, career_paths=()):
+        # Role -> the categories (career paths) listing it
+        role_categories = {}
+        for path in career_paths:
+            for roles in path["levels"].values():
+                for role in roles:
+                    role_categories.setdefault(role, {})[path["name"]] = None
+        self.categories = tuple(dict.fromkeys(path["name"] for path in career_paths))
+
+        buckets = {}
+        for job in job_details.values():
+            entry = (job.salary_mid, job.title)
+            buckets.setdefault((None, job.ai_impact), []).append(entry)
+            for category in role_categories.get(job.title, ()):
+                buckets.setdefault((category, job.ai_impact), []).append(entry)
+
+        self.groups = {}
+        for category in (None, *self.categories):
+            by_impact = [_Group(buckets.get((category, impact), ())) for impact in AIImpact]
+            self.groups.update(((category, impact), group) for impact, group in zip(AIImpact, by_impact))
+            self.groups[(category, None)] = _Group.merge(by_impact)
+
+        overall = self.groups[(None, None)].summary
+        self.max_mid = overall.max or 0
+
+    @classmethod
+    def from_catalog(cls, catalog):
+        return cls(catalog.job_details, catalog.career_paths)
+
+    def _group(self, category=None, ai_impact=None):
+        if ai_impact is not None and not isinstance(ai_impact, AIImpact):
+            ai_impact = AIImpact.parse(ai_impact)
+        group = self.groups.get((category, ai_impact))
+        if group is None:
+            raise ValueError(f"Unknown salary category: {category!r}")
+        return group
+
+    # ===== QUERIES =====
+    def summary(self, category=None, ai_impact=None, min_salary=None, max_salary=None):
+        """SalarySummary of the catalog, an AI impact level, a category, or both
+
+        With salary bounds it covers only the jobs count() and jobs() would
+        return, summarized from that slice of the group.
+        """
+        group = self._group(category, ai_impact)
+        if min_salary is None and max_salary is None:
+            return group.summary
+        lo, hi = self._span(group, min_salary, max_salary)
+        return summarize(group.mids[lo:hi])
+
+    def percentage(self, job):
+        """Fill of the salary bar, relative to the catalog's highest midpoint"""
+        return salary_percentage(job, self.max_mid)
+
+    def percentile_rank(self, job):
+        """Share of catalog jobs (0-100) whose midpoint is below this job's"""
+        mids = self.groups[(None, None)].mids
+        return 100 * bisect_left(mids, job.salary_mid) / len(mids) if mids else 0.0
+
+    def _span(self, group, min_salary, max_salary):
+        lo = 0 if min_salary is None else bisect_left(group.mids, min_salary)
+        hi = len(group.mids) if max_salary is None else bisect_right(group.mids, max_salary)
+        return lo, max(lo, hi)
+
+    def count(self, min_salary=None, max_salary=None, ai_impact=None, category=None):
+        """Number of jobs with min_salary <= midpoint <= max_salary"""
+        lo, hi = self._span(self._group(category, ai_impact), min_salary, max_salary)
+        return hi - lo
+
+    def jobs(self, min_salary=None, max_salary=None, ai_impact=None, category=None, limit=None):
+        """Titles with min_salary <= midpoint <= max_salary, best-paid first"""
+        group = self._group(category, ai_impact)
+        lo, hi = self._span(group, min_salary, max_salary)
+        if limit is not None:
+            lo = max(lo, hi - limit)
+        return group.titles[lo:hi][::-1]
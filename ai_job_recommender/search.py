@@ -0,0 +1,220 @@
+"""Free-text job search: BM25 over titles, descriptions, certificates and skills
+
+Each job is one document whose fields count with different weights (a
+word in the title says more than one in the description). Terms are
+lower-cased, stop words dropped and suffixes lightly stripped, so
+"working with numbers" meets "work" and "number". Every posting stores
+its precomputed BM25 weight; the postings of all terms live back to back
+in two flat arrays (job ids, float32 weights) addressed by an offsets
+array. A query is a sum of posting weights. Top-k uses MaxScore, term
+at a time: terms go from highest to lowest best weight, and once the
+k-th best score so far beats what the remaining terms could add to a
+new document, only the current contenders are finished off (long lists
+are probed by bisect instead of walked).
+"""
+import heapq
+import math
+import re
+from array import array
+from bisect import bisect_left
+from functools import lru_cache
+from itertools import accumulate
+
+from .matching import Match
+
+# BM25 parameters
+K1 = 1.2
+B = 0.75
+
+# Binary-search contenders in a postings list once it is this many times longer
+PROBE_RATIO = 8
+
+# Weight of one occurrence of a word in each field
+FIELD_WEIGHTS = {"title": 3, "skills": 2, "certificates": 1, "description": 1}
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9][a-z0-9+#]*")
+STOPWORDS = frozenset("""
+    a an and are as at be but by do for from good have i in interested into is it its like love
+    me my of on or our so that the their them they this to us very want we with you your enjoy
+""".split())
+SUFFIXES = ("ing", "ies", "ed", "s")
+
+
+@lru_cache(maxsize=1 << 16)
+def stem(token):
+    """Strip one common suffix, then a trailing "e" ("managing", "manages", "manage" -> "manag")"""
+    for suffix in SUFFIXES:
+        if token.endswith(suffix) and len(token) - len(suffix) >= 3 and not token.endswith("ss"):
+            token = token[:-3] + "y" if suffix == "ies" else token[:-len(suffix)]
+            break
+    if len(token) > 4 and token.endswith("e"):
+        token = token[:-1]
+    return token
+
+
+def tokenize(text):
+    """Index terms of a piece of text, in order (duplicates kept)"""
+    return [stem(token) for token in TOKEN_PATTERN.findall(text.lower()) if token not in STOPWORDS]
+
+
+class TextIndex:
+    """BM25 inverted index over job documents with MaxScore top-k"""
+
+    def __init__(self, jobs, terms, offsets, docs, weights):
+        self.jobs = jobs                    # doc id -> job title
+        self.terms = terms                  # term id -> term
+        self.term_ids = {term: i for i, term in enumerate(terms)}
+        self.offsets = offsets              # term id -> start of its postings (plus a final end)
+        self.docs = docs                    # postings' doc ids, ascending within each term
+        self.weights = weights              # postings' BM25 weights
+        self.max_weight = array("d", (
+            max(weights[offsets[t]:offsets[t + 1]], default=0.0) for t in range(len(terms))))
+
+    def __len__(self):
+        return len(self.jobs)
+
+    @property
+    def n_postings(self):
+        return len(self.docs)
+
+    @classmethod
+    def from_documents(cls, documents):
+        """Build from [(title, {field: text})], field weights from FIELD_WEIGHTS"""
+        jobs = []
+        term_ids = {}
+        term_docs = []                      # term id -> array of doc ids
+        term_tfs = []                       # term id -> array of weighted term frequencies
+        lengths = array("I")
+        for doc_id, (title, fields) in enumerate(documents):
+            jobs.append(title)
+            tf = {}
+            length = 0
+            for field, text in fields.items():
+                weight = FIELD_WEIGHTS[field]
+                for term in tokenize(text):
+                    tf[term] = tf.get(term, 0) + weight
+                    length += weight
+            lengths.append(length)
+            for term, count in tf.items():
+                term_id = term_ids.get(term)
+                if term_id is None:
+                    term_id = term_ids[term] = len(term_docs)
+                    term_docs.append(array("I"))
+                    term_tfs.append(array("I"))
+                term_docs[term_id].append(doc_id)
+                term_tfs[term_id].append(count)
+
+        n_docs = len(jobs)
+        average = sum(lengths) / n_docs if n_docs else 1.0
+        norms = array("d", (K1 * (1 - B + B * length / average) for length in lengths))
+        offsets = array("I", [0])
+        docs = array("I")
+        weights = array("f")
+        for ids, tfs in zip(term_docs, term_tfs):
+            idf = _idf(n_docs, len(ids))
+            docs.extend(ids)
+            weights.extend(idf * tf * (K1 + 1) / (tf + norms[doc_id]) for doc_id, tf in zip(ids, tfs))
+            offsets.append(len(docs))
+        return cls(jobs, list(term_ids), offsets, docs, weights)
+
+    @classmethod
+    def from_catalog(cls, catalog):
+        job_skills = {}
+        for skill, jobs in catalog.skill_map.items():
+            for job in jobs:
+                job_skills.setdefault(job, []).append(skill)
+        return cls.from_documents(
+            (title, {"title": title, "skills": " ".join(job_skills.get(title, ())),
+                     "certificates": " ".join(job.certificates), "description": job.description})
+            for title, job in catalog.job_details.items())
+
+    # ===== QUERYING =====
+    def lookup(self, text):
+        """Unique known term ids of a query, and the words not in the index"""
+        known, unknown = [], []
+        for term in dict.fromkeys(tokenize(text)):
+            term_id = self.term_ids.get(term)
+            if term_id is None:
+                unknown.append(term)
+            else:
+                known.append(term_id)
+        return known, unknown
+
+    def postings(self, term_id):
+        start, end = self.offsets[term_id], self.offsets[term_id + 1]
+        return self.docs[start:end], self.weights[start:end]
+
+    def score(self, term_ids):
+        """{doc id: score} over every document containing a query term"""
+        scores = {}
+        for term_id in term_ids:
+            for doc_id, weight in zip(*self.postings(term_id)):
+                scores[doc_id] = scores.get(doc_id, 0.0) + weight
+        return scores
+
+    def top_k(self, term_ids, k):
+        """[(score, doc id)] of the k best documents, best first (MaxScore)"""
+        # Highest-weighted terms first; rest[i] caps what terms[i:] can still add
+        terms = sorted(term_ids, key=lambda t: self.max_weight[t], reverse=True)
+        rest = list(accumulate(self.max_weight[t] for t in reversed(terms)))[::-1]
+        docs, weights, offsets = self.docs, self.weights, self.offsets
+        scores = {}
+        for i, term_id in enumerate(terms):
+            if len(scores) >= k:
+                threshold = heapq.nlargest(k, scores.values())[-1]
+                if rest[i] < threshold:
+                    # No new document can reach the top k: only finish scoring the contenders
+                    scores = {d: score for d, score in scores.items() if score + rest[i] >= threshold}
+                    for t in terms[i:]:
+                        self._add_to(scores, offsets[t], offsets[t + 1])
+                    break
+            start, end = offsets[term_id], offsets[term_id + 1]
+            get = scores.get
+            for doc_id, weight in zip(docs[start:end], weights[start:end]):
+                scores[doc_id] = get(doc_id, 0.0) + weight
+        ranked = heapq.nlargest(k, scores.items(), key=lambda item: (item[1], -item[0]))
+        return [(score, doc_id) for doc_id, score in ranked]
+
+    def _add_to(self, scores, start, end):
+        """Add one postings range to the documents already in scores"""
+        docs, weights = self.docs, self.weights
+        if end - start > len(scores) * PROBE_RATIO:
+            # Long list, few contenders: binary-search each contender
+            for doc_id in scores:
+                i = bisect_left(docs, doc_id, start, end)
+                if i < end and docs[i] == doc_id:
+                    scores[doc_id] += weights[i]
+        else:
+            for doc_id, weight in zip(docs[start:end], weights[start:end]):
+                if doc_id in scores:
+                    scores[doc_id] += weight
+
+    def rank(self, term_ids, k=None):
+        """Best k Matches for looked-up term ids; k=None returns every match, ranked"""
+        if not term_ids:
+            return []
+        if k is None:
+            ranked = sorted(((score, doc_id) for doc_id, score in self.score(term_ids).items()),
+                            key=lambda item: (-item[0], item[1]))
+        else:
+            ranked = self.top_k(term_ids, k)
+        return [self._match(doc_id, score, term_ids) for score, doc_id in ranked]
+
+    def search(self, text, k=None):
+        """(ranked Matches, unknown words) for a free-text query"""
+        term_ids, unknown = self.lookup(text)
+        return self.rank(term_ids, k), unknown
+
+    def _match(self, doc_id, score, term_ids):
+        matched = tuple(self.terms[t] for t in term_ids if _contains(self.docs, doc_id, *self.offsets[t:t + 2]))
+        return Match(self.jobs[doc_id], score, len(matched), matched)
+
+
+def _idf(n_docs, df):
+    # BM25's idf, shifted by one so terms in most documents still count a little
+    return math.log(1.0 + (n_docs - df + 0.5) / (df + 0.5))
+
+
+def _contains(docs, doc_id, start, end):
+    i = bisect_left(docs, doc_id, start, end)
+    return i < end and docs[i] == doc_id
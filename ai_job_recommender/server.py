@@ -0,0 +1,376 @@
+"""Headless JSON API over the recommendation core (asyncio, stdlib only)
+
+    python -m ai_job_recommender serve --port 8000
+
+Endpoints:
+
+    GET  /health
+    GET  /recommend?skills=python,sql&k=10
+    POST /recommend             {"skills": "python, sql" | ["python", "sql"], "k": 10}
+    GET  /jobs/{id}             index id or URL-encoded title
+    GET  /skills?limit=50       skills with their job counts, most popular first
+    GET  /skills/suggest?q=pyt&limit=10   (q may be a whole list: completes its last skill)
+    POST /skills/extract        {"text": "CV or paragraph"}   known skills mentioned in the text
+    GET  /search?q=protect+networks+from+hackers&k=10   free-text (BM25) job search
+    GET  /salaries?min_salary=20000&ai_impact=Low&category=Cybersecurity&limit=10
+                                salary summary and the best-paid jobs in range
+    POST /certificates/plan     {"jobs": ["Data Analyst", ...]} or {"skills": "python, sql", "k": 10},
+                                optional "limit": fewest certificates opening up those jobs
+    GET  /metrics               stage timings and counters, Prometheus text format
+
+Connections are HTTP/1.1 keep-alive. /recommend calls that arrive within
+the batch window are scored together by one Recommender.recommend_many
+call on a worker thread, so the event loop keeps accepting requests while
+a batch is being ranked.
+"""
+import asyncio
+import json
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from http import HTTPStatus
+from urllib.parse import parse_qs, unquote, urlsplit
+
+from .catalog import DEFAULT_CATALOG_PATH, get_catalog
+from .instrumentation import metrics
+from .service import DEFAULT_K, SUGGEST_LIMIT, Recommender
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8000
+BATCH_WINDOW = 0.002           # seconds to wait for more /recommend calls
+MAX_BATCH = 64
+MAX_K = 100
+SALARY_LIMIT = 10
+MAX_BODY_BYTES = 1 << 20
+KEEP_ALIVE_TIMEOUT = 15.0
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+class HTTPError(Exception):
+    def __init__(self, status, message=None):
+        super().__init__(message or HTTPStatus(status).phrase)
+        self.status = status
+
+
+# ===== RESPONSES =====
+def job_json(job, job_id=None):
+    return {"id": job_id, "title": job.title, **job.to_dict()}
+
+
+def match_json(recommender, match):
+    job = recommender.catalog.job_details.get(match.job)
+    if job is None:
+        return None
+    return dict(job_json(job, recommender.job_id(match.job)), score=round(match.score, 4),
+                matched_skills=list(match.skills))
+
+
+def salaries_json(recommender, query):
+    stats = recommender.catalog.salary_stats
+    bounds = {name: _int_param(query, name, None, 0, 1 << 62) if query.get(name) else None
+              for name in ("min_salary", "max_salary")}
+    filters = dict(bounds, ai_impact=query.get("ai_impact") or None, category=query.get("category") or None)
+    limit = _int_param(query, "limit", SALARY_LIMIT, 1, MAX_K)
+    try:
+        summary = stats.summary(**filters)
+        titles = stats.jobs(limit=limit, **filters)
+        count = stats.count(**filters)
+    except ValueError as error:
+        raise HTTPError(400, str(error)) from None
+    job_details = recommender.catalog.job_details
+    return {"summary": dict(summary._asdict(), histogram=[list(b) for b in summary.histogram]),
+            "count": count,
+            "jobs": [job_json(job_details[title], recommender.job_id(title)) for title in titles]}
+
+
+def plan_json(plan):
+    return {
+        "certificates": [{"certificate": step.certificate, "jobs": step.jobs, "covered": step.covered}
+                         for step in plan.steps],
+        "covered": plan.covered,
+        "uncovered": plan.uncovered,
+    }
+
+
+def recommendation_json(recommender, recommendation):
+    return {
+        "recommendations": [
+            row for row in (match_json(recommender, m) for m in recommendation.matches) if row is not None
+        ],
+        "unknown_skills": recommendation.unknown,
+        "corrections": {raw: r.skill for raw, r in recommendation.corrections.items()},
+    }
+
+
+def encode_response(status, payload, keep_alive=True):
+    """JSON response for dicts; str payloads are sent as Prometheus text"""
+    if isinstance(payload, str):
+        body, content_type = payload.encode("utf-8"), PROMETHEUS_CONTENT_TYPE
+    else:
+        body, content_type = json.dumps(payload, ensure_ascii=False).encode("utf-8"), "application/json; charset=utf-8"
+    head = (
+        f"HTTP/1.1 {status} {HTTPStatus(status).phrase}\r\n"
+        f"Content-Type: {content_type}\r\n"
+        f"Content-Length: {len(body)}\r\n"
+        f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n"
+    )
+    return head.encode("latin-1") + body
+
+
+# ===== BATCHING =====
+class RecommendBatcher:
+    """Collects concurrent /recommend calls and scores them as one batch"""
+
+    def __init__(self, recommender, window=BATCH_WINDOW, max_batch=MAX_BATCH, executor=None):
+        self.recommender = recommender
+        self.window = window
+        self.max_batch = max_batch
+        self.executor = executor or ThreadPoolExecutor(max_workers=1, thread_name_prefix="recommend")
+        self.stats = {"requests": 0, "batches": 0}
+        self._pending = []
+        self._timer = None
+        self._running = set()
+
+    async def submit(self, skills, k):
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((skills, k, future))
+        if len(self._pending) >= self.max_batch:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.window, self._flush)
+        return await future
+
+    def _flush(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._pending = self._pending, []
+        if batch:
+            task = asyncio.ensure_future(self._run(batch))
+            self._running.add(task)
+            task.add_done_callback(self._running.discard)
+
+    async def _run(self, batch):
+        self.stats["requests"] += len(batch)
+        self.stats["batches"] += 1
+        loop = asyncio.get_running_loop()
+        k = max(k for _, k, _ in batch)
+        try:
+            results = await loop.run_in_executor(
+                self.executor, self.recommender.recommend_many, [skills for skills, _, _ in batch], k)
+        except Exception as error:
+            for _, _, future in batch:
+                if not future.done():
+                    future.set_exception(error)
+            return
+        for (_, k_item, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result._replace(matches=result.matches[:k_item]))
+
+
+# ===== APPLICATION =====
+class RecommendationServer:
+    """Routes parsed requests to the Recommender; one instance per process"""
+
+    def __init__(self, recommender, window=BATCH_WINDOW, max_batch=MAX_BATCH):
+        self.recommender = recommender
+        self.batcher = RecommendBatcher(recommender, window, max_batch)
+        self.stats = {"connections": 0, "requests": 0, "errors": 0}
+
+    async def dispatch(self, method, target, body):
+        url = urlsplit(target)
+        query = {key: values[-1] for key, values in parse_qs(url.query).items()}
+        path = url.path.rstrip("/") or "/"
+
+        if path == "/health":
+            _allow(method, "GET")
+            catalog = self.recommender.catalog
+            return {"status": "ok", "catalog_version": catalog.version,
+                    "jobs": len(catalog.job_details), "skills": len(catalog.skill_map),
+                    "batches": dict(self.batcher.stats), **self.stats}
+        if path == "/metrics":
+            _allow(method, "GET")
+            return metrics.prometheus_text()
+        if path == "/recommend":
+            _allow(method, "GET", "POST")
+            params = _json_body(body) if method == "POST" else query
+            skills = params.get("skills")
+            if not skills or not (isinstance(skills, str) or
+                                  isinstance(skills, list) and all(isinstance(s, str) for s in skills)):
+                raise HTTPError(400, "'skills' is required (string or list)")
+            k = _int_param(params, "k", DEFAULT_K, 1, MAX_K)
+            result = await self.batcher.submit(skills, k)
+            return recommendation_json(self.recommender, result)
+        if path.startswith("/jobs/"):
+            _allow(method, "GET")
+            key = unquote(path[len("/jobs/"):])
+            job = self.recommender.job(key)
+            if job is None:
+                raise HTTPError(404, f"No job {key!r}")
+            return job_json(job, self.recommender.job_id(job.title))
+        if path == "/skills":
+            _allow(method, "GET")
+            limit = _int_param(query, "limit", len(self.recommender.catalog.skill_completer), 1, 1 << 31)
+            return {"skills": [{"skill": skill, "jobs": jobs}
+                               for skill, jobs in self.recommender.catalog.skill_completer.popular(limit)]}
+        if path == "/skills/suggest":
+            _allow(method, "GET")
+            limit = _int_param(query, "limit", SUGGEST_LIMIT, 1, MAX_K)
+            return {"suggestions": self.recommender.suggest(query.get("q", ""), limit)}
+        if path == "/skills/extract":
+            _allow(method, "POST")
+            text = _json_body(body).get("text")
+            if not isinstance(text, str):
+                raise HTTPError(400, "'text' is required (string)")
+            return {"skills": [{"skill": skill, "mentions": mentions}
+                               for skill, mentions in self.recommender.extract_skills(text).items()]}
+        if path == "/search":
+            _allow(method, "GET")
+            text = query.get("q", "")
+            if not text.strip():
+                raise HTTPError(400, "'q' is required")
+            matches, unknown = self.recommender.search(text, _int_param(query, "k", DEFAULT_K, 1, MAX_K))
+            return {"recommendations": [row for row in (match_json(self.recommender, m) for m in matches)
+                                        if row is not None],
+                    "unknown_words": unknown}
+        if path == "/salaries":
+            _allow(method, "GET")
+            return salaries_json(self.recommender, query)
+        if path == "/certificates/plan":
+            _allow(method, "POST")
+            params = _json_body(body)
+            jobs, skills = params.get("jobs"), params.get("skills")
+            if jobs is None and skills:
+                k = _int_param(params, "k", DEFAULT_K, 1, MAX_K)
+                jobs = [m.job for m in (await self.batcher.submit(skills, k)).matches]
+            if not isinstance(jobs, list) or not all(isinstance(job, str) for job in jobs):
+                raise HTTPError(400, "'jobs' (list of titles) or 'skills' is required")
+            limit = _int_param(params, "limit", None, 1, 1 << 31) if params.get("limit") is not None else None
+            return plan_json(self.recommender.certificate_plan(jobs, limit))
+        raise HTTPError(404, f"No route for {path}")
+
+    async def handle_connection(self, reader, writer):
+        self.stats["connections"] += 1
+        try:
+            while True:
+                try:
+                    request = await asyncio.wait_for(_read_request(reader), KEEP_ALIVE_TIMEOUT)
+                except (asyncio.TimeoutError, asyncio.IncompleteReadError, ConnectionError):
+                    break
+                except HTTPError as error:
+                    writer.write(encode_response(error.status, {"error": str(error)}, keep_alive=False))
+                    break
+                if request is None:
+                    break
+                method, target, keep_alive, body = request
+
+                self.stats["requests"] += 1
+                try:
+                    status, payload = 200, await self.dispatch(method, target, body)
+                except HTTPError as error:
+                    status, payload = error.status, {"error": str(error)}
+                except Exception as error:
+                    status, payload = 500, {"error": f"{type(error).__name__}: {error}"}
+                metrics.count("http_requests")
+                if status >= 400:
+                    self.stats["errors"] += 1
+                    metrics.count("http_errors")
+                writer.write(encode_response(status, payload, keep_alive))
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    async def serve(self, host=DEFAULT_HOST, port=DEFAULT_PORT, ready=None, log_interval=None):
+        server = await asyncio.start_server(self.handle_connection, host, port, reuse_address=True)
+        bound_host, bound_port = server.sockets[0].getsockname()[:2]
+        print(f"Serving on http://{bound_host}:{bound_port}", flush=True)
+        if ready is not None:
+            ready(bound_host, bound_port)
+        if log_interval and metrics.enabled:
+            self._log_task = asyncio.ensure_future(_log_metrics(log_interval))
+        async with server:
+            await server.serve_forever()
+
+
+async def _log_metrics(interval):
+    """Print the metrics summary line to stderr every interval seconds"""
+    while True:
+        await asyncio.sleep(interval)
+        print(metrics.log_line(), file=sys.stderr, flush=True)
+
+
+def _allow(method, *methods):
+    if method not in methods:
+        raise HTTPError(405, f"{method} not allowed (use {', '.join(methods)})")
+
+
+def _json_body(body):
+    try:
+        params = json.loads(body or b"{}")
+    except ValueError as error:
+        raise HTTPError(400, f"Invalid JSON body: {error}") from None
+    if not isinstance(params, dict):
+        raise HTTPError(400, "JSON body must be an object")
+    return params
+
+
+def _int_param(params, name, default, low, high):
+    value = params.get(name, default)
+    try:
+        value = int(value)
+    except (TypeError, ValueError):
+        raise HTTPError(400, f"'{name}' must be an integer") from None
+    return max(low, min(high, value))
+
+
+async def _read_request(reader):
+    """(method, target, keep_alive, body) for the next request, None at EOF"""
+    line = await reader.readline()
+    if not line.strip():
+        return None
+    try:
+        method, target, version = line.decode("latin-1").split()
+    except ValueError:
+        raise HTTPError(400, "Malformed request line") from None
+
+    headers = {}
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b"\n", b""):
+            break
+        name, colon, value = line.decode("latin-1").partition(":")
+        if not colon or not name.strip():
+            raise HTTPError(400, "Malformed header line")
+        headers[name.strip().lower()] = value.strip()
+
+    connection = headers.get("connection", "").lower()
+    keep_alive = connection != "close" if version == "HTTP/1.1" else connection == "keep-alive"
+    length = headers.get("content-length") or "0"
+    # Plain ASCII digits only: int() would also take "-1", "+1", "1_000" and non-ASCII digits
+    if not (length.isascii() and length.isdigit()):
+        raise HTTPError(400, "Invalid Content-Length")
+    length = int(length)
+    if length > MAX_BODY_BYTES:
+        raise HTTPError(413)
+    body = await reader.readexactly(length) if length else b""
+    return method.upper(), target, keep_alive, body
+
+
+def serve(host=DEFAULT_HOST, port=DEFAULT_PORT, catalog_path=DEFAULT_CATALOG_PATH,
+          window=BATCH_WINDOW, max_batch=MAX_BATCH, with_metrics=True, log_interval=None):
+    """Load the catalog and run the API until interrupted"""
+    metrics.enable(with_metrics)
+    catalog = get_catalog(catalog_path)
+    catalog.skill_index, catalog.skill_normalizer    # build before the first request
+    app = RecommendationServer(Recommender(catalog), window, max_batch)
+    try:
+        asyncio.run(app.serve(host, port, log_interval=log_interval))
+    except KeyboardInterrupt:
+        print("Stopped", file=sys.stderr)
+    if metrics.enabled:
+        print(metrics.log_line(), file=sys.stderr)
+    return 0
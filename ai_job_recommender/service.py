@@ -0,0 +1,374 @@
+"""Recommendation core shared by the Streamlit app and the HTTP server
+
+Recommender wraps one catalog: it resolves free-typed skills, ranks jobs,
+runs free-text searches, extracts skills from CVs, analyses skill gaps,
+plans certificates, looks jobs up by id or title and suggests skills,
+with no UI code. The Streamlit app calls it for its cards and
+downloads; server.py exposes the same calls as a JSON API and funnels
+concurrent requests through recommend_many so they are scored as one
+batch.
+"""
+import sys
+import threading
+from collections import namedtuple
+from collections.abc import Sequence
+from functools import lru_cache
+from importlib.util import find_spec
+
+from .cache import QueryResult, query_key
+from .export import LazyExport, job_row
+from .instrumentation import metrics
+from .rendering import CARDS_PER_PAGE, create_job_card_html
+
+DEFAULT_K = 10
+SUGGEST_LIMIT = 10
+
+# Free-text search returns the best SEARCH_K jobs (any shared word is a match)
+SEARCH_K = 30
+
+# Batches at least this large go through the sparse-matrix scorer (batch.py)
+VECTORIZE_MIN_BATCH = 16
+
+# Estimated memory per export row, charged to the result cache as rows are built
+ROW_BYTES = 512
+
+Recommendation = namedtuple("Recommendation", ["skill_ids", "matches", "unknown", "corrections"])
+
+
+class Recommender:
+    """Stateless (apart from caches) recommendation calls over one catalog"""
+
+    def __init__(self, catalog, result_cache=None):
+        self.catalog = catalog
+        self.result_cache = result_cache
+
+    @property
+    def index(self):
+        return self.catalog.skill_index
+
+    # ===== RECOMMENDATIONS =====
+    def resolve(self, text):
+        """(skill ids, unknown raw skills, corrections) for comma-separated input"""
+        if not isinstance(text, str):
+            text = ", ".join(text)
+        with metrics.span("parse"):
+            skill_ids, unknown, corrections = self.index.resolve(text, self.catalog.skill_normalizer)
+        metrics.count("queries")
+        metrics.count("unknown_skills", len(unknown))
+        metrics.count("corrected_skills", len(corrections))
+        return skill_ids, unknown, corrections
+
+    def recommend(self, text, k=DEFAULT_K):
+        """Ranked matches for one skills string (k=None returns every match)"""
+        skill_ids, unknown, corrections = self.resolve(text)
+        with metrics.span("match"):
+            matches = self.index.rank(skill_ids, k)
+        return Recommendation(skill_ids, matches, unknown, corrections)
+
+    def recommend_many(self, texts, k=DEFAULT_K):
+        """recommend() for a batch of skills strings, vectorized when the batch is large"""
+        resolved = [self.resolve(text) for text in texts]
+        if len(resolved) < VECTORIZE_MIN_BATCH or k is None or not _vectorizable():
+            with metrics.span("match"):
+                return [Recommendation(ids, self.index.rank(ids, k), unknown, corrections)
+                        for ids, unknown, corrections in resolved]
+
+        from .batch import recommend_batch
+
+        skills = self.index.skills
+        with metrics.span("match"):
+            result = recommend_batch([[skills[i] for i in ids] for ids, _, _ in resolved], self.index, k=k)
+        return [Recommendation(ids, result.matches(row), unknown, corrections)
+                for row, (ids, unknown, corrections) in enumerate(resolved)]
+
+    def query_result(self, skill_ids, card_template=None, ranking=None):
+        """Ranked matches, job cards and lazy export for a resolved skill set
+
+        Only the first page is ranked and rendered up front; later pages
+        (and the full ranking an export needs) are built when first read.
+
+        Cached in result_cache (when set) on the canonical skill set, the
+        catalog's mtime and the template's mtime. Pass the caller's
+        IncrementalRanking (see incremental_ranking) to score a cache miss
+        from the previous skill set's scores plus the delta.
+        """
+        if ranking is not None:
+            with metrics.span("match"):
+                added, removed = ranking.update(skill_ids)
+            metrics.count("delta_skills", len(added) + len(removed))
+        key = query_key(skill_ids, (self.catalog.mtime, card_template and card_template.mtime))
+        return self._cached_result(key, lambda: self._build_query_result(skill_ids, card_template, ranking))
+
+    def _cached_result(self, key, build):
+        if self.result_cache is None:
+            return build()
+        result = self.result_cache.get(key)
+        if result is None:
+            metrics.count("cache_misses")
+            result = self.result_cache.put(key, build())
+        else:
+            metrics.count("cache_hits")
+        return result
+
+    def incremental_ranking(self, previous=None):
+        """previous if it still belongs to this catalog's index, else a fresh one"""
+        if previous is not None and previous.index is self.index:
+            return previous
+        return self.index.incremental()
+
+    def _build_query_result(self, skill_ids, card_template, ranking=None):
+        with metrics.span("match"):
+            if ranking is not None:
+                # Snapshot: the session's ranking keeps changing after this result is cached
+                scores = {job_id: tuple(entry) for job_id, entry in ranking.scores.items()}
+                skill_ids = list(ranking.skill_ids)
+            else:
+                scores = self.index.score(skill_ids)
+            matches = RankedMatches(self.index, scores, list(skill_ids))
+        return self._result_for(matches, card_template, skill_ids)
+
+    def _result_for(self, matches, card_template, skill_ids=None):
+        """QueryResult whose cards and export rows are built a page at a time, on first access
+
+        skill_ids=None skips the gap analysis (no missing skills on cards or rows).
+        """
+        job_details = self.catalog.job_details
+        titles = matches.titles() if isinstance(matches, RankedMatches) else [m.job for m in matches]
+        size = sum(1 for title in titles if title in job_details)
+
+        # Gains from the first page of matches; missing skills decoded per job as pages are built
+        gaps = None
+        if skill_ids is not None:
+            gaps = self.skill_gaps(skill_ids, [m.job for m in matches[:CARDS_PER_PAGE]])
+        if gaps is not None:
+            gaps = gaps._replace(missing=self.catalog.skill_gaps.missing(skill_ids, titles))
+        missing = gaps.missing if gaps is not None else {}
+        salary_scale = self.catalog.salary_stats.max_mid
+
+        def details(page):
+            return [job for job in (job_details.get(m.job) for m in page) if job is not None]
+
+        def build_rows(page):
+            with metrics.span("enrich"):
+                rows = [job_row(job) for job in details(page)]
+                if gaps is not None:
+                    for row in rows:
+                        row["Missing Skills"] = ", ".join(missing.get(row["Job"], ()))
+            return rows
+
+        def build_cards(page):
+            with metrics.span("render"):
+                return [(job.title, create_job_card_html(job, card_template, salary_scale, missing.get(job.title))
+                         if card_template else None)
+                        for job in details(page)]
+
+        cards = LazyPages(matches, build_cards, size, _card_size)
+        job_list = LazyPages(matches, build_rows, size, _row_size)
+        # Serialized only if the user actually downloads
+        return QueryResult(matches, cards, job_list, LazyExport(job_list), gaps)
+
+    # ===== FREE-TEXT SEARCH =====
+    def search_terms(self, text):
+        """(term ids, words not in the index) of a free-text description"""
+        with metrics.span("parse"):
+            term_ids, unknown = self.catalog.search_index.lookup(text)
+        metrics.count("searches")
+        metrics.count("unknown_words", len(unknown))
+        return term_ids, unknown
+
+    def search(self, text, k=SEARCH_K):
+        """(ranked Matches, words not in the index) for a free-text description"""
+        term_ids, unknown = self.search_terms(text)
+        with metrics.span("match"):
+            return self.catalog.search_index.rank(term_ids, k), unknown
+
+    def search_result(self, text, card_template=None, k=SEARCH_K):
+        """(QueryResult, words not in the index) for a free-text description
+
+        Same matches/cards/export shape as query_result, cached on the set
+        of query terms. Skills named in the description are the profile
+        the missing skills are measured against; a description naming
+        none gets no gap analysis, rather than every skill reported missing.
+        """
+        term_ids, unknown = self.search_terms(text)
+        skill_ids = [self.index.skill_ids[skill] for skill in self.extract_skills(text)
+                     if skill in self.index.skill_ids]
+
+        def build():
+            with metrics.span("match"):
+                matches = self.catalog.search_index.rank(term_ids, k)
+            return self._result_for(matches, card_template, skill_ids or None)
+
+        key = query_key(term_ids, ("search", k, tuple(sorted(skill_ids)), self.catalog.mtime,
+                                   card_template and card_template.mtime))
+        return self._cached_result(key, build), unknown
+
+    # ===== CV IMPORT =====
+    def extract_skills(self, text):
+        """{skill: mentions} found in free text: a string or an iterable of text chunks"""
+        extractor = self.catalog.skill_extractor
+        with metrics.span("extract"):
+            found = extractor.extract(text) if isinstance(text, str) else extractor.extract_stream(text)
+        metrics.count("extracted_skills", len(found))
+        return found
+
+    # ===== SKILL GAPS =====
+    def skill_gaps(self, skill_ids, titles, limit=None):
+        """GapAnalysis: each job's missing skills and what each of those skills would add
+
+        None when the catalog is too large for the gap bitmaps.
+        """
+        gap_index = self.catalog.skill_gaps
+        if gap_index is None:
+            return None
+        with metrics.span("gaps"):
+            return gap_index.analyze(skill_ids, titles, limit)
+
+    # ===== CERTIFICATES =====
+    def certificate_plan(self, titles, limit=None):
+        """CertificatePlan: fewest certificates opening up the given jobs (e.g. a user's matches)"""
+        with metrics.span("plan"):
+            plan = self.catalog.certificate_index.plan(titles, limit)
+        metrics.count("planned_certificates", len(plan.steps))
+        return plan
+
+    def certificate_plans(self, title_lists, limit=None):
+        """certificate_plan() for a batch of job lists (a cohort's recommendations)"""
+        with metrics.span("plan"):
+            plans = self.catalog.certificate_index.plan_many(title_lists, limit)
+        metrics.count("planned_certificates", sum(len(plan.steps) for plan in plans))
+        return plans
+
+    # ===== JOBS =====
+    def job_id(self, title):
+        """Index id of a job title, or None for jobs no skill points at"""
+        return self.index.job_ids.get(title)
+
+    def job(self, key):
+        """Job record by index id (int or digit string) or exact title"""
+        if isinstance(key, int) or (isinstance(key, str) and key.isdigit()):
+            job_id = int(key)
+            if not 0 <= job_id < len(self.index.jobs):
+                return None
+            key = self.index.jobs[job_id]
+        return self.catalog.job_details.get(key)
+
+    # ===== SKILLS =====
+    def suggest(self, text, limit=SUGGEST_LIMIT):
+        """Completions for the last comma-separated token, most popular first
+
+        Falls back to the closest fuzzy match when nothing starts with it.
+        """
+        suggestions = self.catalog.skill_completer.complete_text(text, limit)
+        if not suggestions and text and not text.rstrip().endswith(","):
+            resolution = self.catalog.skill_normalizer.resolve(text.rpartition(",")[2])
+            if resolution.skill is not None:
+                suggestions.append(resolution.skill)
+        return suggestions
+
+
+# ===== LAZY RESULTS =====
+def _stop(i, n):
+    """How many leading items must exist to read seq[i] (i an index or a slice) of a length-n sequence"""
+    if isinstance(i, slice):
+        indices = range(*i.indices(n))
+        return max(indices[0], indices[-1]) + 1 if indices else 0
+    return (i + n if i < 0 else i) + 1
+
+
+class RankedMatches(Sequence):
+    """Matches of one skill set, ranked only as far as they are read
+
+    Holds the accumulated {job id: (score, matched)}; the first pages are
+    ranked with heapq.nlargest and the full sort happens only when
+    something reads past them (iterating, or the export).
+    """
+
+    def __init__(self, index, scores, skill_ids):
+        self.index = index
+        self.scores = scores
+        self.skill_ids = skill_ids
+        self._ranked = []
+
+    def __len__(self):
+        return len(self.scores)
+
+    def __getitem__(self, i):
+        self._rank(_stop(i, len(self)))
+        return self._ranked[i]
+
+    def __iter__(self):
+        self._rank(len(self))
+        return iter(self._ranked)
+
+    def _rank(self, stop):
+        ranked = len(self._ranked)
+        if stop > ranked:
+            k = min(len(self), max(stop, 2 * ranked, CARDS_PER_PAGE))
+            self._ranked = self.index.rank_scores(self.scores, self.skill_ids, k)
+
+    def titles(self):
+        """Titles of every match, in no particular order (no ranking needed)"""
+        jobs = self.index.jobs
+        return [jobs[job_id] for job_id in self.scores]
+
+
+class LazyPages(Sequence):
+    """Per-match items (cards, export rows) built a page of matches at a time
+
+    build maps a slice of matches to their items (matches without job
+    details produce none); size is the final item count. nbytes and
+    on_serialize account for the built items like LazyExport does for
+    serialized downloads.
+    """
+
+    def __init__(self, matches, build, size, sizeof):
+        self.matches = matches
+        self.build = build
+        self.size = size
+        self.sizeof = sizeof
+        self._items = []
+        self._next = 0                  # matches consumed so far
+        self._lock = threading.Lock()
+        self.nbytes = 0
+        self.on_serialize = None        # called with the estimated byte count of each newly built page
+
+    def __len__(self):
+        return self.size
+
+    def __getitem__(self, i):
+        self._fill(_stop(i, self.size))
+        return self._items[i]
+
+    def __iter__(self):
+        self._fill(self.size)
+        return iter(self._items)
+
+    def _fill(self, stop):
+        if stop <= len(self._items):
+            return
+        nbytes = 0
+        with self._lock:
+            while len(self._items) < stop and self._next < len(self.matches):
+                end = min(len(self.matches), self._next + max(stop - len(self._items), CARDS_PER_PAGE))
+                items = self.build(self.matches[self._next:end])
+                self._items.extend(items)
+                self._next = end
+                nbytes += sum(self.sizeof(item) for item in items)
+            self.nbytes += nbytes
+        callback = self.on_serialize
+        if nbytes and callback is not None:
+            callback(nbytes)
+
+
+def _card_size(card):
+    return sys.getsizeof(card[1]) if card[1] else 0
+
+
+def _row_size(row):
+    return ROW_BYTES
+
+
+@lru_cache(maxsize=None)
+def _vectorizable():
+    return find_spec("numpy") is not None and find_spec("scipy") is not None
@@ -0,0 +1,369 @@
+"""Compact binary catalog snapshots, memory-mapped at load time
+
+A snapshot is compiled once from a catalog source (JSON, CSV or SQLite,
+see catalog.load_source) and holds:
+
+* one interned string table (titles, descriptions, certificates, skills)
+* integer job and skill IDs, with column arrays for salary, AI impact,
+  certificates and the skill postings (including their IDF weights)
+* title/skill sort orders, so lookups by name are binary searches
+
+Opening a snapshot maps the file read-only and wraps each section in a
+typed memoryview: nothing is parsed or copied up front, so loading takes
+milliseconds regardless of catalog size, and worker processes that open
+the same file share its pages through the OS page cache.
+
+Layout (little-endian, sections 8-byte aligned):
+
+    header   "<8sIII"   magic, format version, catalog version, section count
+    table    "<4sQQ"    section name, offset, length   (x section count)
+    sections ...
+"""
+import json
+import mmap
+import os
+import struct
+from array import array
+from collections.abc import ItemsView, Mapping, Sequence, ValuesView
+from functools import cached_property
+from types import MappingProxyType
+
+from .catalog import Catalog
+from .matching import SkillIndex
+from .records import AIImpact, Job
+
+MAGIC = b"AJRSNAP\0"
+FORMAT_VERSION = 1
+SNAPSHOT_EXTENSION = ".snapshot"
+
+HEADER = struct.Struct("<8sIII")
+SECTION = struct.Struct("<4sQQ")
+NO_STRING = 0xFFFFFFFF
+
+# Section name -> memoryview format
+SECTION_FORMATS = {
+    b"STRO": "I",   # string offsets (n strings + 1)
+    b"STRD": "B",   # UTF-8 string data
+    b"JTTL": "I",   # job title string id
+    b"JDSC": "I",   # job description string id (NO_STRING = no details)
+    b"JSMN": "i",   # salary min
+    b"JSMX": "i",   # salary max
+    b"JMID": "q",   # salary midpoint
+    b"JAIC": "B",   # AI impact label code (index into META ai_impact_labels)
+    b"JAIR": "b",   # AI impact rank (records.AIImpact value)
+    b"JCPT": "I",   # certificate pointers (n jobs + 1)
+    b"JCRT": "I",   # certificate string ids
+    b"JORD": "I",   # job ids sorted by title
+    b"SKIL": "I",   # skill string id
+    b"SPTR": "I",   # postings pointers (n skills + 1)
+    b"SPJB": "i",   # postings job ids (sorted within each skill)
+    b"SPWT": "d",   # postings weights (IDF included)
+    b"SORD": "I",   # skill ids sorted by name
+    b"ALIA": "I",   # alias string id, skill string id pairs
+    b"META": "B",   # JSON: labels, career paths, counts
+}
+
+
+def is_snapshot(path):
+    try:
+        with open(path, "rb") as f:
+            return f.read(len(MAGIC)) == MAGIC
+    except OSError:
+        return False
+
+
+# ===== WRITING =====
+class _Strings:
+    def __init__(self):
+        self.ids = {}
+        self.offsets = array("I", [0])
+        self.data = bytearray()
+
+    def intern(self, text):
+        sid = self.ids.get(text)
+        if sid is None:
+            sid = self.ids[text] = len(self.offsets) - 1
+            self.data += text.encode("utf-8")
+            self.offsets.append(len(self.data))
+        return sid
+
+
+def write_snapshot(catalog, path):
+    """Compile a Catalog (any source) into a binary snapshot file"""
+    index = catalog.skill_index
+    jobs = list(index.jobs)
+    known = set(jobs)
+    jobs.extend(job for job in catalog.job_details if job not in known)
+
+    strings = _Strings()
+
+    n = len(jobs)
+    title = array("I", bytes(4 * n))
+    description = array("I", [NO_STRING]) * n
+    salary_min = array("i", bytes(4 * n))
+    salary_max = array("i", bytes(4 * n))
+    salary_mid = array("q", bytes(8 * n))
+    ai_code = array("B", [AIImpact.MEDIUM]) * n
+    ai_rank = array("b", [AIImpact.MEDIUM]) * n
+    cert_ptr = array("I", [0])
+    certs = array("I")
+    for job_id, job in enumerate(jobs):
+        title[job_id] = strings.intern(job)
+        record = catalog.job_details.get(job)
+        if record is not None:
+            description[job_id] = strings.intern(record.description)
+            salary_min[job_id], salary_max[job_id] = record.salary
+            salary_mid[job_id] = record.salary_mid
+            ai_code[job_id] = ai_rank[job_id] = record.ai_impact
+            certs.extend(strings.intern(c) for c in record.certificates)
+        cert_ptr.append(len(certs))
+    job_order = array("I", sorted(range(n), key=jobs.__getitem__))
+
+    skill = array("I", (strings.intern(s) for s in index.skills))
+    postings_ptr = array("I", [0])
+    postings_jobs = array("i")
+    postings_weights = array("d")
+    for ids, weights in index.postings:
+        postings_jobs.extend(ids)
+        postings_weights.extend(weights)
+        postings_ptr.append(len(postings_jobs))
+    skill_order = array("I", sorted(range(len(index.skills)), key=index.skills.__getitem__))
+
+    aliases = array("I")
+    for alias, target in catalog.skill_aliases.items():
+        aliases.extend((strings.intern(alias), strings.intern(target)))
+
+    meta = json.dumps({
+        "ai_impact_labels": [impact.label for impact in AIImpact],
+        "career_paths": [dict(p) for p in catalog.career_paths],
+        "jobs_with_details": len(catalog.job_details),
+    }, ensure_ascii=False).encode("utf-8")
+
+    sections = [
+        (b"STRO", strings.offsets), (b"STRD", strings.data),
+        (b"JTTL", title), (b"JDSC", description), (b"JSMN", salary_min), (b"JSMX", salary_max),
+        (b"JMID", salary_mid), (b"JAIC", ai_code), (b"JAIR", ai_rank),
+        (b"JCPT", cert_ptr), (b"JCRT", certs), (b"JORD", job_order),
+        (b"SKIL", skill), (b"SPTR", postings_ptr), (b"SPJB", postings_jobs),
+        (b"SPWT", postings_weights), (b"SORD", skill_order),
+        (b"ALIA", aliases), (b"META", meta),
+    ]
+
+    offset = _align(HEADER.size + SECTION.size * len(sections))
+    table = []
+    for name, data in sections:
+        payload = data.tobytes() if isinstance(data, array) else bytes(data)
+        table.append((name, offset, payload))
+        offset = _align(offset + len(payload))
+
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, FORMAT_VERSION, int(catalog.version), len(sections)))
+        for name, at, payload in table:
+            f.write(SECTION.pack(name, at, len(payload)))
+        for name, at, payload in table:
+            f.write(b"\0" * (at - f.tell()))
+            f.write(payload)
+    os.replace(tmp_path, path)
+    return path
+
+
+def _align(offset, to=8):
+    return (offset + to - 1) // to * to
+
+
+# ===== READING =====
+class _Titles(Sequence):
+    """Job id -> title, decoded on access"""
+
+    def __init__(self, snapshot):
+        self._snapshot = snapshot
+
+    def __len__(self):
+        return self._snapshot.n_jobs
+
+    def __getitem__(self, job_id):
+        if isinstance(job_id, slice):
+            return [self[i] for i in range(*job_id.indices(len(self)))]
+        return self._snapshot.string(self._snapshot.sections[b"JTTL"][job_id])
+
+
+class SkillMapView(Mapping):
+    """skill -> tuple of job titles, straight from the postings arrays"""
+
+    def __init__(self, snapshot):
+        self._snapshot = snapshot
+
+    def __len__(self):
+        return self._snapshot.n_skills
+
+    def __iter__(self):
+        s = self._snapshot
+        return (s.string(sid) for sid in s.sections[b"SKIL"])
+
+    def __getitem__(self, skill):
+        s = self._snapshot
+        skill_id = s.find(skill, b"SORD", b"SKIL")
+        if skill_id is None:
+            raise KeyError(skill)
+        start, end = s.sections[b"SPTR"][skill_id], s.sections[b"SPTR"][skill_id + 1]
+        return tuple(s.title(j) for j in s.sections[b"SPJB"][start:end])
+
+
+class JobDetailsView(Mapping):
+    """job title -> details mapping, decoded per lookup
+
+    values() and items() decode the jobs in snapshot order instead of
+    looking each title up again.
+    """
+
+    def __init__(self, snapshot):
+        self._snapshot = snapshot
+
+    def __len__(self):
+        return self._snapshot.meta["jobs_with_details"]
+
+    def _job_ids(self):
+        descriptions = self._snapshot.sections[b"JDSC"]
+        return (j for j in range(self._snapshot.n_jobs) if descriptions[j] != NO_STRING)
+
+    def __iter__(self):
+        return map(self._snapshot.title, self._job_ids())
+
+    def values(self):
+        return _DetailsValues(self)
+
+    def items(self):
+        return _DetailsItems(self)
+
+    def __contains__(self, job):
+        job_id = self._snapshot.job_id(job)
+        return job_id is not None and self._snapshot.sections[b"JDSC"][job_id] != NO_STRING
+
+    def __getitem__(self, job):
+        s = self._snapshot
+        job_id = s.job_id(job)
+        if job_id is None or s.sections[b"JDSC"][job_id] == NO_STRING:
+            raise KeyError(job)
+        return s.details(job_id)
+
+
+class _DetailsValues(ValuesView):
+    def __iter__(self):
+        return self._mapping._snapshot.iter_details(self._mapping._job_ids())
+
+
+class _DetailsItems(ItemsView):
+    def __iter__(self):
+        return ((job.title, job) for job in _DetailsValues(self._mapping))
+
+
+class Snapshot:
+    """Memory-mapped snapshot file with typed section views"""
+
+    def __init__(self, path):
+        self.path = path
+        with open(path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        buffer = memoryview(self._mmap)
+        magic, fmt, self.catalog_version, count = HEADER.unpack_from(buffer, 0)
+        if magic != MAGIC:
+            raise ValueError(f"{path} is not a catalog snapshot")
+        if fmt != FORMAT_VERSION:
+            raise ValueError(f"{path}: unsupported snapshot format {fmt} (expected {FORMAT_VERSION})")
+
+        self.sections = {}
+        for i in range(count):
+            name, offset, length = SECTION.unpack_from(buffer, HEADER.size + i * SECTION.size)
+            view = buffer[offset:offset + length]
+            self.sections[name] = view.cast(SECTION_FORMATS[name])
+        self.meta = json.loads(bytes(self.sections[b"META"]))
+        self.n_jobs = len(self.sections[b"JTTL"])
+        self.n_skills = len(self.sections[b"SKIL"])
+        self._labels = self.meta["ai_impact_labels"]
+
+    def string(self, sid):
+        offsets = self.sections[b"STRO"]
+        return bytes(self.sections[b"STRD"][offsets[sid]:offsets[sid + 1]]).decode("utf-8")
+
+    def title(self, job_id):
+        return self.string(self.sections[b"JTTL"][job_id])
+
+    def find(self, name, order_section, name_section):
+        """Binary search a name through a sort-order section; returns its id"""
+        order, names = self.sections[order_section], self.sections[name_section]
+        lo, hi = 0, len(order)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self.string(names[order[mid]]) < name:
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo < len(order) and self.string(names[order[lo]]) == name:
+            return order[lo]
+        return None
+
+    def job_id(self, job):
+        return self.find(job, b"JORD", b"JTTL")
+
+    def details(self, job_id):
+        s = self.sections
+        start, end = s[b"JCPT"][job_id], s[b"JCPT"][job_id + 1]
+        return Job(
+            self.title(job_id),
+            self.string(s[b"JDSC"][job_id]),
+            s[b"JSMN"][job_id],
+            s[b"JSMX"][job_id],
+            (self.string(c) for c in s[b"JCRT"][start:end]),
+            self._labels[s[b"JAIC"][job_id]],
+        )
+
+    def iter_details(self, job_ids):
+        """details() for many jobs in a row, decoding each certificate name once"""
+        s = self.sections
+        descriptions, salary_min, salary_max, codes = s[b"JDSC"], s[b"JSMN"], s[b"JSMX"], s[b"JAIC"]
+        pointers, certificates = s[b"JCPT"], s[b"JCRT"]
+        names = {}
+        for job_id in job_ids:
+            cert_names = []
+            for sid in certificates[pointers[job_id]:pointers[job_id + 1]]:
+                name = names.get(sid)
+                if name is None:
+                    name = names[sid] = self.string(sid)
+                cert_names.append(name)
+            yield Job(self.title(job_id), self.string(descriptions[job_id]), salary_min[job_id],
+                      salary_max[job_id], cert_names, self._labels[codes[job_id]])
+
+    def skill_index(self):
+        """SkillIndex whose postings and columns are views into the mapping"""
+        s = self.sections
+        ptr, ids, weights = s[b"SPTR"], s[b"SPJB"], s[b"SPWT"]
+        postings = [(ids[ptr[i]:ptr[i + 1]], weights[ptr[i]:ptr[i + 1]]) for i in range(self.n_skills)]
+        skills = [self.string(sid) for sid in s[b"SKIL"]]
+        return SkillIndex(_Titles(self), skills, postings, s[b"JMID"], s[b"JAIR"])
+
+
+class SnapshotCatalog(Catalog):
+    """Catalog backed by a memory-mapped snapshot instead of in-memory dicts"""
+
+    def __init__(self, path, mtime=None):
+        self.snapshot = Snapshot(path)
+        self.skill_map = SkillMapView(self.snapshot)
+        self.job_details = JobDetailsView(self.snapshot)
+        s = self.snapshot
+        pairs = s.sections[b"ALIA"]
+        self.skill_aliases = MappingProxyType({
+            s.string(pairs[i]): s.string(pairs[i + 1]) for i in range(0, len(pairs), 2)
+        })
+        self.career_paths = tuple(MappingProxyType(p) for p in s.meta["career_paths"])
+        self.version = s.catalog_version
+        self.path = path
+        self.mtime = mtime
+
+    @cached_property
+    def skill_index(self):
+        return self.snapshot.skill_index()
+
+
+def load_snapshot(path, mtime=None):
+    return SnapshotCatalog(path, mtime=mtime)
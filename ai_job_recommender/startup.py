@@ -0,0 +1,215 @@
+"""Cold-start profiling and the startup budget
+
+Two entry points:
+
+* In-app: set AI_JOB_RECOMMENDER_PROFILE=1 and main.py records timing
+  marks for its first script run (imports, catalog, first render) and
+  prints a report to stderr. When the variable is unset every call is a
+  no-op.
+* Headless: `python -m ai_job_recommender startup` measures the app's
+  imports with `python -X importtime` and the time to first render in a
+  fresh interpreter, and exits non-zero when over STARTUP_BUDGET_MS.
+"""
+import ast
+import json
+import os
+import subprocess
+import sys
+import time
+
+PROFILE_ENV = "AI_JOB_RECOMMENDER_PROFILE"
+
+# Cold-start budget (milliseconds), checked by `python -m ai_job_recommender startup`
+STARTUP_BUDGET_MS = {
+    "package_imports": 100,     # ai_job_recommender modules imported by main.py
+    "first_render": 2500,       # fresh interpreter -> first script run finished
+}
+
+# Modules that must not be imported before the first recommendation/download
+HEAVY_MODULES = ("pandas", "numpy", "scipy", "openpyxl")
+
+# UI frameworks the core package must never import
+UI_MODULES = ("streamlit",)
+
+# The UI-free core: importable (and usable by the API/CLI) without Streamlit.
+# Every package module except __main__ (runs the CLI when imported) and batch
+# (needs the optional numpy/scipy; service.py imports it only for large batches).
+CORE_MODULES = (
+    "ai_job_recommender.autocomplete",
+    "ai_job_recommender.bitsets",
+    "ai_job_recommender.careers",
+    "ai_job_recommender.cache",
+    "ai_job_recommender.catalog",
+    "ai_job_recommender.certificates",
+    "ai_job_recommender.cli",
+    "ai_job_recommender.export",
+    "ai_job_recommender.extraction",
+    "ai_job_recommender.gaps",
+    "ai_job_recommender.instrumentation",
+    "ai_job_recommender.matching",
+    "ai_job_recommender.mining",
+    "ai_job_recommender.normalizer",
+    "ai_job_recommender.records",
+    "ai_job_recommender.rendering",
+    "ai_job_recommender.salaries",
+    "ai_job_recommender.search",
+    "ai_job_recommender.server",
+    "ai_job_recommender.service",
+    "ai_job_recommender.snapshot",
+    "ai_job_recommender.startup",
+)
+
+APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+# ===== IN-APP PROFILER =====
+class StartupProfiler:
+    """Records named time marks for the first script run of the process"""
+
+    def __init__(self, enabled=None):
+        if enabled is None:
+            enabled = os.environ.get(PROFILE_ENV, "") not in ("", "0")
+        self.enabled = enabled
+        self.start = None
+        self.marks = []
+        self.reported = False
+
+    def begin(self, start=None):
+        if not self.enabled or self.reported or self.start is not None:
+            return
+        self.start = time.perf_counter() if start is None else start
+
+    def mark(self, label):
+        if self.enabled and not self.reported and self.start is not None:
+            self.marks.append((label, time.perf_counter()))
+
+    def finish(self, stream=None):
+        """Print the report once (first run only) and stop recording"""
+        if not self.enabled or self.reported or self.start is None:
+            return None
+        self.mark("first render")
+        self.reported = True
+        report = self.report()
+        print(report, file=stream or sys.stderr)
+        return report
+
+    def report(self):
+        lines = ["===== STARTUP PROFILE ====="]
+        previous = self.start
+        for label, at in self.marks:
+            lines.append(f"{label:<24} +{(at - previous) * 1000:8.1f} ms   "
+                         f"(total {(at - self.start) * 1000:8.1f} ms)")
+            previous = at
+        heavy = [m for m in HEAVY_MODULES if m in sys.modules]
+        lines.append(f"heavy modules loaded: {', '.join(heavy) if heavy else 'none'}")
+        return "\n".join(lines)
+
+
+startup_profiler = StartupProfiler()
+
+
+# ===== HEADLESS MEASUREMENTS =====
+def script_imports(script="main.py", package="ai_job_recommender"):
+    """Sorted package modules a script imports at module level (read from its source)"""
+    with open(os.path.join(APP_DIR, script), "r", encoding="utf-8") as f:
+        tree = ast.parse(f.read(), script)
+    modules = set()
+    for node in tree.body:
+        if isinstance(node, ast.ImportFrom) and node.level == 0:
+            names = [node.module or ""]
+        elif isinstance(node, ast.Import):
+            names = [alias.name for alias in node.names]
+        else:
+            continue
+        modules.update(name for name in names if name.startswith(package + "."))
+    return tuple(sorted(modules))
+
+
+def parse_importtime(output):
+    """Parse `-X importtime` stderr into (module, self_us, cumulative_us, depth) rows"""
+    rows = []
+    for line in output.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        depth = (len(name) - len(name.lstrip(" "))) // 2
+        rows.append((name.strip(), int(self_us), int(cumulative_us), depth))
+    return rows
+
+
+def measure_imports(modules=None, python=sys.executable):
+    """Import modules (default: main.py's package imports) in a fresh interpreter under -X importtime"""
+    if modules is None:
+        modules = script_imports()
+    code = "; ".join(f"import {module}" for module in modules)
+    proc = subprocess.run([python, "-X", "importtime", "-c", code], cwd=APP_DIR,
+                          capture_output=True, text=True, check=True)
+    return parse_importtime(proc.stderr)
+
+
+def core_ui_imports(modules=CORE_MODULES, python=sys.executable):
+    """UI modules pulled in by importing the core in a fresh interpreter (should be none)"""
+    code = (f"import sys; {'; '.join(f'import {m}' for m in modules)}; "
+            f"print(','.join(m for m in {UI_MODULES!r} if m in sys.modules))")
+    proc = subprocess.run([python, "-c", code], cwd=APP_DIR, capture_output=True, text=True, check=True)
+    return [m for m in proc.stdout.strip().split(",") if m]
+
+
+_FIRST_RENDER_CODE = """
+import json, sys, time
+start = time.perf_counter()
+from streamlit.testing.v1 import AppTest
+imported = time.perf_counter()
+app = AppTest.from_file(sys.argv[1], default_timeout=60)
+app.run()
+done = time.perf_counter()
+heavy = [m for m in sys.argv[2:] if m in sys.modules]
+print(json.dumps({"streamlit_import_ms": (imported - start) * 1000,
+                  "first_render_ms": (done - start) * 1000,
+                  "errors": [str(e.value) for e in app.exception],
+                  "heavy_modules": heavy}))
+"""
+
+
+def measure_first_render(script="main.py", python=sys.executable):
+    """Run the app once, headless, in a fresh interpreter (needs streamlit)"""
+    proc = subprocess.run([python, "-c", _FIRST_RENDER_CODE, script, *HEAVY_MODULES],
+                          cwd=APP_DIR, capture_output=True, text=True, check=True)
+    return json.loads(proc.stdout.strip().splitlines()[-1])
+
+
+def check_startup(script="main.py", budget=None, top=10):
+    """Measure cold start against the budget; returns (ok, report text)"""
+    budget = dict(STARTUP_BUDGET_MS, **(budget or {}))
+    imports = measure_imports(("streamlit",) + script_imports(script))
+    package_us = sum(cum for name, _, cum, depth in imports
+                     if depth == 0 and name.startswith("ai_job_recommender"))
+    render = measure_first_render(script)
+
+    results = {
+        "package_imports": package_us / 1000,
+        "first_render": render["first_render_ms"],
+    }
+    lines = ["===== COLD START ====="]
+    ok = True
+    for name, value in results.items():
+        over = value > budget[name]
+        ok = ok and not over
+        lines.append(f"{name:<18} {value:8.1f} ms   budget {budget[name]:6d} ms   "
+                     f"{'OVER BUDGET' if over else 'ok'}")
+    lines.append(f"{'streamlit import':<18} {render['streamlit_import_ms']:8.1f} ms   (not budgeted)")
+    if render["heavy_modules"]:
+        ok = False
+        lines.append(f"heavy modules imported at startup: {', '.join(render['heavy_modules'])}")
+    ui = core_ui_imports()
+    if ui:
+        ok = False
+        lines.append(f"core package imports UI modules: {', '.join(ui)}")
+    if render["errors"]:
+        ok = False
+        lines.append(f"app raised: {'; '.join(render['errors'])}")
+
+    lines.append(f"slowest imports (cumulative, top {top}):")
+    for name, self_us, cum_us, depth in sorted(imports, key=lambda r: r[2], reverse=True)[:top]:
+        lines.append(f"  {cum_us / 1000:8.1f} ms  {self_us / 1000:7.1f} ms self  {name}")
+    return ok, "\n".join(lines)
@@ -0,0 +1,85 @@
+"""Synthetic job postings corpus for the skill-map builder
+
+Each posting takes a title from the bundled catalog, so mined weights can
+be checked against the catalog's own skill map: most of the job's skills
+are mentioned (under their name or a prose alias), a few random skills are
+mixed in as noise, and the rest is filler text. Pick a size by postings
+or by bytes:
+
+    python -m benchmarks.corpus -o postings.jsonl --postings 100000
+    python -m benchmarks.corpus -o postings.jsonl --gigabytes 2
+    python -m ai_job_recommender build-skill-map postings.jsonl -o mined.json --workers 4
+"""
+import argparse
+import json
+import random
+import sys
+
+from ai_job_recommender.catalog import get_catalog
+
+FILLER = ("we are hiring a motivated professional to join our growing team in dubai. "
+          "you will work closely with stakeholders across the business and report to the head of department. "
+          "competitive package, annual flights and medical insurance. ").split()
+FILLER_WORDS = (40, 160)
+MENTION_RATE = 0.8
+NOISE_SKILLS = 2
+
+
+def synthetic_postings(catalog, seed=0):
+    """Endless stream of posting dicts over the catalog's jobs"""
+    rng = random.Random(seed)
+    job_skills = {}
+    for skill, jobs in catalog.skill_map.items():
+        for job in jobs:
+            job_skills.setdefault(job, []).append(skill)
+    # Aliases the extractor looks for in prose (short ones like "js" are left out)
+    spellings = {}
+    for spelling, skill in catalog.skill_extractor.names.items():
+        if spelling != skill:
+            spellings.setdefault(skill, []).append(spelling)
+    titles = [title for title in catalog.job_details if title in job_skills]
+    skills = list(catalog.skill_map)
+    while True:
+        title = rng.choice(titles)
+        job = catalog.job_details[title]
+        mentioned = [s for s in job_skills[title] if rng.random() < MENTION_RATE]
+        mentioned += rng.sample(skills, NOISE_SKILLS)
+        words = rng.choices(FILLER, k=rng.randint(*FILLER_WORDS))
+        for skill in mentioned:
+            words.insert(rng.randrange(len(words) + 1), rng.choice([skill, *spellings.get(skill, ())]))
+        spread = rng.randrange(0, 4000, 500)
+        yield {"title": title, "description": " ".join(words),
+               "salary_min": job.salary_min + spread, "salary_max": job.salary_max + spread}
+
+
+def write_corpus(path, postings=None, size=None, seed=0):
+    """Write JSONL postings until the count or byte size is reached; returns (postings, bytes)"""
+    count = written = 0
+    with open(path, "w", encoding="utf-8") as f:
+        for posting in synthetic_postings(get_catalog(), seed):
+            if (postings is not None and count >= postings) or (size is not None and written >= size):
+                break
+            line = json.dumps(posting) + "\n"
+            f.write(line)
+            count += 1
+            written += len(line)
+    return count, written
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-o", "--output", required=True, help="JSONL file to write")
+    parser.add_argument("--postings", type=int, help="Number of postings")
+    parser.add_argument("--gigabytes", type=float, help="Approximate file size instead of a count")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+    if args.postings is None and args.gigabytes is None:
+        parser.error("pass --postings or --gigabytes")
+    size = int(args.gigabytes * 1e9) if args.gigabytes is not None else None
+    count, written = write_corpus(args.output, args.postings, size, args.seed)
+    print(f"Wrote {count:,} postings ({written / 1e6:,.1f} MB) to {args.output}", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
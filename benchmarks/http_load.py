@@ -0,0 +1,121 @@
+"""Load test for the JSON API: p50/p99 latency and requests per second
+
+Starts `python -m ai_job_recommender serve --port 0` (or targets --url),
+opens --connections keep-alive connections and sends --requests requests
+spread across them as fast as the server answers.
+
+    python -m benchmarks.http_load [--requests 20000] [--connections 32]
+"""
+import argparse
+import asyncio
+import json
+import random
+import subprocess
+import sys
+import time
+from urllib.parse import quote, urlsplit
+
+from ai_job_recommender.catalog import get_catalog
+
+DEFAULT_PATH = "/recommend"
+
+
+def sample_paths(n, seed=0):
+    """/recommend GETs over random 1-5 skill profiles from the bundled catalog"""
+    rng = random.Random(seed)
+    skills = sorted(get_catalog().skill_map)
+    return [
+        f"{DEFAULT_PATH}?skills={quote(', '.join(rng.sample(skills, rng.randint(1, 5))))}&k=10"
+        for _ in range(n)
+    ]
+
+
+async def _connection(host, port, paths, latencies, errors):
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        for path in paths:
+            start = time.perf_counter()
+            writer.write(f"GET {path} HTTP/1.1\r\nHost: {host}\r\n\r\n".encode("latin-1"))
+            status = int((await reader.readline()).split()[1])
+            length = 0
+            while True:
+                line = await reader.readline()
+                if line in (b"\r\n", b""):
+                    break
+                name, _, value = line.decode("latin-1").partition(":")
+                if name.lower() == "content-length":
+                    length = int(value)
+            await reader.readexactly(length)
+            latencies.append(time.perf_counter() - start)
+            if status != 200:
+                errors.append(status)
+    finally:
+        writer.close()
+
+
+async def run_load(host, port, paths, connections):
+    latencies, errors = [], []
+    shares = [paths[i::connections] for i in range(connections)]
+    start = time.perf_counter()
+    await asyncio.gather(*(_connection(host, port, share, latencies, errors) for share in shares if share))
+    elapsed = time.perf_counter() - start
+    latencies.sort()
+    return {
+        "requests": len(latencies),
+        "errors": len(errors),
+        "connections": connections,
+        "seconds": round(elapsed, 3),
+        "rps": round(len(latencies) / elapsed, 1),
+        "p50_ms": round(percentile(latencies, 50) * 1000, 3),
+        "p99_ms": round(percentile(latencies, 99) * 1000, 3),
+        "max_ms": round(latencies[-1] * 1000, 3),
+    }
+
+
+def percentile(sorted_values, pct):
+    if not sorted_values:
+        return 0.0
+    return sorted_values[min(len(sorted_values) - 1, int(len(sorted_values) * pct / 100))]
+
+
+def start_server(extra_args=()):
+    """Spawn the API on a free port; returns (process, host, port)"""
+    process = subprocess.Popen(
+        [sys.executable, "-m", "ai_job_recommender", "serve", "--port", "0", *extra_args],
+        stdout=subprocess.PIPE, text=True)
+    line = process.stdout.readline()
+    if not line.startswith("Serving on"):
+        process.kill()
+        raise RuntimeError(f"server did not start: {line!r}")
+    url = urlsplit(line.split()[-1])
+    return process, url.hostname, url.port
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=20_000)
+    parser.add_argument("--connections", type=int, default=32)
+    parser.add_argument("--url", help="Existing server, e.g. http://127.0.0.1:8000 (default: spawn one)")
+    parser.add_argument("--batch-window-ms", type=float, help="Passed to the spawned server")
+    args = parser.parse_args(argv)
+
+    paths = sample_paths(args.requests)
+    process = None
+    if args.url:
+        url = urlsplit(args.url)
+        host, port = url.hostname, url.port
+    else:
+        extra = ["--batch-window-ms", str(args.batch_window_ms)] if args.batch_window_ms is not None else []
+        process, host, port = start_server(extra)
+    try:
+        asyncio.run(run_load(host, port, paths[:args.connections], args.connections))   # warm-up
+        result = asyncio.run(run_load(host, port, paths, args.connections))
+    finally:
+        if process is not None:
+            process.terminate()
+            process.wait()
+    print(json.dumps(result, indent=2))
+
+
+if __name__ == "__main__":
+    main()
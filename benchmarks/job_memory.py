@@ -0,0 +1,80 @@
+"""Memory per job: nested dicts vs Job records
+
+Builds the same synthetic job_details twice from JSON text, once kept as
+the parsed dict layout and once converted to Job records, and reports
+traced bytes per job for each.
+
+    python -m benchmarks.job_memory [--jobs 100000] [--certificates 3]
+"""
+import argparse
+import gc
+import json
+import random
+import tracemalloc
+
+from ai_job_recommender.records import AIImpact, Job
+
+CERTIFICATE_POOL = 400
+
+
+def synthetic_job_details(n_jobs, certificates=3, seed=0):
+    """JSON text in the catalog's job_details layout"""
+    rng = random.Random(seed)
+    pool = [f"Certificate {i:03d}" for i in range(CERTIFICATE_POOL)]
+    labels = [impact.label for impact in AIImpact]
+    details = {}
+    for i in range(n_jobs):
+        low = rng.randrange(8000, 90000, 500)
+        details[f"Job {i:07d}"] = {
+            "description": f"Synthetic posting {i} for layout benchmarking.",
+            "salary": [low, low + rng.randrange(5000, 60000, 500)],
+            "certificates": rng.sample(pool, certificates),
+            "ai_impact": rng.choice(labels),
+        }
+    return json.dumps(details)
+
+
+def dict_layout(text):
+    return json.loads(text)
+
+
+def record_layout(text):
+    return {job: Job.from_dict(job, details) for job, details in json.loads(text).items()}
+
+
+def traced_bytes(build, text):
+    """Bytes still allocated after build(text), i.e. what the layout keeps alive"""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    layout = build(text)
+    gc.collect()
+    kept = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    return kept, len(layout)
+
+
+def run(n_jobs, certificates=3):
+    text = synthetic_job_details(n_jobs, certificates)
+    results = {}
+    for name, build in (("dict", dict_layout), ("Job record", record_layout)):
+        kept, count = traced_bytes(build, text)
+        results[name] = kept / count
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--jobs", type=int, default=100_000)
+    parser.add_argument("--certificates", type=int, default=3, help="certificates per job")
+    args = parser.parse_args(argv)
+
+    results = run(args.jobs, args.certificates)
+    baseline = results["dict"]
+    print(f"{args.jobs:,} jobs, {args.certificates} certificates each")
+    for name, per_job in results.items():
+        print(f"{name:<12} {per_job:8.0f} bytes/job   {per_job / baseline:6.1%} of dict layout")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,229 @@
+"""Benchmark suite for the per-click hot paths
+
+For each synthetic catalog size (10^2, 10^4 and 10^6 jobs by default),
+in a fresh interpreter so peak memory is per size:
+
+    index_build_ms        building the inverted skill index
+    query_p50_us/p99_us   one resolve + rank call (top 10)
+    batch_per_sec         profiles/sec through Recommender.recommend_many
+    search_index_ms       building the BM25 free-text index
+    search_p50_us/p99_us  one free-text search (top 10)
+    gap_index_ms          building the job x skill gap bitmaps (- when too large)
+    gap_analysis_us       one skill-gap analysis over a profile's top 10 matches
+    cert_index_ms         building the certificate <-> job bitsets
+    cert_plan_us          one certificate plan over a profile's top 10 matches
+    render_card_us        one create_job_card_html call
+    export_csv_us         CSV export of 100 rows
+    export_json_us        JSON export of 100 rows
+    peak_rss_mb           peak resident memory of the run
+
+Results go to a JSON file; pass --baseline to compare against an earlier
+run and exit non-zero if any metric regressed by more than --threshold.
+
+    python -m benchmarks.suite -o before.json
+    python -m benchmarks.suite --baseline before.json -o after.json
+"""
+import argparse
+import json
+import os
+import platform
+import resource
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+
+APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+DEFAULT_SIZES = (100, 10_000, 1_000_000)
+DEFAULT_THRESHOLD = 0.20
+EXPORT_ROWS = 100
+
+# Metrics where a larger value is better; every other metric is a cost
+HIGHER_IS_BETTER = ("batch_per_sec",)
+
+
+# ===== MEASUREMENTS =====
+def _timed(fn, *args):
+    start = time.perf_counter()
+    result = fn(*args)
+    return result, time.perf_counter() - start
+
+
+def _per_call(fn, repeat):
+    """Mean seconds per call of fn() over repeat calls"""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) / repeat
+
+
+def _percentile(sorted_values, pct):
+    return sorted_values[min(len(sorted_values) - 1, int(len(sorted_values) * pct / 100))]
+
+
+def run_size(n_jobs):
+    """All metrics for one catalog size (runs in the current process)"""
+    from ai_job_recommender.export import job_row, to_csv, to_json
+    from ai_job_recommender.rendering import create_job_card_html, get_template
+    from ai_job_recommender.service import Recommender
+
+    from .synthetic import synthetic_catalog, synthetic_profiles, synthetic_queries
+
+    catalog = synthetic_catalog(n_jobs)
+    _, index_seconds = _timed(lambda: catalog.skill_index)
+    recommender = Recommender(catalog)
+
+    # Fewer repetitions on big catalogs, where each query walks long postings
+    queries = max(20, min(1000, 10_000_000 // n_jobs))
+    batch = max(50, min(5000, 50_000_000 // n_jobs))
+    profiles = synthetic_profiles(catalog, queries + batch)
+    recommender.recommend(profiles[0])
+
+    latencies = []
+    for text in profiles[:queries]:
+        start = time.perf_counter()
+        recommender.recommend(text)
+        latencies.append(time.perf_counter() - start)
+    latencies.sort()
+
+    _, batch_seconds = _timed(recommender.recommend_many, profiles[queries:])
+
+    _, search_index_seconds = _timed(lambda: catalog.search_index)
+    search_latencies = []
+    for text in synthetic_queries(queries):
+        start = time.perf_counter()
+        recommender.search(text, k=10)
+        search_latencies.append(time.perf_counter() - start)
+    search_latencies.sort()
+
+    recommendations = recommender.recommend_many(profiles[:queries])
+    recommended = [[m.job for m in recommendation.matches] for recommendation in recommendations]
+    gap_index, gap_index_seconds = _timed(lambda: catalog.skill_gaps)
+    gap_seconds = None
+    if gap_index is not None:
+        _, gap_seconds = _timed(lambda: [recommender.skill_gaps(r.skill_ids, titles)
+                                         for r, titles in zip(recommendations, recommended)])
+
+    _, cert_index_seconds = _timed(lambda: catalog.certificate_index)
+    _, plan_seconds = _timed(recommender.certificate_plans, recommended)
+
+    jobs = [catalog.job_details[title] for title in list(catalog.job_details)[:EXPORT_ROWS]]
+    template = get_template()
+    scale = catalog.salary_stats.max_mid
+    render_seconds = _per_call(lambda: create_job_card_html(jobs[0], template, scale), 2000) if template else None
+    rows = [job_row(job) for job in jobs]
+
+    return {
+        "jobs": n_jobs,
+        "skills": len(catalog.skill_map),
+        "index_build_ms": index_seconds * 1000,
+        "query_p50_us": _percentile(latencies, 50) * 1e6,
+        "query_p99_us": _percentile(latencies, 99) * 1e6,
+        "batch_per_sec": batch / batch_seconds,
+        "search_index_ms": search_index_seconds * 1000,
+        "search_p50_us": _percentile(search_latencies, 50) * 1e6,
+        "search_p99_us": _percentile(search_latencies, 99) * 1e6,
+        "gap_index_ms": gap_index_seconds * 1000 if gap_index is not None else None,
+        "gap_analysis_us": gap_seconds / len(recommended) * 1e6 if gap_seconds is not None else None,
+        "cert_index_ms": cert_index_seconds * 1000,
+        "cert_plan_us": plan_seconds / len(recommended) * 1e6,
+        "render_card_us": render_seconds * 1e6 if render_seconds is not None else None,
+        "export_csv_us": _per_call(lambda: to_csv(rows), 200) * 1e6,
+        "export_json_us": _per_call(lambda: to_json(rows), 200) * 1e6,
+        # Linux reports ru_maxrss in KiB
+        "peak_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+    }
+
+
+def run_isolated(n_jobs, python=sys.executable):
+    """run_size in a fresh interpreter, so memory and caches don't leak between sizes"""
+    proc = subprocess.run([python, "-m", "benchmarks.suite", "--child", str(n_jobs)],
+                          cwd=APP_DIR, capture_output=True, text=True, check=True)
+    return json.loads(proc.stdout.strip().splitlines()[-1])
+
+
+def run_suite(sizes=DEFAULT_SIZES):
+    return {
+        "meta": {
+            "commit": _git_commit(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "date": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        },
+        "results": {str(n): run_isolated(n) for n in sizes},
+    }
+
+
+def _git_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=APP_DIR,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+# ===== COMPARISON =====
+def compare(baseline, current, threshold=DEFAULT_THRESHOLD):
+    """[(size, metric, before, after, change)] for metrics worse by more than threshold"""
+    regressions = []
+    for size, metrics in current["results"].items():
+        before_metrics = baseline["results"].get(size, {})
+        for metric, after in metrics.items():
+            before = before_metrics.get(metric)
+            if metric in ("jobs", "skills") or not before or after is None:
+                continue
+            change = (before - after) / before if metric in HIGHER_IS_BETTER else (after - before) / before
+            if change > threshold:
+                regressions.append((size, metric, before, after, change))
+    return regressions
+
+
+def format_results(suite):
+    sizes = list(suite["results"])
+    metrics = [m for m in suite["results"][sizes[0]] if m not in ("jobs",)]
+    lines = [f"{'metric':<16}" + "".join(f"{int(s):>14,}" for s in sizes)]
+    for metric in metrics:
+        cells = []
+        for size in sizes:
+            value = suite["results"][size].get(metric)
+            cells.append(f"{'-':>14}" if value is None else f"{value:>14,.1f}")
+        lines.append(f"{metric:<16}" + "".join(cells))
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", default=",".join(map(str, DEFAULT_SIZES)),
+                        help="Comma-separated catalog sizes (jobs)")
+    parser.add_argument("-o", "--output", default="benchmark-results.json", help="Results JSON file")
+    parser.add_argument("--baseline", help="Earlier results JSON to compare against")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="Allowed relative regression per metric (default: 0.20)")
+    parser.add_argument("--child", type=int, help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.child is not None:
+        print(json.dumps(run_size(args.child)))
+        return 0
+
+    suite = run_suite([int(s) for s in args.sizes.split(",") if s.strip()])
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(suite, f, indent=2)
+    print(format_results(suite))
+    print(f"Results written to {args.output}")
+
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions = compare(baseline, suite, args.threshold)
+        for size, metric, before, after, change in regressions:
+            print(f"REGRESSION {int(size):,} jobs {metric}: {before:,.1f} -> {after:,.1f} (+{change:.0%})")
+        if regressions:
+            return 1
+        print(f"No regressions above {args.threshold:.0%} against {args.baseline}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,71 @@
+"""Synthetic catalogs of any size for benchmarks
+
+Skill popularity follows a Zipf-like curve (a few broad skills such as
+"communication", a long tail of niche ones), so postings lengths look
+like the real catalog's at scale. Description words are drawn the same
+way for the free-text search index.
+"""
+import random
+from itertools import accumulate
+
+from ai_job_recommender.catalog import Catalog
+from ai_job_recommender.records import AIImpact, Job
+
+CERTIFICATE_POOL = 500
+WORD_POOL = 5000
+DESCRIPTION_WORDS = (6, 14)
+ZIPF_EXPONENT = 0.8
+
+
+def _zipf_weights(n):
+    return list(accumulate(1 / (rank + 1) ** ZIPF_EXPONENT for rank in range(n)))
+
+
+def skill_count(n_jobs):
+    """Vocabulary size for a catalog of n_jobs (45 skills for the bundled 73 jobs)"""
+    return max(40, min(20_000, n_jobs // 20))
+
+
+def synthetic_catalog(n_jobs, n_skills=None, skills_per_job=(3, 8), seed=0):
+    """Catalog with n_jobs Job records and a Zipf-weighted skill map"""
+    rng = random.Random(seed)
+    n_skills = n_skills or skill_count(n_jobs)
+    skills = [f"skill {i:05d}" for i in range(n_skills)]
+    cum_weights = _zipf_weights(n_skills)
+    words = [f"word{i}" for i in range(WORD_POOL)]
+    word_weights = _zipf_weights(WORD_POOL)
+    certificates = [f"Certificate {i:03d}" for i in range(CERTIFICATE_POOL)]
+    impacts = list(AIImpact)
+
+    skill_map = {skill: [] for skill in skills}
+    job_details = {}
+    low_k, high_k = skills_per_job
+    for i in range(n_jobs):
+        title = f"Job {i:07d}"
+        low = rng.randrange(8000, 90000, 500)
+        description = " ".join(rng.choices(words, cum_weights=word_weights, k=rng.randint(*DESCRIPTION_WORDS)))
+        job_details[title] = Job(title, description, low, low + rng.randrange(5000, 60000, 500),
+                                 rng.sample(certificates, 3), rng.choice(impacts))
+        for skill in set(rng.choices(skills, cum_weights=cum_weights, k=rng.randint(low_k, high_k))):
+            skill_map[skill].append(title)
+    return Catalog({s: jobs for s, jobs in skill_map.items() if jobs}, job_details)
+
+
+def synthetic_profiles(catalog, n_profiles, skills_per_profile=(1, 5), seed=1):
+    """Comma-separated skill strings drawn with the same popularity skew"""
+    rng = random.Random(seed)
+    skills = list(catalog.skill_map)
+    cum_weights = _zipf_weights(len(skills))
+    low, high = skills_per_profile
+    return [", ".join(set(rng.choices(skills, cum_weights=cum_weights, k=rng.randint(low, high))))
+            for _ in range(n_profiles)]
+
+
+def synthetic_queries(n_queries, words_per_query=(2, 6), seed=2):
+    """Free-text queries over the synthetic description vocabulary"""
+    rng = random.Random(seed)
+    words = [f"word{i}" for i in range(WORD_POOL)]
+    word_weights = _zipf_weights(WORD_POOL)
+    low, high = words_per_query
+    return [" ".join(rng.choices(words, cum_weights=word_weights, k=rng.randint(low, high)))
+            for _ in range(n_queries)]
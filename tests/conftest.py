@@ -0,0 +1,14 @@
+import pytest
+
+from benchmarks.synthetic import synthetic_catalog, synthetic_profiles
+
+
+@pytest.fixture(scope="session")
+def catalog():
+    """A 2,000-job synthetic catalog (Zipf-skewed skills, like the benchmarks)"""
+    return synthetic_catalog(2000, seed=7)
+
+
+@pytest.fixture(scope="session")
+def profiles(catalog):
+    return synthetic_profiles(catalog, 200, skills_per_profile=(1, 6), seed=11)
@@ -0,0 +1,43 @@
+import random
+
+import pytest
+
+from ai_job_recommender.autocomplete import RANK_SCAN_MAX, SkillCompleter
+
+
+def _expected(completer, prefix, limit):
+    """Brute-force completions: every name starting with prefix, ranked by popularity"""
+    skill_ids = {skill_id for name, skill_id in zip(completer.names, completer.name_skills)
+                 if name.startswith(prefix)}
+    ranked = sorted(skill_ids, key=lambda s: (-completer.popularity[s], completer.skills[s]))
+    return [completer.skills[s] for s in ranked[:limit]]
+
+
+def test_prefix_completions_ranked_by_popularity():
+    completer = SkillCompleter(["python", "pytorch", "pandas", "perl", "sql"], [50, 20, 30, 20, 90],
+                               aliases={"postgres": "sql", "py": "python"})
+    assert completer.complete("p") == ["sql", "python", "pandas", "perl", "pytorch"]
+    assert completer.complete("Py") == ["python", "pytorch"]
+    assert completer.complete("pos") == ["sql"]
+    assert completer.complete("x") == []
+    assert completer.complete("") == []
+    assert completer.complete_text("python, p") == ["sql", "pandas", "perl", "pytorch"]
+    assert completer.complete_text("python,") == []
+
+
+def test_limit_is_respected():
+    completer = SkillCompleter(["python", "pytorch", "pandas", "perl"], [4, 3, 2, 1])
+    assert completer.complete("p", limit=2) == ["python", "pytorch"]
+    assert completer.complete("p", limit=0) == []
+    assert completer.complete("p", limit=10) == ["python", "pytorch", "pandas", "perl"]
+    assert completer.complete("p", limit=2, exclude=["Python"]) == ["pytorch", "pandas"]
+
+
+@pytest.mark.parametrize("limit", [1, 8, 40])
+def test_catalog_completions_match_brute_force(catalog, limit):
+    completer = catalog.skill_completer
+    rng = random.Random(limit)
+    prefixes = {name[:rng.randint(1, 4)] for name in rng.sample(completer.names, 100)}
+    assert any(completer.range(p)[1] - completer.range(p)[0] > RANK_SCAN_MAX for p in prefixes)
+    for prefix in prefixes:
+        assert completer.complete(prefix, limit) == _expected(completer, prefix, limit)
@@ -0,0 +1,24 @@
+import pytest
+
+from ai_job_recommender.batch import recommend_batch
+
+
+@pytest.mark.parametrize("k", [1, 10, 50])
+def test_batch_matches_single_recommend(catalog, profiles, k):
+    index = catalog.skill_index
+    result = recommend_batch(profiles, index, k=k)
+    assert len(result) == len(profiles)
+    for profile, batch_matches in zip(profiles, result):
+        single, _ = index.recommend(profile, k=k)
+        assert [m.job for m in batch_matches] == [m.job for m in single]
+        assert [m.matched for m in batch_matches] == [m.matched for m in single]
+        assert [m.skills for m in batch_matches] == [m.skills for m in single]
+        assert [m.score for m in batch_matches] == pytest.approx([m.score for m in single])
+
+
+def test_batch_reports_unknown_skills(catalog):
+    skill = next(iter(catalog.skill_map))
+    result = recommend_batch([f"{skill}, not a skill", ["", "also missing"]], catalog.skill_index)
+    assert result.unknown == [["not a skill"], ["also missing"]]
+    assert result.matches(0)
+    assert result.matches(1) == []
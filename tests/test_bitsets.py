@@ -0,0 +1,13 @@
+import random
+
+from ai_job_recommender.bitsets import SHORT_BITSET, bitset, iter_bits
+
+
+def test_bitset_round_trips_short_and_long_sets():
+    rng = random.Random(0)
+    for size in (0, 1, SHORT_BITSET, SHORT_BITSET + 1, 1000):
+        indices = rng.sample(range(5000), size)
+        bits = bitset(indices)
+        assert bits.bit_count() == size
+        assert list(iter_bits(bits)) == sorted(indices)
+        assert bitset(iter(indices + indices[:3])) == bits
@@ -0,0 +1,39 @@
+from ai_job_recommender.cache import QueryResult, ResultCache, result_size
+from ai_job_recommender.export import LazyExport
+
+
+def _result(n_rows=50):
+    rows = [{"Job": f"Job {i}", "Description": "x" * 200} for i in range(n_rows)]
+    return QueryResult([], [], rows, LazyExport(rows))
+
+
+def test_materialized_exports_count_against_the_byte_budget():
+    stored = result_size(_result())
+    cache = ResultCache(max_entries=100, max_bytes=stored * 8)
+    results = [cache.put(("key", i), _result()) for i in range(8)]
+    assert len(cache) == 8
+    assert cache.stats["evictions"] == 0
+
+    for result in results:
+        for fmt in ("csv", "json"):
+            result.export.get(fmt)
+    assert cache.bytes <= cache.max_bytes
+    assert cache.stats["evictions"] > 0
+    assert len(cache) < 8
+    # The most recently stored entries survive, and evicted exports still serve their bytes
+    assert ("key", 7) in cache
+    assert results[0].export.get("csv")
+
+
+def test_export_bytes_are_charged_once_per_format():
+    cache = ResultCache(max_bytes=1 << 30)
+    result = cache.put("key", _result())
+    before = cache.bytes
+    data = result.export.get("csv")
+    result.export.get("csv")
+    assert cache.bytes == before + len(data)
+
+    cache.put("key", _result())                 # replaced: the old export no longer charges the cache
+    replaced = cache.bytes
+    result.export.get("json")
+    assert cache.bytes == replaced
@@ -0,0 +1,65 @@
+from collections import namedtuple
+
+from ai_job_recommender.careers import CareerGraph
+
+Details = namedtuple("Details", ["salary_mid"])
+
+PATHS = [
+    {"name": "Data", "icon": "", "title": "Data", "levels": {
+        "Entry Level": ["Data Analyst"],
+        "Mid Level": ["Data Scientist", "Data Engineer"],
+        "Senior Level": ["Lead Data Scientist"],
+        "Executive Level": ["Chief Data Officer"],
+    }},
+    {"name": "Engineering", "icon": "", "title": "Engineering", "levels": {
+        "Entry Level": ["Junior Developer"],
+        "Mid Level": ["Data Engineer"],
+        "Senior Level": ["Staff Engineer"],
+    }},
+]
+SALARIES = {"Data Analyst": 60, "Data Scientist": 100, "Data Engineer": 110, "Lead Data Scientist": 150,
+            "Chief Data Officer": 250, "Junior Developer": 55, "Staff Engineer": 180}
+
+
+def _graph():
+    return CareerGraph(PATHS, {role: Details(mid) for role, mid in SALARIES.items()})
+
+
+def test_shortest_path_to_reachable_target():
+    graph = _graph()
+    # Shared roles join paths: a junior developer can move into the data track
+    assert graph.shortest_path(["Junior Developer"], "Lead Data Scientist") == \
+        ["Junior Developer", "Data Engineer", "Lead Data Scientist"]
+    # Equally short routes take the best-paid next role
+    assert graph.shortest_path(["Data Analyst"], "Chief Data Officer") == \
+        ["Data Analyst", "Data Engineer", "Lead Data Scientist", "Chief Data Officer"]
+    # The closest of several sources wins
+    assert graph.shortest_path(["Data Analyst", "Data Scientist"], "Chief Data Officer") == \
+        ["Data Scientist", "Lead Data Scientist", "Chief Data Officer"]
+
+
+def test_shortest_path_to_unreachable_target():
+    graph = _graph()
+    assert graph.shortest_path(["Data Scientist"], "Staff Engineer") is None
+    assert graph.shortest_path(["Chief Data Officer"], "Data Analyst") is None
+    assert graph.shortest_path(["Data Analyst"], "Astronaut") is None
+    assert graph.shortest_path(["Astronaut"], "Data Engineer") is None
+    assert graph.shortest_path([], "Data Engineer") is None
+
+
+def test_shortest_path_from_the_target_itself():
+    graph = _graph()
+    assert graph.shortest_path(["Staff Engineer"], "Staff Engineer") == ["Staff Engineer"]
+    assert graph.shortest_path(["Data Analyst", "Data Engineer"], "Data Engineer") == ["Data Engineer"]
+
+
+def test_paths_agree_with_reachability(catalog):
+    graph = catalog.career_graph
+    for source in graph.roles[:50]:
+        for target in graph.roles[::7]:
+            path = graph.shortest_path([source], target)
+            assert (path is not None) == (source == target or graph.can_reach(source, target))
+            if path is not None:
+                assert path[0] == source and path[-1] == target
+                for a, b in zip(path, path[1:]):
+                    assert b in {role for role, _ in graph.next_roles(a)}
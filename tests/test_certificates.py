@@ -0,0 +1,65 @@
+import random
+from itertools import combinations
+
+import pytest
+
+
+def _opened(catalog, targets, certificates):
+    """Brute force: targets listing any of the certificates"""
+    certificates = set(certificates)
+    return {title for title in targets if certificates & set(catalog.job_details[title].certificates)}
+
+
+@pytest.mark.parametrize("n_targets", [1, 10, 200])
+def test_plan_covers_every_target(catalog, n_targets):
+    index = catalog.certificate_index
+    rng = random.Random(n_targets)
+    titles = list(catalog.job_details)
+    for _ in range(20):
+        targets = rng.sample(titles, n_targets)
+        plan = index.plan(targets)
+        chosen = [step.certificate for step in plan.steps]
+        assert len(set(chosen)) == len(chosen)
+        # Every synthetic job lists certificates, so the full plan opens all targets
+        assert _opened(catalog, targets, chosen) == set(targets)
+        assert plan.covered == len(targets)
+        assert plan.uncovered == []
+        stepped = [job for step in plan.steps for job in step.jobs]
+        assert sorted(stepped) == sorted(targets)
+        for step in plan.steps:
+            assert set(step.jobs) <= set(index.jobs_for(step.certificate))
+        assert [step.covered for step in plan.steps] == [sum(len(s.jobs) for s in plan.steps[:i + 1])
+                                                         for i in range(len(plan.steps))]
+
+
+def test_plan_stays_within_the_greedy_bound(catalog):
+    index = catalog.certificate_index
+    rng = random.Random(3)
+    titles = list(catalog.job_details)
+    for _ in range(30):
+        targets = rng.sample(titles, 4)
+        plan = index.plan(targets)
+        candidates = sorted({c for title in targets for c in catalog.job_details[title].certificates})
+        best = next(size for size in range(1, len(targets) + 1)
+                    if any(_opened(catalog, targets, combo) == set(targets)
+                           for combo in combinations(candidates, size)))
+        # Greedy set cover is within H(n) = 1 + 1/2 + ... + 1/n of the minimum
+        assert best <= len(plan.steps) <= best * sum(1 / i for i in range(1, len(targets) + 1))
+
+
+def test_limit_and_unknown_titles(catalog):
+    index = catalog.certificate_index
+    titles = list(catalog.job_details)[:50]
+    plan = index.plan(titles + ["No Such Job"], limit=1)
+    assert len(plan.steps) == 1
+    assert plan.covered == len(plan.steps[0].jobs)
+    assert "No Such Job" in plan.uncovered
+    assert plan.covered + len(plan.uncovered) == 51
+
+
+def test_lookups_agree_with_job_details(catalog):
+    index = catalog.certificate_index
+    for title in list(catalog.job_details)[:100]:
+        assert index.certificates_for(title) == sorted(catalog.job_details[title].certificates)
+        for certificate in index.certificates_for(title):
+            assert title in index.jobs_for(certificate)
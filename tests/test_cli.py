@@ -0,0 +1,48 @@
+import csv
+import io
+import json
+
+from ai_job_recommender.cli import main, read_profiles
+
+MALFORMED = "\n".join([
+    '{"id": "a", "skills": "python, sql"}',
+    '{"id": "b", "skills": null}',
+    '{"id": "c", "skills": 42}',
+    '{"id": "d", "skills": {"python": 1}}',
+    '{"id": "e", "skills": ["python", 3, null]}',
+    '{"id": "f"',
+    '17',
+    '["excel"]',
+])
+
+
+def test_read_profiles_coerces_malformed_rows():
+    profiles = list(read_profiles(io.StringIO(MALFORMED), "jsonl"))
+    assert profiles == [("a", "python, sql"), ("b", ""), ("c", ""), ("d", ""), ("e", ["python"]),
+                        (6, ""), (7, ""), (8, ["excel"])]
+
+
+def test_score_survives_malformed_rows(tmp_path):
+    source = tmp_path / "profiles.jsonl"
+    source.write_text(MALFORMED, encoding="utf-8")
+    output = tmp_path / "scored.jsonl"
+    assert main(["score", str(source), "-o", str(output)]) == 0
+    records = [json.loads(line) for line in output.read_text(encoding="utf-8").splitlines()]
+    assert [record["id"] for record in records] == ["a", "b", "c", "d", "e", 6, 7, 8]
+    assert records[0]["recommendations"]
+    assert records[1]["recommendations"] == []
+
+
+def test_csv_output_carries_certificate_plan(tmp_path):
+    source = tmp_path / "profiles.csv"
+    source.write_text("id,skills\n1,\"python, sql\"\n", encoding="utf-8")
+    output = tmp_path / "scored.csv"
+    assert main(["score", str(source), "-o", str(output), "--plan-certificates"]) == 0
+    with open(output, newline="", encoding="utf-8") as f:
+        rows = list(csv.DictReader(f))
+    assert "Plan Certificate" in rows[0]
+    planned = [row["Plan Certificate"] for row in rows if row["Plan Certificate"]]
+    assert planned
+    for row in rows:
+        if row["Plan Certificate"]:
+            assert row["Plan Certificate"] in row["Certificates"].split(", ")
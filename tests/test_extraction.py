@@ -0,0 +1,67 @@
+import pytest
+
+from ai_job_recommender.catalog import get_catalog
+from ai_job_recommender.extraction import SkillExtractor, prose_safe
+
+
+@pytest.fixture(scope="module")
+def extractor():
+    return get_catalog().skill_extractor
+
+
+@pytest.mark.parametrize("text", [
+    "Each node in a graph keeps a list of edges",
+    "Results (DL) were summarised in a short db note",
+    "Visited the UE office; js, py, tf and ml notes attached",
+])
+def test_short_aliases_do_not_fire_in_prose(extractor, text):
+    assert extractor.extract(text) == {}
+
+
+def test_names_and_prose_aliases_are_found(extractor):
+    found = extractor.extract("Shipped Node.js services in Python3 and PyTorch; Machine\nLearning and ui/ux work")
+    assert found == {"node.js": 1, "python": 1, "pytorch": 1, "machine learning": 1, "design": 1}
+
+
+def test_prose_safe():
+    assert not prose_safe("js")
+    assert not prose_safe("node")
+    assert prose_safe("python3")
+    assert prose_safe("ui/ux")
+    assert prose_safe("postgres")
+
+
+def test_stream_matches_whole_text_across_chunk_sizes():
+    extractor = SkillExtractor({"machine learning": "machine learning", "java": "java", "c++": "c++",
+                                "sql": "sql", "javascript": "javascript"})
+    text = ("Used java, JavaScript and SQL; machine learning (machine\n learning!) with c++. " * 40
+            + "no punctuation here java sql machine learning javascript " * 40)
+    whole = extractor.extract(text)
+    assert whole == {"java": 80, "javascript": 80, "sql": 80, "machine learning": 120, "c++": 40}
+    for size in (1, 7, 23, 64, 500):
+        chunks = [text[i:i + size] for i in range(0, len(text), size)]
+        assert extractor.extract_stream(chunks) == whole
+
+
+@pytest.mark.parametrize("text", [
+    "java and sql",
+    "sql",
+    "machine learning, then c++",
+    "javascript" + " sql" * 30,
+])
+def test_stream_finds_skills_at_the_start_of_the_text(text):
+    extractor = SkillExtractor({"machine learning": "machine learning", "java": "java", "c++": "c++",
+                                "sql": "sql", "javascript": "javascript"})
+    whole = extractor.extract(text)
+    assert whole
+    for size in range(1, len(text) + 1):
+        chunks = [text[i:i + size] for i in range(0, len(text), size)]
+        assert extractor.extract_stream(chunks) == whole, size
+        # Empty chunks (e.g. blank reads) change nothing
+        assert extractor.extract_stream([c for chunk in chunks for c in ("", chunk)] + [""]) == whole, size
+
+
+def test_stream_short_first_chunk():
+    extractor = SkillExtractor({"java": "java", "sql": "sql"})
+    assert extractor.extract_stream(["java", " and sql"]) == {"java": 1, "sql": 1}
+    assert extractor.extract_stream(["sql", ""]) == extractor.extract_stream(["", "sql"]) == {"sql": 1}
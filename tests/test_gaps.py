@@ -0,0 +1,53 @@
+import random
+
+import pytest
+
+
+def _brute_force(catalog, skill_ids, titles):
+    """The gap analysis computed with plain sets over the skill map"""
+    index = catalog.skill_index
+    user = {index.skills[i] for i in skill_ids}
+    job_skills = {}
+    for skill, jobs in catalog.skill_map.items():
+        for job in jobs:
+            job_skills.setdefault(job, set()).add(skill)
+    matched = {job for job, skills in job_skills.items() if skills & user}
+    mid = {job: catalog.job_details[job].salary_mid for job in job_skills}
+    best = max((mid[job] for job in matched), default=None)
+
+    missing = {title: job_skills[title] - user for title in titles}
+    gains = {}
+    for skill in set().union(*missing.values()):
+        new = {job for job, skills in job_skills.items() if skill in skills} - matched
+        gains[skill] = (
+            len(new),
+            sum(1 for lacking in missing.values() if lacking == {skill}),
+            max((mid[job] for job in new), default=None),
+            sum(1 for job in new if best is None or mid[job] > best),
+        )
+    return missing, gains
+
+
+@pytest.mark.parametrize("seed", range(4))
+def test_gap_analysis_matches_set_computation(catalog, seed):
+    gaps = catalog.skill_gaps
+    index = catalog.skill_index
+    rng = random.Random(seed)
+    for _ in range(25):
+        skill_ids = rng.sample(range(len(index.skills)), rng.randint(0, 5))
+        titles = [match.job for match in index.rank(skill_ids, 10)] or rng.sample(list(catalog.job_details), 3)
+        analysis = gaps.analyze(skill_ids, titles)
+        missing, gains = _brute_force(catalog, skill_ids, titles)
+
+        assert {title: set(skills) for title, skills in analysis.missing.items()} == missing
+        assert {g.skill: (g.new_jobs, g.completes, g.top_salary, g.better_paid) for g in analysis.gains} == gains
+        keys = [(-(g.new_jobs + g.completes), -(g.top_salary or 0), g.skill) for g in analysis.gains]
+        assert keys == sorted(keys)
+
+
+def test_limit_and_unknown_titles(catalog):
+    gaps = catalog.skill_gaps
+    analysis = gaps.analyze([0, 1], ["No Such Job", *list(catalog.skill_map[catalog.skill_index.skills[2]])[:5]],
+                            limit=3)
+    assert "No Such Job" not in analysis.missing
+    assert len(analysis.gains) <= 3
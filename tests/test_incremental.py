@@ -0,0 +1,44 @@
+import random
+
+import pytest
+
+
+def _ranked(matches):
+    return [(m.job, m.matched, m.skills) for m in matches], [m.score for m in matches]
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_incremental_edits_match_full_rank(catalog, seed):
+    index = catalog.skill_index
+    rng = random.Random(seed)
+    ranking = index.incremental()
+    skill_ids = []
+    for _ in range(60):
+        action = rng.random()
+        if action < 0.45 or not skill_ids:
+            skill_id = rng.randrange(len(index.skills))
+            ranking.add(skill_id)
+            if skill_id not in skill_ids:
+                skill_ids.append(skill_id)
+        elif action < 0.8:
+            skill_id = rng.choice(skill_ids)
+            assert ranking.remove(skill_id)
+            skill_ids.remove(skill_id)
+        else:
+            skill_ids = rng.sample(range(len(index.skills)), rng.randint(0, 6))
+            ranking.update(skill_ids)
+        assert ranking.skill_ids == skill_ids
+        for k in (None, 10):
+            jobs, scores = _ranked(ranking.rank(k))
+            expected_jobs, expected_scores = _ranked(index.rank(skill_ids, k))
+            assert jobs == expected_jobs
+            assert scores == pytest.approx(expected_scores)
+
+
+def test_removing_every_skill_leaves_no_scores(catalog):
+    index = catalog.skill_index
+    ranking = index.incremental(range(8))
+    ranking.update([])
+    assert ranking.scores == {}
+    assert ranking.rank() == []
+    assert not ranking.remove(0)
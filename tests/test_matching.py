@@ -0,0 +1,44 @@
+import random
+
+import pytest
+
+from ai_job_recommender.matching import PREFIX_SIZE, SkillIndex
+
+
+def _exhaustive(index, skill_ids, k, tie_breakers=("salary", "ai_impact")):
+    return index.rank_scores(index.score(skill_ids), skill_ids, k, tie_breakers)
+
+
+def _view(matches):
+    return [(m.job, m.matched, m.skills) for m in matches], [m.score for m in matches]
+
+
+@pytest.mark.parametrize("k", [1, 10, PREFIX_SIZE, PREFIX_SIZE + 1, 500])
+def test_pruned_top_k_matches_exhaustive_ranking(catalog, k):
+    index = catalog.skill_index
+    rng = random.Random(k)
+    skills = range(len(index.skills))
+    # Low skill ids are the broad ones in synthetic catalogs
+    queries = [[s] for s in range(20)] + [rng.sample(skills, rng.randint(2, 6)) for _ in range(100)]
+    queries += [rng.sample(range(10), rng.randint(2, 5)) for _ in range(50)]
+    for skill_ids in queries:
+        jobs, scores = _view(index.rank(skill_ids, k))
+        expected_jobs, expected_scores = _view(_exhaustive(index, skill_ids, k))
+        assert jobs == expected_jobs
+        assert scores == pytest.approx(expected_scores)
+
+
+def test_pruning_skips_broad_postings(catalog):
+    index = catalog.skill_index
+    broad, rare = 0, len(index.skills) - 1
+    scores = index.top_k_scores([broad, rare], 1)
+    assert len(scores) < len(index.postings[broad][0])
+
+
+def test_weighted_postings_and_tie_breakers():
+    index = SkillIndex.from_skill_map({"python": {"A": 1.0, "B": 0.5, "C": 0.5}, "sql": ["B", "C", "D"]})
+    assert [m.job for m in index.top_k(["python"], 2)] == ["A", "B"]
+    assert [m.job for m in index.top_k(["python", "sql"], 2)] == ["B", "C"]
+    assert [m.job for m in index.top_k(["python"], 2, tie_breakers=())] == ["A", "B"]
+    matches, unknown = index.recommend("Python, nope", k=1)
+    assert [m.job for m in matches] == ["A"] and unknown == ["nope"]
@@ -0,0 +1,47 @@
+import json
+
+from ai_job_recommender.catalog import Catalog
+from ai_job_recommender.mining import SkillMapBuilder, mine_chunk, mine_chunks
+
+NAMES = {"python": "python", "sql": "sql", "excel": "excel"}
+
+
+def _mine(lines):
+    (pairs, jobs, skipped, _), = mine_chunks([lines], NAMES)
+    return pairs, jobs, skipped
+
+
+def test_malformed_postings_are_skipped_or_read_as_text():
+    lines = [
+        "{not json",
+        json.dumps(["a", "list"]),
+        json.dumps({"description": "python, no title"}),
+        json.dumps({"title": 42, "description": "python"}),
+        json.dumps({"title": "Analyst", "requirements": 3, "description": "sql and excel"}),
+        json.dumps({"title": "analyst", "skills": ["Python", 7, None, ["SQL"]], "qualifications": {"x": "excel"}}),
+        json.dumps({"title": "Engineer", "text": True, "salary_min": "n/a", "description": 12.5}),
+    ]
+    pairs, jobs, skipped = _mine(lines)
+    assert skipped == 4
+    assert pairs == {("sql", "analyst"): 2, ("excel", "analyst"): 1, ("python", "analyst"): 1}
+    assert jobs["analyst"][:4] == [2, 0, 0, 0] and jobs["analyst"][4] == "Analyst"
+    assert jobs["engineer"][:4] == [1, 0, 0, 0] and jobs["engineer"][5] == "12.5 True"
+
+
+def test_csv_rows_and_dicts_are_mined_like_json_lines():
+    rows = [{"title": "Analyst", "description": "SQL and Python", "salary_min": "1000", "salary_max": "2000"}]
+    assert mine_chunk(rows)[:3] == _mine([json.dumps(rows[0])])
+
+
+def test_build_tolerates_malformed_lines(tmp_path):
+    path = tmp_path / "postings.jsonl"
+    good = [{"title": "Analyst", "description": "sql, excel", "salary_min": 1000, "salary_max": 3000}] * 3
+    bad = ["{broken", json.dumps({"title": "Analyst", "requirements": 3, "description": "python"})]
+    path.write_text("\n".join([json.dumps(p) for p in good] + bad) + "\n", encoding="utf-8")
+    base = Catalog({}, {})
+    builder = SkillMapBuilder(base, extra_skills=NAMES, min_postings=1)
+    catalog = builder.build(str(path))
+    assert catalog["skill_map"] == {"excel": {"Analyst": 0.75}, "python": {"Analyst": 0.25},
+                                    "sql": {"Analyst": 0.75}}
+    assert catalog["job_details"]["Analyst"]["salary"] == [1000, 3000]
+    assert builder.stats.snapshot()["counters"]["skipped"] == 1
@@ -0,0 +1,47 @@
+from ai_job_recommender.normalizer import SkillNormalizer, UNRESOLVED
+
+SKILLS = ["python", "javascript", "node.js", "machine learning", "sql"]
+ALIASES = {"js": "javascript", "ML": "Machine Learning", "nodejs": "node.js", "cobol": "fortran"}
+
+
+def test_exact_alias_and_case_mapping():
+    normalizer = SkillNormalizer(SKILLS, ALIASES)
+    assert normalizer.resolve("Python") == ("python", 1.0, "exact")
+    assert normalizer.resolve("  SQL ") == ("sql", 1.0, "exact")
+    assert normalizer.resolve("JS") == ("javascript", 0.95, "alias")
+    assert normalizer.resolve("ml") == ("machine learning", 0.95, "alias")
+    # Aliases pointing outside the vocabulary are dropped
+    assert normalizer.resolve("cobol") == UNRESOLVED
+
+
+def test_compact_and_typo_mapping():
+    normalizer = SkillNormalizer(SKILLS, ALIASES)
+    assert normalizer.resolve("Node JS") == ("node.js", 0.9, "compact")
+    assert normalizer.resolve("python3") == ("python", 0.9, "compact")
+    skill, confidence, method = normalizer.resolve("pyhton")
+    assert (skill, method) == ("python", "fuzzy")
+    assert normalizer.threshold <= confidence < 1.0
+    assert normalizer.resolve("javascrpt").skill == "javascript"
+    assert normalizer.resolve("machine lerning").skill == "machine learning"
+
+
+def test_unresolvable_tokens():
+    normalizer = SkillNormalizer(SKILLS, ALIASES)
+    assert normalizer.resolve("") == UNRESOLVED
+    assert normalizer.resolve("   ") == UNRESOLVED
+    assert normalizer.resolve("zzzzqqq") == UNRESOLVED
+
+
+def test_repeated_tokens_hit_the_cache():
+    normalizer = SkillNormalizer(SKILLS, ALIASES, cache_size=16)
+    first = normalizer.resolve("pyhton")
+    assert normalizer.cache_info().misses == 1
+    assert normalizer.resolve("pyhton") is first
+    info = normalizer.cache_info()
+    assert (info.hits, info.misses, info.currsize) == (1, 1, 1)
+
+
+def test_catalog_normalizer_resolves_every_skill(catalog):
+    normalizer = catalog.skill_normalizer
+    for skill in list(catalog.skill_map)[:200]:
+        assert normalizer.resolve(skill.upper()).skill == skill
@@ -0,0 +1,39 @@
+import csv
+import io
+import json
+
+from ai_job_recommender.export import LazyExport, job_row, to_csv
+from ai_job_recommender.records import AIImpact, Job
+from ai_job_recommender.rendering import card_blocks, create_job_card_html, get_template, visible_cards
+
+HOSTILE = Job("<script>alert(1)</script> Engineer", 'Builds "R&D" tools <img src=x onerror=alert(1)>',
+              10000, 20000, ["<b>Cert</b>", "A&B"], AIImpact.LOW)
+
+
+def test_card_escapes_catalog_text():
+    html = create_job_card_html(HOSTILE, get_template(), salary_scale=20000, missing_skills=["<i>sql</i>"])
+    assert "<script>" not in html
+    assert "<img" not in html
+    assert "<b>Cert</b>" not in html and "<i>sql</i>" not in html
+    assert "&lt;script&gt;alert(1)&lt;/script&gt; Engineer" in html
+    assert "&quot;R&amp;D&quot;" in html
+    assert "&lt;b&gt;Cert&lt;/b&gt;, A&amp;B" in html
+    assert "&lt;i&gt;sql&lt;/i&gt;" in html
+    assert "AED 10,000 - 20,000" in html
+    assert "width: 75%" in html
+
+
+def test_card_blocks_group_rendered_runs():
+    cards = [("a", "<div>a</div>"), ("b", "<div>b</div>"), ("c", None), ("d", "<div>d</div>")]
+    assert list(card_blocks(cards)) == [("<div>a</div>\n<div>b</div>", None), (None, "c"), ("<div>d</div>", None)]
+    assert visible_cards(cards, 3) == (cards[:3], 1)
+
+
+def test_exports_keep_raw_text():
+    rows = [job_row(HOSTILE)]
+    parsed = list(csv.DictReader(io.StringIO(to_csv(rows).decode("utf-8"))))
+    assert parsed[0]["Job"] == HOSTILE.title
+    assert parsed[0]["Certificates"] == "<b>Cert</b>, A&B"
+    export = LazyExport(rows)
+    assert json.loads(export.get("json")) == [dict(rows[0])]
+    assert export.get("json") is export.get("json")
@@ -0,0 +1,21 @@
+from ai_job_recommender.salaries import HISTOGRAM_WIDTH, histogram_bars, summarize
+
+
+def test_ranged_summary_covers_the_same_jobs_as_count(catalog):
+    stats = catalog.salary_stats
+    for impact in (None, "Low", "High"):
+        for low, high in ((None, None), (30000, None), (None, 40000), (25000, 60000)):
+            summary = stats.summary(ai_impact=impact, min_salary=low, max_salary=high)
+            mids = sorted(job.salary_mid for job in catalog.job_details.values()
+                          if (impact is None or job.ai_impact.label == impact)
+                          and (low is None or job.salary_mid >= low)
+                          and (high is None or job.salary_mid <= high))
+            assert summary == summarize(mids)
+            assert summary.count == stats.count(low, high, ai_impact=impact)
+
+
+def test_histogram_bars_are_capped(catalog):
+    bars = histogram_bars(catalog.salary_stats.summary().histogram)
+    assert max(len(bar) for _, _, bar in bars) == HISTOGRAM_WIDTH
+    assert all(bar for _, count, bar in bars if count)
+    assert histogram_bars([(0, 0)]) == [(0, 0, "")]
@@ -0,0 +1,26 @@
+import pytest
+
+from benchmarks.synthetic import synthetic_queries
+
+
+@pytest.mark.parametrize("k", [1, 10, 100])
+def test_maxscore_top_k_matches_exhaustive_bm25(catalog, k):
+    index = catalog.search_index
+    for query in synthetic_queries(300, words_per_query=(1, 8), seed=k):
+        term_ids, _ = index.lookup(query)
+        if not term_ids:
+            continue
+        exhaustive = index.score(term_ids)
+        expected = sorted(exhaustive.values(), reverse=True)[:k]
+        top = index.top_k(term_ids, k)
+        assert [score for score, _ in top] == pytest.approx(expected, rel=1e-6)
+        for score, doc_id in top:
+            assert exhaustive[doc_id] == pytest.approx(score, rel=1e-6)
+
+
+def test_rank_with_k_is_a_prefix_of_the_full_ranking(catalog):
+    index = catalog.search_index
+    for query in synthetic_queries(50, seed=5):
+        full, _ = index.search(query)
+        top, _ = index.search(query, k=10)
+        assert [m.score for m in top] == pytest.approx([m.score for m in full[:10]], rel=1e-6)
@@ -0,0 +1,85 @@
+import asyncio
+import json
+from urllib.parse import quote
+
+import pytest
+
+from ai_job_recommender.server import (MAX_BODY_BYTES, HTTPError, RecommendationServer, _read_request,
+                                       recommendation_json)
+from ai_job_recommender.service import Recommender
+
+
+def _read(raw):
+    async def read():
+        reader = asyncio.StreamReader()
+        reader.feed_data(raw)
+        reader.feed_eof()
+        return await _read_request(reader)
+    return asyncio.run(read())
+
+
+def _exchange(app, raw):
+    """Send raw bytes to a live server on an ephemeral port; returns (status, JSON body)"""
+    async def exchange():
+        server = await asyncio.start_server(app.handle_connection, "127.0.0.1", 0)
+        async with server:
+            reader, writer = await asyncio.open_connection(*server.sockets[0].getsockname()[:2])
+            writer.write(raw)
+            await writer.drain()
+            response = await reader.read()
+            writer.close()
+        head, _, body = response.partition(b"\r\n\r\n")
+        return int(head.split()[1]), json.loads(body)
+    return asyncio.run(exchange())
+
+
+def test_reads_a_request_with_a_body():
+    body = b'{"skills": "python"}'
+    raw = b"POST /recommend HTTP/1.1\r\nHost: x\r\nContent-Length: %d\r\n\r\n%s" % (len(body), body)
+    assert _read(raw) == ("POST", "/recommend", True, body)
+    assert _read(b"GET /health HTTP/1.0\r\n\r\n") == ("GET", "/health", False, b"")
+    assert _read(b"") is None
+
+
+@pytest.mark.parametrize("raw, status", [
+    (b"GET\r\n\r\n", 400),
+    (b"GET /health HTTP/1.1\r\nno colon here\r\n\r\n", 400),
+    (b"GET /health HTTP/1.1\r\n: empty name\r\n\r\n", 400),
+    (b"POST /recommend HTTP/1.1\r\nContent-Length: -1\r\n\r\n", 400),
+    (b"POST /recommend HTTP/1.1\r\nContent-Length: +5\r\n\r\nhello", 400),
+    (b"POST /recommend HTTP/1.1\r\nContent-Length: ten\r\n\r\n", 400),
+    (b"POST /recommend HTTP/1.1\r\nContent-Length: 1_0\r\n\r\n", 400),
+    (b"POST /recommend HTTP/1.1\r\nContent-Length: %d\r\n\r\n" % (MAX_BODY_BYTES + 1), 413),
+])
+def test_rejects_malformed_requests(raw, status):
+    with pytest.raises(HTTPError) as error:
+        _read(raw)
+    assert error.value.status == status
+
+
+def test_malformed_requests_get_an_error_response(catalog):
+    app = RecommendationServer(Recommender(catalog))
+    status, body = _exchange(app, b"POST /recommend HTTP/1.1\r\nContent-Length: -5\r\n\r\n")
+    assert status == 400 and body["error"] == "Invalid Content-Length"
+    status, _ = _exchange(app, b"POST /recommend HTTP/1.1\r\nContent-Length: %d\r\n\r\n" % (MAX_BODY_BYTES * 2))
+    assert status == 413
+    status, body = _exchange(app, b"GET /health HTTP/1.1\r\nConnection: close\r\n\r\n")
+    assert status == 200 and body["status"] == "ok"
+
+
+@pytest.mark.parametrize("window, max_batch", [(0.05, 64), (0.05, 8), (0, 1)])
+def test_batched_requests_match_recommend(catalog, profiles, window, max_batch):
+    recommender = Recommender(catalog)
+    app = RecommendationServer(recommender, window, max_batch)
+    requests = [(profile, 1 + i % 15) for i, profile in enumerate(profiles[:40])]
+
+    async def submit_all():
+        return await asyncio.gather(*(app.dispatch("GET", f"/recommend?skills={quote(skills)}&k={k}", b"")
+                                      for skills, k in requests))
+
+    responses = asyncio.run(submit_all())
+    for (skills, k), response in zip(requests, responses):
+        assert response == recommendation_json(recommender, recommender.recommend(skills, k))
+    assert app.batcher.stats["requests"] == len(requests)
+    if max_batch > 1:
+        assert app.batcher.stats["batches"] < len(requests)
@@ -0,0 +1,85 @@
+import random
+
+from ai_job_recommender.cache import ResultCache
+from ai_job_recommender.catalog import get_catalog
+from ai_job_recommender.export import job_row, to_csv
+from ai_job_recommender.rendering import CARDS_PER_PAGE, create_job_card_html, get_template
+from ai_job_recommender.service import Recommender
+
+
+def _broad_skills(catalog, n=3):
+    index = catalog.skill_index
+    return sorted(range(len(index.skills)), key=lambda s: -len(index.postings[s][0]))[:n]
+
+
+def _eager(recommender, skill_ids, template):
+    """What query_result used to build up front: every card and row of the full ranking"""
+    catalog = recommender.catalog
+    matches = catalog.skill_index.rank(skill_ids)
+    missing = catalog.skill_gaps.analyze(skill_ids, [m.job for m in matches]).missing
+    jobs = [catalog.job_details[m.job] for m in matches]
+    rows = [dict(job_row(job), **{"Missing Skills": ", ".join(missing[job.title])}) for job in jobs]
+    cards = [(job.title, create_job_card_html(job, template, catalog.salary_stats.max_mid, missing[job.title]))
+             for job in jobs]
+    return matches, cards, rows
+
+
+def test_query_result_builds_pages_on_demand(catalog):
+    recommender = Recommender(catalog)
+    template = get_template()
+    skill_ids = _broad_skills(catalog)
+    result = recommender.query_result(skill_ids, template)
+    matches, cards, rows = _eager(recommender, skill_ids, template)
+    assert len(result.matches) == len(result.cards) == len(result.job_list) == len(matches) > 3 * CARDS_PER_PAGE
+
+    assert result.cards[:CARDS_PER_PAGE] == cards[:CARDS_PER_PAGE]
+    first_page = result.cards.nbytes
+    assert first_page > 0 and result.job_list.nbytes == 0
+    assert result.cards[:2 * CARDS_PER_PAGE + 3] == cards[:2 * CARDS_PER_PAGE + 3]
+    assert result.cards[-1] == cards[-1]
+    assert list(result.matches) == matches
+
+    assert result.export.get("csv") == to_csv(rows)
+    assert list(result.job_list) == rows
+    assert list(result.cards) == cards
+    assert result.cards.nbytes > first_page
+
+
+def test_incremental_results_are_snapshots(catalog):
+    recommender = Recommender(catalog)
+    rng = random.Random(3)
+    ranking = recommender.incremental_ranking()
+    for _ in range(10):
+        skill_ids = rng.sample(range(len(catalog.skill_index.skills)), rng.randint(1, 4))
+        result = recommender.query_result(skill_ids, ranking=ranking)
+        ranking.update(rng.sample(range(len(catalog.skill_index.skills)), 2))
+        assert list(result.matches) == catalog.skill_index.rank(skill_ids)
+
+
+def test_built_pages_are_charged_to_the_cache(catalog):
+    cache = ResultCache(max_bytes=1 << 30)
+    recommender = Recommender(catalog, cache)
+    result = recommender.query_result(_broad_skills(catalog), get_template())
+    before = cache.bytes
+    result.cards[:CARDS_PER_PAGE]
+    first_page = cache.bytes
+    assert first_page > before
+    list(result.cards)
+    assert cache.bytes > first_page
+    assert cache.bytes == before + result.cards.nbytes
+
+
+def test_search_gaps_use_the_skills_named_in_the_text():
+    recommender = Recommender(get_catalog())
+    result, _ = recommender.search_result("analysing data with python and sql", get_template())
+    assert result.matches and result.gaps is not None
+    for row in result.job_list:
+        assert "python" not in row["Missing Skills"].split(", ")
+        assert "sql" not in row["Missing Skills"].split(", ")
+    assert result.gaps.missing["Data Analyst"] == ("excel",)
+
+    # No skills named: no gap analysis instead of every skill missing
+    result, _ = recommender.search_result("protecting networks from hackers", get_template())
+    assert result.matches and result.gaps is None
+    assert all("Missing Skills" not in row for row in result.job_list)
+    assert all('id="missing-skills-placeholder">—</span>' in html for _, html in result.cards)
@@ -0,0 +1,51 @@
+import json
+
+import pytest
+
+from ai_job_recommender.catalog import DEFAULT_CATALOG_PATH, compile_catalog, load_catalog, load_source
+from ai_job_recommender.snapshot import SnapshotCatalog, write_snapshot
+
+
+def _comparable(catalog):
+    """to_dict() with posting lists as sets (snapshots store them in job id order)"""
+    data = catalog.to_dict()
+    data["skill_map"] = {skill: set(jobs) for skill, jobs in data["skill_map"].items()}
+    return data
+
+
+def test_snapshot_round_trips_the_json_catalog(tmp_path):
+    source = load_source(DEFAULT_CATALOG_PATH)
+    path = compile_catalog(DEFAULT_CATALOG_PATH, str(tmp_path / "catalog.snapshot"))
+    snapshot = load_catalog(path)
+    assert isinstance(snapshot, SnapshotCatalog)
+    assert _comparable(snapshot) == _comparable(source)
+
+    # ...and back: the snapshot's JSON loads into the same catalog
+    path = tmp_path / "catalog.json"
+    path.write_text(json.dumps(snapshot.to_dict()), encoding="utf-8")
+    assert _comparable(load_catalog(str(path))) == _comparable(source)
+
+
+def test_snapshot_views_decode_in_snapshot_order(catalog, tmp_path):
+    snapshot = load_catalog(write_snapshot(catalog, str(tmp_path / "synthetic.snapshot")))
+    details = snapshot.job_details
+    titles = list(details)
+    assert len(titles) == len(details) == len(catalog.job_details)
+    assert list(details.values()) == [details[title] for title in titles]
+    assert list(details.items()) == list(zip(titles, details.values()))
+    assert dict(details.items()) == dict(catalog.job_details)
+    assert "no such job" not in details and details.get("no such job") is None
+
+
+def test_snapshot_ranks_like_the_source_catalog(catalog, profiles, tmp_path):
+    snapshot = load_catalog(write_snapshot(catalog, str(tmp_path / "synthetic.snapshot")))
+    for profile in profiles[:50]:
+        expected, _ = catalog.skill_index.recommend(profile, k=10)
+        assert snapshot.skill_index.recommend(profile, k=10)[0] == expected
+
+
+def test_unsupported_source(tmp_path):
+    path = tmp_path / "catalog.yaml"
+    path.write_text("{}", encoding="utf-8")
+    with pytest.raises(ValueError, match="Unsupported catalog source"):
+        load_catalog(str(path))
@@ -0,0 +1,29 @@
+import pkgutil
+
+import pytest
+
+import ai_job_recommender
+from ai_job_recommender.startup import CORE_MODULES, STARTUP_BUDGET_MS, check_startup, core_ui_imports, script_imports
+
+
+def test_script_imports_reads_main():
+    imports = script_imports("main.py")
+    assert imports == tuple(sorted(imports))
+    assert "ai_job_recommender.service" in imports and "ai_job_recommender.startup" in imports
+    assert all(name.startswith("ai_job_recommender.") for name in imports)
+
+
+def test_core_modules_cover_the_package():
+    modules = {f"ai_job_recommender.{m.name}" for m in pkgutil.iter_modules(ai_job_recommender.__path__)}
+    assert modules - set(CORE_MODULES) == {"ai_job_recommender.__main__", "ai_job_recommender.batch"}
+    assert set(CORE_MODULES) <= modules
+    assert core_ui_imports() == []
+
+
+def test_cold_start_within_budget():
+    pytest.importorskip("streamlit")
+    ok, report = check_startup("main.py")
+    assert ok, report
+    for name in STARTUP_BUDGET_MS:
+        assert f"{name:<18}" in report
+    assert "OVER BUDGET" not in report